@@ -0,0 +1,464 @@
+"""
+일괄 평가 모듈
+
+보관 중인 기사 수천 건을 다시 평가할 때는 /evaluate를 건별로 호출하는 대신
+Anthropic Message Batches API로 한 번에 제출합니다.
+(결과가 나오기까지 시간이 걸리지만 요청별 속도 제한을 받지 않고 비용도 낮습니다)
+
+- 작업(job): 한 번에 제출한 기사 묶음. 배치 ID, 상태, 기사별 결과를 로컬 SQLite
+  작업 저장소에 기록하므로 서버를 재시작해도 진행 중인 배치를 이어서 추적합니다.
+- 제출: 평가 캐시에 결과가 있는 기사는 배치에 넣지 않고 바로 완료 처리하며,
+  같은 기사가 여러 번 들어 있으면 한 번만 제출합니다. (custom_id = 평가 캐시 키)
+  토큰 예산을 넘는 기사는 /evaluate와 같은 예산으로 중간을 생략하여 제출합니다.
+  (배치 요청 하나가 기사 하나에 대응하도록 chunk 방식 대신 항상 trim 방식을 사용하며,
+  캐시 키도 trim 방식의 /evaluate 결과와 같습니다.)
+- 폴링: 백그라운드 작업이 주기적으로 배치 상태를 조회하고, 끝난 배치의 결과를 내려받아
+  검증(필요하면 보정 요청)한 뒤 작업 저장소와 평가 캐시에 저장합니다.
+
+Batches API는 client.messages.batches의 create/retrieve/results만 사용하므로,
+ANTHROPIC_BASE_URL로 로컬 대역 서버를 지정하거나 같은 메서드를 가진 객체를
+client로 넘기면 실제 API 없이 시험할 수 있습니다.
+
+환경 변수:
+- EVALUATION_BATCH_DB: 작업 저장소 SQLite 파일 경로 (기본값 evaluation_batches.db)
+- EVALUATION_BATCH_POLL_INTERVAL: 배치 상태 조회 주기 (초, 기본값 60)
+- EVALUATION_BATCH_MAX_ITEMS: 작업당 최대 기사 수 (기본값 10000)
+- EVALUATION_BATCH_CONCURRENCY: 제출/결과 저장 시 동시에 처리하는 기사 수 (토큰 계산, 보정 요청, 기본값 16)
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+
+import anthropic
+
+from cache import SingleFlight
+from evaluator import (
+    EVALUATION_MODEL,
+    EVALUATION_TOOL,
+    build_plan_request,
+    complete_evaluation,
+    evaluation_cache,
+    extract_tool_input,
+    planned_cache_key
+)
+from token_budget import plan_input
+
+logger = logging.getLogger(__name__)
+
+# 상수
+EVALUATION_BATCH_DB = os.getenv("EVALUATION_BATCH_DB", "evaluation_batches.db")
+EVALUATION_BATCH_POLL_INTERVAL = float(os.getenv("EVALUATION_BATCH_POLL_INTERVAL", "60"))  # 초
+EVALUATION_BATCH_MAX_ITEMS = int(os.getenv("EVALUATION_BATCH_MAX_ITEMS", "10000"))
+EVALUATION_BATCH_CONCURRENCY = int(os.getenv("EVALUATION_BATCH_CONCURRENCY", "16"))
+
+# 일괄 평가의 긴 기사 처리 방식 (배치 요청 하나 = 기사 하나)
+BATCH_LONG_ARTICLE_MODE = "trim"
+
+# 작업 상태 - 배치 처리 중에는 Batches API의 processing_status(in_progress, canceling)를
+# 그대로 기록하고, 결과를 모두 저장하면 ended가 됩니다.
+JOB_ENDED = "ended"
+
+# 기사별 상태
+ITEM_PENDING = "pending"
+ITEM_OK = "ok"
+ITEM_ERROR = "error"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    batch_id TEXT,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    job_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    cache_key TEXT NOT NULL,
+    title TEXT,
+    body TEXT,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    PRIMARY KEY (job_id, idx)
+);
+CREATE INDEX IF NOT EXISTS items_by_key ON items (job_id, cache_key);
+"""
+
+
+def _now() -> str:
+    """현재 시각 (UTC, ISO 8601)"""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class BatchJobStore:
+    """
+    일괄 평가 작업 저장소 (SQLite)
+
+    파일은 처음 사용할 때 생성하며, 모든 메서드는 스레드 안전합니다.
+    메서드는 디스크 동기화를 기다리며 블로킹하므로, 비동기 코드에서는 이벤트 루프를 막지 않도록
+    asyncio.to_thread로 호출합니다.
+    완료된 기사의 본문은 지워 저장소 크기를 줄입니다.
+
+    Attributes:
+        path: SQLite 파일 경로 (":memory:"이면 메모리에만 저장)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def create_job(self, job_id: str, batch_id: Optional[str], status: str, items: Sequence[Dict[str, Any]]) -> None:
+        """
+        작업과 기사 목록을 저장합니다.
+
+        Args:
+            job_id: 작업 ID
+            batch_id: Batches API 배치 ID (제출할 기사가 없으면 None)
+            status: 작업 상태
+            items: cache_key, title, body, status, result(딕셔너리 또는 None)를 가진 기사 목록
+        """
+        now = _now()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT INTO jobs (job_id, batch_id, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (job_id, batch_id, status, now, now)
+                )
+                conn.executemany(
+                    "INSERT INTO items (job_id, idx, cache_key, title, body, status, result) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            job_id, index, item["cache_key"], item["title"],
+                            item["body"] if item["status"] == ITEM_PENDING else None,
+                            item["status"],
+                            json.dumps(item["result"], ensure_ascii=False) if item["result"] is not None else None
+                        )
+                        for index, item in enumerate(items)
+                    ]
+                )
+
+    def update_status(self, job_id: str, status: str) -> None:
+        """작업 상태를 갱신합니다."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, updated_at = ? WHERE job_id = ?",
+                    (status, _now(), job_id)
+                )
+
+    def pending_items(self, job_id: str) -> Dict[str, Tuple[Optional[str], str]]:
+        """
+        결과를 기다리는 기사를 반환합니다.
+
+        Returns:
+            평가 캐시 키 → (제목, 본문) 딕셔너리 (같은 기사는 하나만)
+        """
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT cache_key, title, body FROM items WHERE job_id = ? AND status = ?",
+                (job_id, ITEM_PENDING)
+            ).fetchall()
+        return {row["cache_key"]: (row["title"], row["body"]) for row in rows}
+
+    def save_results(
+        self,
+        job_id: str,
+        results: Sequence[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]
+    ) -> None:
+        """
+        기사별 결과를 한 트랜잭션으로 저장합니다. (같은 캐시 키의 기사에 모두 적용)
+
+        Args:
+            job_id: 작업 ID
+            results: (평가 캐시 키, 평가 결과, 에러 메시지) 목록 - 성공이면 에러가 None
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "UPDATE items SET status = ?, result = ?, error = ?, body = NULL "
+                    "WHERE job_id = ? AND cache_key = ? AND status = ?",
+                    [
+                        (
+                            ITEM_OK if error is None else ITEM_ERROR,
+                            json.dumps(result, ensure_ascii=False) if result is not None else None,
+                            error, job_id, cache_key, ITEM_PENDING
+                        )
+                        for cache_key, result, error in results
+                    ]
+                )
+
+    def get_job(self, job_id: str, include_results: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        작업 상태를 반환합니다.
+
+        Args:
+            job_id: 작업 ID
+            include_results: True이면 기사별 결과 목록(results)을 포함
+
+        Returns:
+            작업 정보 딕셔너리 (없는 작업이면 None)
+        """
+        with self._lock:
+            conn = self._connection()
+            job = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if job is None:
+                return None
+            counts = dict(conn.execute(
+                "SELECT status, COUNT(*) FROM items WHERE job_id = ? GROUP BY status", (job_id,)
+            ).fetchall())
+            rows = conn.execute(
+                "SELECT idx, status, result, error FROM items WHERE job_id = ? ORDER BY idx", (job_id,)
+            ).fetchall() if include_results else None
+
+        info: Dict[str, Any] = {
+            **dict(job),
+            "total": sum(counts.values()),
+            "succeeded": counts.get(ITEM_OK, 0),
+            "errored": counts.get(ITEM_ERROR, 0),
+            "pending": counts.get(ITEM_PENDING, 0),
+        }
+        if rows is not None:
+            info["results"] = [
+                {
+                    "index": row["idx"],
+                    "status": row["status"],
+                    "evaluation": json.loads(row["result"]) if row["result"] else None,
+                    "error": row["error"],
+                }
+                for row in rows
+            ]
+        return info
+
+    def list_jobs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """최근 작업 목록을 반환합니다 (결과 제외)."""
+        with self._lock:
+            job_ids = [
+                row["job_id"] for row in self._connection().execute(
+                    "SELECT job_id FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+                )
+            ]
+        return [job for job in map(self.get_job, job_ids) if job is not None]
+
+    def active_jobs(self) -> List[str]:
+        """결과를 아직 저장하지 않은 작업 ID 목록을 반환합니다."""
+        with self._lock:
+            return [
+                row["job_id"] for row in self._connection().execute(
+                    "SELECT job_id FROM jobs WHERE status != ? AND batch_id IS NOT NULL", (JOB_ENDED,)
+                )
+            ]
+
+    def close(self) -> None:
+        """SQLite 연결을 닫습니다."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# 공유 작업 저장소
+job_store = BatchJobStore(EVALUATION_BATCH_DB)
+
+# 진행 중인 배치 조회 (작업 ID → 조회/결과 저장 작업)
+batch_flight = SingleFlight("evaluation_batch")
+
+
+async def submit_job(
+    client: anthropic.AsyncAnthropic,
+    articles: Sequence[Tuple[str, Optional[str]]],
+    use_cache: bool = True,
+    store: BatchJobStore = job_store
+) -> Dict[str, Any]:
+    """
+    기사 목록을 Message Batches API로 제출하고 작업을 저장합니다.
+
+    기사별 입력 계획(토큰 계산)은 EVALUATION_BATCH_CONCURRENCY개씩 동시에 세웁니다.
+
+    Args:
+        client: Anthropic 클라이언트
+        articles: (본문, 제목) 목록
+        use_cache: False이면 평가 캐시에 결과가 있어도 다시 평가
+        store: 작업 저장소
+
+    Returns:
+        작업 정보 딕셔너리 (get_job과 같은 형식)
+
+    Raises:
+        anthropic.APIError: 배치 제출 실패
+        ValueError: 기사 수가 EVALUATION_BATCH_MAX_ITEMS를 넘는 경우
+    """
+    if len(articles) > EVALUATION_BATCH_MAX_ITEMS:
+        raise ValueError(f"한 작업에 최대 {EVALUATION_BATCH_MAX_ITEMS}건까지 제출할 수 있습니다")
+
+    items: List[Dict[str, Any]] = []
+    # 제출할 기사 (같은 기사는 한 번만)
+    pending: Dict[str, Tuple[str, Optional[str]]] = {}
+    for body, title in articles:
+        cache_key = planned_cache_key(body, title, BATCH_LONG_ARTICLE_MODE)
+        cached = evaluation_cache.get(cache_key) if use_cache else None
+        items.append({
+            "cache_key": cache_key,
+            "title": title,
+            "body": body,
+            "status": ITEM_OK if cached is not None else ITEM_PENDING,
+            "result": cached,
+        })
+        if cached is None:
+            pending.setdefault(cache_key, (body, title))
+
+    semaphore = asyncio.Semaphore(EVALUATION_BATCH_CONCURRENCY)
+
+    async def build(cache_key: str, body: str, title: Optional[str]) -> Dict[str, Any]:
+        async with semaphore:
+            plan = await plan_input(client, EVALUATION_MODEL, body, title, BATCH_LONG_ARTICLE_MODE)
+        return {"custom_id": cache_key, "params": build_plan_request(plan, title)}
+
+    requests = await asyncio.gather(*(build(key, body, title) for key, (body, title) in pending.items()))
+
+    job_id = uuid.uuid4().hex
+    if requests:
+        batch = await client.messages.batches.create(requests=requests)
+        await asyncio.to_thread(store.create_job, job_id, batch.id, batch.processing_status, items)
+        logger.info(f"일괄 평가 제출: 작업 {job_id}, 배치 {batch.id}, {len(requests)}/{len(items)}건")
+    else:
+        await asyncio.to_thread(store.create_job, job_id, None, JOB_ENDED, items)
+        logger.info(f"일괄 평가 제출: 작업 {job_id}, 모든 기사 캐시 적중 ({len(items)}건)")
+    return await asyncio.to_thread(store.get_job, job_id)
+
+
+def _batch_error(result: Any) -> str:
+    """실패한 배치 결과의 에러 메시지를 만듭니다."""
+    if result.type == "errored":
+        error = getattr(getattr(result, "error", None), "error", None)
+        return f"Claude API 오류: {getattr(error, 'message', None) or result.type}"
+    # canceled, expired
+    return f"배치 처리되지 않음: {result.type}"
+
+
+async def _ingest_results(
+    client: anthropic.AsyncAnthropic,
+    job_id: str,
+    batch_id: str,
+    store: BatchJobStore
+) -> None:
+    """
+    끝난 배치의 결과를 내려받아 검증하고 작업 저장소와 평가 캐시에 저장합니다.
+
+    성공한 결과의 검증과 보정 요청은 EVALUATION_BATCH_CONCURRENCY개씩 동시에 처리합니다.
+    """
+    pending = await asyncio.to_thread(store.pending_items, job_id)
+    semaphore = asyncio.Semaphore(EVALUATION_BATCH_CONCURRENCY)
+
+    async def ingest(
+        custom_id: str,
+        title: Optional[str],
+        body: str,
+        result: Any
+    ) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+        if result.type != "succeeded":
+            return custom_id, None, _batch_error(result)
+        try:
+            async with semaphore:
+                # 제출할 때와 같은 계획으로 생략한 본문을 보정 요청에 사용
+                plan = await plan_input(client, EVALUATION_MODEL, body, title, BATCH_LONG_ARTICLE_MODE)
+                data = extract_tool_input(result.message, EVALUATION_TOOL["name"])
+                evaluation = await complete_evaluation(client, plan.parts[0], title, data)
+            evaluation["input_budget"] = plan.report()
+        except anthropic.APIError as e:
+            return custom_id, None, f"Claude API 오류: {e}"
+        except ValueError as e:
+            return custom_id, None, f"평가 실패: {e}"
+        evaluation_cache.set(custom_id, evaluation)
+        return custom_id, evaluation, None
+
+    tasks = []
+    async for entry in await client.messages.batches.results(batch_id):
+        article = pending.pop(entry.custom_id, None)
+        if article is None:
+            continue
+        title, body = article
+        tasks.append(ingest(entry.custom_id, title, body, entry.result))
+    results: List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]] = list(await asyncio.gather(*tasks))
+
+    # 결과 파일에 없는 기사
+    results.extend((cache_key, None, "배치 결과에 포함되지 않았습니다") for cache_key in pending)
+    await asyncio.to_thread(store.save_results, job_id, results)
+    succeeded = sum(1 for _, _, error in results if error is None)
+    logger.info(f"일괄 평가 결과 저장: 작업 {job_id}, {succeeded}/{len(results)}건 성공")
+
+
+async def poll_job(
+    client: anthropic.AsyncAnthropic,
+    job_id: str,
+    store: BatchJobStore = job_store
+) -> Optional[Dict[str, Any]]:
+    """
+    배치 상태를 조회하고, 배치가 끝났으면 결과를 저장합니다.
+
+    같은 작업에 대한 동시 조회(백그라운드 폴링과 수동 갱신)는 하나로 합칩니다.
+
+    Args:
+        client: Anthropic 클라이언트
+        job_id: 작업 ID
+        store: 작업 저장소
+
+    Returns:
+        갱신된 작업 정보 딕셔너리 (없는 작업이면 None)
+
+    Raises:
+        anthropic.APIError: 배치 조회 실패
+    """
+    job = await asyncio.to_thread(store.get_job, job_id)
+    if job is None or job["status"] == JOB_ENDED or not job["batch_id"]:
+        return job
+
+    async def run() -> Optional[Dict[str, Any]]:
+        batch = await client.messages.batches.retrieve(job["batch_id"])
+        if batch.processing_status == JOB_ENDED:
+            await _ingest_results(client, job_id, batch.id, store)
+        await asyncio.to_thread(store.update_status, job_id, batch.processing_status)
+        return await asyncio.to_thread(store.get_job, job_id)
+
+    return await batch_flight.do(job_id, run)
+
+
+async def run_poller(
+    client: anthropic.AsyncAnthropic,
+    store: BatchJobStore = job_store,
+    interval: float = EVALUATION_BATCH_POLL_INTERVAL
+) -> None:
+    """
+    진행 중인 작업을 주기적으로 조회하는 백그라운드 루프 (취소될 때까지 실행)
+
+    Args:
+        client: Anthropic 클라이언트
+        store: 작업 저장소
+        interval: 조회 주기 (초)
+    """
+    while True:
+        for job_id in await asyncio.to_thread(store.active_jobs):
+            try:
+                await poll_job(client, job_id, store)
+            except Exception as e:
+                logger.warning(f"일괄 평가 상태 조회 실패: 작업 {job_id}, {str(e)}")
+        await asyncio.sleep(interval)
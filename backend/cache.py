@@ -0,0 +1,185 @@
+"""
+인메모리 캐시 모듈
+
+프로세스 내에서 공유되는 크기 제한 LRU + TTL 캐시를 제공합니다.
+단축 URL 리다이렉트 결과 등 반복 요청에서 재사용할 수 있는 값을 저장합니다.
+동시에 들어온 같은 요청을 하나의 작업으로 합치는 SingleFlight도 함께 제공합니다.
+
+참고:
+- 멀티 워커 환경에서는 워커마다 별도의 캐시를 가집니다.
+- TTLCache의 모든 메서드는 스레드 안전합니다 (스레드로 넘긴 파싱 작업에서도 사용 가능).
+- SingleFlight는 하나의 이벤트 루프 안에서만 사용합니다.
+"""
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+import asyncio
+import threading
+import time
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    크기 제한 LRU + 만료 시간(TTL) 캐시
+
+    maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거하고,
+    만료된 항목은 조회 시점에 제거합니다.
+
+    Attributes:
+        name: 캐시 이름 (로그 및 통계 표시용)
+        maxsize: 최대 항목 수
+        ttl: 기본 만료 시간 (초)
+        hits: 캐시 적중 횟수
+        misses: 캐시 미스 횟수
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """
+        캐시된 값을 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값, 없거나 만료된 경우 None
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """
+        값을 저장합니다.
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 항목별 만료 시간 (초, 생략 시 기본 TTL)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """항목을 제거합니다. 없으면 무시합니다."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 항목과 통계를 초기화합니다."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            이름, 크기, 적중/미스 횟수, 적중률을 담은 딕셔너리
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class SingleFlight:
+    """
+    동일 키에 대한 동시 비동기 호출을 하나로 합치는 in-flight 테이블
+
+    첫 호출자가 작업을 시작하고, 작업이 끝나기 전에 들어온 같은 키의 호출자는
+    새 작업을 만들지 않고 같은 결과(또는 예외)를 공유합니다.
+    작업은 별도 Task로 실행되므로 첫 호출자가 취소되어도 나머지 호출자에게 영향이 없습니다.
+
+    Attributes:
+        name: 이름 (로그 및 통계 표시용)
+        leaders: 실제로 작업을 시작한 횟수
+        followers: 진행 중인 작업에 합류한 횟수
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.leaders = 0
+        self.followers = 0
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[V]]) -> V:
+        """
+        키에 대해 진행 중인 작업이 있으면 그 결과를, 없으면 func()를 실행한 결과를 반환합니다.
+
+        Args:
+            key: 작업 식별 키
+            func: 작업 코루틴을 만드는 함수 (인자 없음)
+
+        Returns:
+            작업 결과
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self.leaders += 1
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            self.followers += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        """완료된 작업을 테이블에서 제거합니다."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 모든 대기자가 취소된 경우에도 "Task exception was never retrieved" 경고가 없도록 소비
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        in-flight 통계를 반환합니다.
+
+        Returns:
+            이름, 진행 중인 작업 수, 시작/합류 횟수를 담은 딕셔너리
+        """
+        return {
+            "name": self.name,
+            "in_flight": len(self._inflight),
+            "leaders": self.leaders,
+            "followers": self.followers,
+        }
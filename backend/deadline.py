@@ -0,0 +1,124 @@
+"""
+요청 마감 시간 모듈
+
+스크래핑 요청 하나에 전체 시간 예산(SCRAPING_DEADLINE)을 두고, 리다이렉트 확인, 다운로드,
+파싱 단계가 남은 시간 안에서만 실행되도록 합니다.
+
+마감 시각은 contextvars로 전달되므로 함수 인자로 넘기지 않아도 같은 요청에서 만든
+하위 작업(single-flight 작업, 헤지 요청 등)까지 이어집니다. fetcher는 남은 시간으로
+연결/읽기 타임아웃을 줄이고, run_with_deadline은 마감 시각이 지나면 작업을 취소하여
+응답 시간의 상한을 보장합니다.
+
+환경 변수:
+- SCRAPING_DEADLINE: 스크래핑 요청 하나의 전체 시간 예산 (초, 기본값 15)
+"""
+
+from contextvars import ContextVar
+from typing import Awaitable, Optional, TypeVar
+import asyncio
+import os
+import time
+
+V = TypeVar("V")
+
+# 상수
+SCRAPING_DEADLINE = float(os.getenv("SCRAPING_DEADLINE", "15"))  # 초
+
+# 현재 요청의 마감 시각 (time.monotonic 기준, 없으면 None)
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+# 이벤트 루프는 타이머를 시계 해상도만큼 일찍 실행할 수 있으므로 마감 판정에 여유를 둠
+_CLOCK_SLACK = 0.01  # 초
+
+
+class DeadlineExceeded(TimeoutError):
+    """
+    요청의 전체 시간 예산을 다 쓴 경우
+
+    Attributes:
+        site_timeout: 상대 사이트가 남은 시간 안에 응답하지 않아 발생했으면 True
+            (요청을 보내기 전에 이미 시간이 없었던 경우는 False)
+    """
+
+    def __init__(self, message: str, site_timeout: bool = False):
+        super().__init__(message)
+        self.site_timeout = site_timeout
+
+
+def remaining() -> Optional[float]:
+    """
+    현재 요청의 남은 시간을 반환합니다.
+
+    Returns:
+        남은 시간 (초, 음수면 이미 지남), 마감 시각이 없으면 None
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def expired() -> bool:
+    """
+    현재 요청의 마감 시각이 지났는지 확인합니다.
+
+    작업이 취소(CancelledError)되었을 때 run_with_deadline의 마감 때문인지,
+    클라이언트 연결 종료 등 바깥에서 취소한 것인지 구분하는 데 사용합니다.
+
+    Returns:
+        마감 시각이 있고 지났으면 True
+    """
+    left = remaining()
+    return left is not None and left <= _CLOCK_SLACK
+
+
+def clamp(timeout: float) -> float:
+    """
+    타임아웃을 남은 시간 이하로 줄입니다.
+
+    Args:
+        timeout: 단계별 타임아웃 (초)
+
+    Returns:
+        min(timeout, 남은 시간)
+
+    Raises:
+        DeadlineExceeded: 남은 시간이 없는 경우
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded("요청 시간 예산을 모두 사용했습니다")
+    return min(timeout, left)
+
+
+async def run_with_deadline(aw: Awaitable[V], seconds: float = SCRAPING_DEADLINE) -> V:
+    """
+    마감 시각을 설정하고 작업을 실행합니다. 이미 더 이른 마감 시각이 있으면 그것을 따릅니다.
+
+    Args:
+        aw: 실행할 코루틴
+        seconds: 시간 예산 (초)
+
+    Returns:
+        작업 결과
+
+    Raises:
+        DeadlineExceeded: 시간 예산 안에 끝나지 않은 경우 (작업은 취소됨)
+    """
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        # wait_for가 만드는 작업은 마감 시각이 설정된 컨텍스트를 복사하여 실행됨
+        return await asyncio.wait_for(aw, max(0.0, deadline - time.monotonic()))
+    except asyncio.TimeoutError as e:
+        if isinstance(e, DeadlineExceeded):
+            raise
+        raise DeadlineExceeded(f"요청 시간 예산({seconds:g}초)을 초과했습니다") from e
+    finally:
+        _deadline.reset(token)
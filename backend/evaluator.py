@@ -0,0 +1,1145 @@
+"""
+기사 평가 모듈
+
+Claude API를 사용하여 기사를 저널리즘 윤리 기준 8차원으로 평가합니다.
+같은 기사에 대한 반복 평가는 캐시된 결과를 반환하고,
+동시에 들어온 같은 평가 요청은 하나의 Claude API 호출로 합칩니다.
+stream_evaluation은 Claude 스트리밍 API로 생성 중인 요약, 점수, 피드백을
+조각 단위로 내보내 첫 내용을 보여주기까지의 시간을 줄입니다.
+
+토큰 예산을 넘는 긴 기사는 token_budget 모듈의 계획에 따라 중간을 생략하거나
+여러 부분으로 나눠 동시에 평가한 뒤 합칩니다.
+
+Claude API는 비동기 클라이언트(anthropic.AsyncAnthropic)로 호출하므로 수 초 걸리는
+평가 중에도 이벤트 루프가 막히지 않고, 모든 평가가 하나의 커넥션 풀을 공유합니다.
+
+환경 변수:
+- EVALUATION_MODEL: 평가에 사용할 Claude 모델
+- EVALUATION_CACHE_TTL: 평가 결과 캐시 유지 시간 (초, 기본값 86400)
+- EVALUATION_CACHE_SIZE: 평가 결과 캐시 최대 항목 수 (기본값 1000)
+- ANTHROPIC_TIMEOUT: Claude API 응답 대기 시간 (초, 기본값 120)
+- ANTHROPIC_CONNECT_TIMEOUT: Claude API 연결 대기 시간 (초, 기본값 5)
+- ANTHROPIC_MAX_RETRIES: Claude API 재시도 횟수 (기본값 2)
+- ANTHROPIC_MAX_CONNECTIONS: Claude API 최대 동시 연결 수 (기본값 100)
+- ANTHROPIC_MAX_KEEPALIVE: Claude API keep-alive 연결 수 (기본값 20)
+"""
+
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import time
+
+import anthropic
+
+import metrics
+from cache import SingleFlight, TTLCache
+from token_budget import (
+    EVALUATION_MAX_ARTICLE_TOKENS,
+    EVALUATION_MAX_CHUNKS,
+    InputPlan,
+    is_over_budget,
+    plan_input,
+    resolve_mode
+)
+
+logger = logging.getLogger(__name__)
+
+# 상수
+EVALUATION_MODEL = os.getenv("EVALUATION_MODEL", "claude-sonnet-4-20250514")
+EVALUATION_MAX_TOKENS = 2048
+
+# Claude API 클라이언트 설정
+ANTHROPIC_TIMEOUT = float(os.getenv("ANTHROPIC_TIMEOUT", "120"))  # 초
+ANTHROPIC_CONNECT_TIMEOUT = float(os.getenv("ANTHROPIC_CONNECT_TIMEOUT", "5"))  # 초
+ANTHROPIC_MAX_RETRIES = int(os.getenv("ANTHROPIC_MAX_RETRIES", "2"))
+ANTHROPIC_MAX_CONNECTIONS = int(os.getenv("ANTHROPIC_MAX_CONNECTIONS", "100"))
+ANTHROPIC_MAX_KEEPALIVE = int(os.getenv("ANTHROPIC_MAX_KEEPALIVE", "20"))
+
+# 프롬프트 버전 - 프롬프트나 응답 형식을 바꾸면 올려서 이전 캐시 결과를 무효화합니다.
+PROMPT_VERSION = "2025-11-v3"
+
+# 평가 결과 캐시 (콘텐츠 해시 → 평가 결과)
+EVALUATION_CACHE_TTL = float(os.getenv("EVALUATION_CACHE_TTL", "86400"))  # 초
+EVALUATION_CACHE_SIZE = int(os.getenv("EVALUATION_CACHE_SIZE", "1000"))
+evaluation_cache: TTLCache[Dict[str, Any]] = TTLCache(
+    "evaluation", EVALUATION_CACHE_SIZE, EVALUATION_CACHE_TTL
+)
+
+# 진행 중인 평가 요청 (콘텐츠 해시 → Claude API 호출)
+evaluation_flight = SingleFlight("evaluation")
+
+
+def create_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """
+    커넥션 풀과 타임아웃이 설정된 비동기 Anthropic 클라이언트를 생성합니다.
+
+    서버 전체에서 하나만 만들어 공유하고, 종료 시 close()로 연결을 정리합니다.
+
+    Args:
+        api_key: Anthropic API 키
+
+    Returns:
+        anthropic.AsyncAnthropic 클라이언트
+    """
+    timeout = anthropic.Timeout(ANTHROPIC_TIMEOUT, connect=ANTHROPIC_CONNECT_TIMEOUT)
+    # SDK가 사용하는 httpx 패키지의 Limits 타입으로 생성
+    limits = type(anthropic.DEFAULT_CONNECTION_LIMITS)(
+        max_connections=ANTHROPIC_MAX_CONNECTIONS,
+        max_keepalive_connections=ANTHROPIC_MAX_KEEPALIVE
+    )
+    client = anthropic.AsyncAnthropic(
+        api_key=api_key,
+        timeout=timeout,
+        max_retries=ANTHROPIC_MAX_RETRIES,
+        http_client=anthropic.DefaultAsyncHttpxClient(timeout=timeout, limits=limits)
+    )
+    logger.info(
+        f"Anthropic 클라이언트 생성: timeout={ANTHROPIC_TIMEOUT}s, "
+        f"max_connections={ANTHROPIC_MAX_CONNECTIONS}"
+    )
+    return client
+
+
+# 평가 기준과 응답 형식 (모든 요청에서 동일한 정적 시스템 프롬프트)
+EVALUATION_SYSTEM_PROMPT = """당신은 저널리즘 윤리 전문가입니다. 사용자가 보낸 기사를 8가지 차원으로 평가해주세요.
+
+**평가 기준:**
+1. 진실성 (Truth): 사실과 의견 구분, 출처 명시
+2. 정확성 (Accuracy): 통계 정확성, 인용 정확성
+3. 공정성 (Fairness): 다양한 관점, 균형 잡힌 보도
+4. 투명성 (Transparency): 출처 공개, 이해관계 명시
+5. 맥락 (Context): 배경 정보, 역사적 맥락
+6. 인권 존중 (Human Rights): 취약 집단 보호, 차별 없는 표현
+7. 책임성 (Accountability): 오류 정정, 피해 구제
+8. 독립성 (Independence): 외부 압력으로부터 자유
+
+**요구사항:**
+1. 각 차원별로 1-10점으로 평가하세요 (10점이 가장 우수)
+2. 전체 평가 요약을 2-3문장으로 작성하세요
+3. 상세 피드백을 제공하세요 (개선이 필요한 부분 중심)
+
+평가 결과는 submit_evaluation 도구로 제출하세요."""
+
+# 정적 시스템 프롬프트 블록 - cache_control로 Anthropic 프롬프트 캐시에 올려
+# 이후 요청에서는 이 부분의 입력 토큰을 다시 처리하지 않습니다.
+# (모델별 최소 캐시 길이보다 짧으면 API가 캐시 지정을 무시하고 그대로 처리)
+EVALUATION_SYSTEM = [
+    {
+        "type": "text",
+        "text": EVALUATION_SYSTEM_PROMPT,
+        "cache_control": {"type": "ephemeral"}
+    }
+]
+
+
+# 8차원 점수 키 (응답 스키마와 결과 검증 기준, 순서 고정)
+SCORE_KEYS = ("진실성", "정확성", "공정성", "투명성", "맥락", "인권_존중", "책임성", "독립성")
+SCORE_MIN = 1
+SCORE_MAX = 10
+
+# 누락되었거나 잘못된 항목만 다시 받는 보정 요청의 최대 출력 토큰
+REPAIR_MAX_TOKENS = 512
+
+
+def _scores_schema(required: bool) -> Dict[str, Any]:
+    """8차원 점수 객체의 JSON 스키마를 만듭니다."""
+    return {
+        "type": "object",
+        "properties": {
+            key: {"type": "integer", "minimum": SCORE_MIN, "maximum": SCORE_MAX}
+            for key in SCORE_KEYS
+        },
+        "required": list(SCORE_KEYS) if required else [],
+        "additionalProperties": False
+    }
+
+
+# 평가 결과 제출 도구 - tool_choice로 호출을 강제하여 스키마에 맞는 JSON을 받습니다.
+# (속성 순서대로 생성되므로 스트리밍 시 요약 → 점수 → 피드백 순으로 도착)
+EVALUATION_TOOL = {
+    "name": "submit_evaluation",
+    "description": "기사의 저널리즘 윤리 8차원 평가 결과를 제출합니다.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "evaluation_summary": {"type": "string", "description": "전체 평가 요약 (2-3문장)"},
+            "scores": _scores_schema(required=True),
+            "detailed_feedback": {"type": "string", "description": "상세 피드백 (개선이 필요한 부분 중심)"}
+        },
+        "required": ["evaluation_summary", "scores", "detailed_feedback"]
+    }
+}
+
+# 보정 도구 - 이전 평가에서 누락되었거나 잘못된 항목만 제출받습니다.
+REPAIR_TOOL = {
+    "name": "submit_corrections",
+    "description": "이전 평가에서 누락되었거나 잘못된 항목만 다시 제출합니다.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "evaluation_summary": {"type": "string", "description": "전체 평가 요약 (2-3문장)"},
+            "scores": _scores_schema(required=False)
+        }
+    }
+}
+
+# 도구 정의는 프롬프트 캐시 접두부에 포함되므로 두 도구를 항상 같은 순서로 함께 보냅니다.
+EVALUATION_TOOLS = [EVALUATION_TOOL, REPAIR_TOOL]
+
+# 점수 키 별칭 (공백/밑줄 차이, 영문 이름) → SCORE_KEYS
+_SCORE_ALIASES: Dict[str, str] = {}
+for _key, _english in zip(SCORE_KEYS, (
+    "truth", "accuracy", "fairness", "transparency",
+    "context", "human_rights", "accountability", "independence"
+)):
+    for _alias in (_key, _english):
+        _SCORE_ALIASES[re.sub(r'[\s_\-]', '', _alias).lower()] = _key
+
+
+def build_evaluation_prompt(
+    article_body: str,
+    article_title: Optional[str] = None,
+    note: Optional[str] = None
+) -> str:
+    """
+    기사별로 달라지는 사용자 메시지를 구성합니다.
+
+    평가 기준과 응답 형식은 EVALUATION_SYSTEM에 있으므로 제목과 본문만 담습니다.
+
+    Args:
+        article_body: 기사 본문
+        article_title: 기사 제목 (선택사항)
+        note: 본문에 대한 참고 사항 (긴 기사를 생략하거나 나눈 경우)
+
+    Returns:
+        사용자 메시지 문자열
+    """
+    prompt = f"""**기사 제목:** {article_title if article_title else "제목 없음"}
+
+**기사 본문:**
+{article_body}"""
+    if note:
+        prompt += f"\n\n**참고:** {note}"
+    return prompt
+
+
+def build_request(
+    article_body: str,
+    article_title: Optional[str] = None,
+    tool_name: str = EVALUATION_TOOL["name"],
+    note: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Claude Messages API 요청 인자를 구성합니다. (create/stream 공용)
+
+    Args:
+        article_body: 기사 본문
+        article_title: 기사 제목 (선택사항)
+        tool_name: 호출을 강제할 도구 이름
+        note: 본문에 대한 참고 사항 (선택사항)
+
+    Returns:
+        messages.create/messages.stream에 넘길 키워드 인자 딕셔너리
+    """
+    return {
+        "model": EVALUATION_MODEL,
+        "max_tokens": EVALUATION_MAX_TOKENS,
+        "system": EVALUATION_SYSTEM,
+        "tools": EVALUATION_TOOLS,
+        "tool_choice": {"type": "tool", "name": tool_name},
+        "messages": [
+            {
+                "role": "user",
+                "content": build_evaluation_prompt(article_body, article_title, note)
+            }
+        ]
+    }
+
+
+# Claude API 토큰 사용량 누적 (프롬프트 캐시 효과 확인용)
+_usage_totals: Dict[str, int] = {
+    "requests": 0,
+    "input_tokens": 0,
+    "output_tokens": 0,
+    "cache_read_input_tokens": 0,
+    "cache_creation_input_tokens": 0,
+}
+
+
+def log_usage(usage: Any) -> None:
+    """Claude API 토큰 사용량과 프롬프트 캐시 적중 여부를 기록합니다."""
+    if usage is None:
+        return
+    counts = {key: getattr(usage, key, None) or 0 for key in _usage_totals if key != "requests"}
+    _usage_totals["requests"] += 1
+    for key, value in counts.items():
+        _usage_totals[key] += value
+    logger.info(
+        f"Claude API 토큰 사용량 (프롬프트 {PROMPT_VERSION}): "
+        f"input={counts['input_tokens']}, output={counts['output_tokens']}, "
+        f"cache_read={counts['cache_read_input_tokens']}, "
+        f"cache_write={counts['cache_creation_input_tokens']}"
+    )
+
+
+def usage_stats() -> Dict[str, Any]:
+    """
+    프롬프트 버전과 누적 토큰 사용량을 반환합니다.
+
+    Returns:
+        프롬프트 버전, 모델, 요청 수, 토큰 수, 프롬프트 캐시에서 읽은 입력 토큰 비율을 담은 딕셔너리
+    """
+    cached = _usage_totals["cache_read_input_tokens"]
+    total_input = _usage_totals["input_tokens"] + cached + _usage_totals["cache_creation_input_tokens"]
+    return {
+        "prompt_version": PROMPT_VERSION,
+        "model": EVALUATION_MODEL,
+        **_usage_totals,
+        "cache_read_rate": round(cached / total_input, 4) if total_input else 0.0,
+    }
+
+
+def parse_evaluation_response(response_text: str) -> Dict[str, Any]:
+    """
+    Claude 응답 텍스트를 JSON 객체로 파싱합니다.
+
+    도구 입력(JSON)과, 도구를 호출하지 않고 텍스트로 응답한 경우 모두 사용합니다.
+    텍스트 앞뒤에 다른 내용(코드 블록 표시 등)이 있으면 첫 번째 JSON 객체만 읽습니다.
+
+    Args:
+        response_text: Claude 응답 텍스트
+
+    Returns:
+        파싱된 딕셔너리 (스키마 검증 전)
+
+    Raises:
+        ValueError: 응답을 JSON으로 파싱할 수 없는 경우
+    """
+    try:
+        return json.loads(response_text)
+    except json.JSONDecodeError:
+        # JSON이 아닌 경우, 첫 번째 '{'부터 한 객체만 읽기
+        start = response_text.find("{")
+        if start >= 0:
+            try:
+                value, _ = json.JSONDecoder(strict=False).raw_decode(response_text, start)
+                return value
+            except json.JSONDecodeError:
+                pass
+        raise ValueError("Claude API 응답을 JSON으로 파싱할 수 없습니다")
+
+
+def _coerce_score(value: Any) -> Optional[int]:
+    """점수 값을 1-10 정수로 변환합니다 (변환할 수 없거나 범위를 벗어나면 None)."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        # "8", "8점", "8/10" 등
+        match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*점?\s*(?:/\s*10)?\s*', value)
+        if not match:
+            return None
+        value = float(match.group(1))
+    if not isinstance(value, (int, float)) or not math.isfinite(value):
+        return None
+    score = int(value + 0.5)
+    return score if SCORE_MIN <= score <= SCORE_MAX else None
+
+
+def normalize_scores(raw_scores: Any) -> Dict[str, int]:
+    """
+    점수 딕셔너리의 키를 SCORE_KEYS로 맞추고 값을 1-10 정수로 변환합니다.
+
+    같은 차원이 여러 번 있으면 처음 나온 유효한 값을 사용하며,
+    알 수 없는 키와 변환할 수 없는 값은 버립니다.
+
+    Args:
+        raw_scores: 파싱된 scores 값 (딕셔너리가 아니면 빈 결과)
+
+    Returns:
+        SCORE_KEYS 키 → 점수 딕셔너리 (유효한 항목만)
+    """
+    scores: Dict[str, int] = {}
+    for name, value in (raw_scores.items() if isinstance(raw_scores, dict) else ()):
+        key = _SCORE_ALIASES.get(re.sub(r'[\s_\-]', '', str(name)).lower())
+        score = _coerce_score(value)
+        if key is not None and score is not None and key not in scores:
+            scores[key] = score
+    return scores
+
+
+def normalize_evaluation(data: Any) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    평가 결과를 스키마에 맞게 정리하고 누락되었거나 잘못된 항목을 찾습니다.
+
+    - 점수 키의 공백/밑줄 차이와 영문 이름을 SCORE_KEYS로 맞춥니다.
+    - "8", "8점", 8.0 같은 점수는 정수로 변환하고, 1-10 범위를 벗어나면 잘못된 항목으로 봅니다.
+    - 알 수 없는 키는 버립니다.
+
+    Args:
+        data: 파싱된 평가 결과
+
+    Returns:
+        (정리된 평가 결과, 누락되었거나 잘못된 항목 이름 목록) 튜플
+        항목 이름은 "evaluation_summary" 또는 SCORE_KEYS의 점수 키입니다.
+
+    Raises:
+        ValueError: 평가 결과가 JSON 객체가 아닌 경우
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Claude API 응답이 JSON 객체가 아닙니다")
+
+    problems: List[str] = []
+    summary = data.get("evaluation_summary")
+    summary = summary.strip() if isinstance(summary, str) else ""
+    if not summary:
+        problems.append("evaluation_summary")
+
+    scores = normalize_scores(data.get("scores"))
+    problems.extend(key for key in SCORE_KEYS if key not in scores)
+
+    feedback = data.get("detailed_feedback")
+    result = {
+        "evaluation_summary": summary,
+        "scores": {key: scores[key] for key in SCORE_KEYS if key in scores},
+        "detailed_feedback": feedback.strip() if isinstance(feedback, str) and feedback.strip() else None
+    }
+    return result, problems
+
+
+def extract_tool_input(message: Any, tool_name: str) -> Any:
+    """Claude 응답에서 도구 입력을 꺼냅니다 (도구 대신 텍스트로 응답했으면 텍스트를 파싱)."""
+    for block in message.content:
+        if block.type == "tool_use" and block.name == tool_name:
+            return block.input
+    text = "".join(block.text for block in message.content if block.type == "text")
+    return parse_evaluation_response(text)
+
+
+async def repair_evaluation(
+    client: anthropic.AsyncAnthropic,
+    article_body: str,
+    article_title: Optional[str],
+    result: Dict[str, Any],
+    problems: List[str]
+) -> Dict[str, Any]:
+    """
+    누락되었거나 잘못된 항목만 짧은 보정 요청으로 다시 받아 평가 결과를 완성합니다.
+
+    전체 평가를 다시 생성하지 않고 보정 도구(submit_corrections)로 해당 항목만 받으므로
+    출력 토큰이 적고, 시스템 프롬프트와 도구 정의는 프롬프트 캐시를 그대로 사용합니다.
+
+    Args:
+        client: Anthropic 클라이언트
+        article_body: 기사 본문
+        article_title: 기사 제목 (선택사항)
+        result: normalize_evaluation이 정리한 평가 결과
+        problems: 누락되었거나 잘못된 항목 이름 목록
+
+    Returns:
+        보정된 평가 결과 딕셔너리
+
+    Raises:
+        anthropic.APIError: Claude API 오류
+        ValueError: 보정 후에도 누락되었거나 잘못된 항목이 남은 경우
+    """
+    logger.warning(f"평가 결과 보정 요청: {', '.join(problems)}")
+    request = build_request(article_body, article_title, tool_name=REPAIR_TOOL["name"])
+    request["max_tokens"] = REPAIR_MAX_TOKENS
+    request["messages"][0]["content"] += (
+        "\n\n이 기사에 대한 이전 평가에서 다음 항목이 누락되었거나 "
+        f"{SCORE_MIN}-{SCORE_MAX} 범위의 정수가 아니었습니다: {', '.join(problems)}\n"
+        f"{REPAIR_TOOL['name']} 도구로 이 항목만 제출하세요."
+    )
+    with metrics.LLM_REQUEST_SECONDS.time(call="repair"):
+        message = await client.messages.create(**request)
+    log_usage(getattr(message, "usage", None))
+
+    corrections, _ = normalize_evaluation(extract_tool_input(message, REPAIR_TOOL["name"]))
+    merged = {
+        **result,
+        "scores": {**corrections["scores"], **result["scores"]},
+        "evaluation_summary": result["evaluation_summary"] or corrections["evaluation_summary"]
+    }
+    repaired, remaining = normalize_evaluation(merged)
+    if remaining:
+        raise ValueError(f"평가 결과에 누락되었거나 잘못된 항목이 있습니다: {', '.join(remaining)}")
+    return repaired
+
+
+async def complete_evaluation(
+    client: anthropic.AsyncAnthropic,
+    article_body: str,
+    article_title: Optional[str],
+    data: Any
+) -> Dict[str, Any]:
+    """
+    파싱된 평가 결과를 검증하고, 필요하면 보정 요청으로 완성합니다.
+
+    Args:
+        client: Anthropic 클라이언트
+        article_body: 기사 본문
+        article_title: 기사 제목 (선택사항)
+        data: 파싱된 평가 결과 (도구 입력)
+
+    Returns:
+        8개 점수가 모두 1-10 정수인 평가 결과 딕셔너리
+
+    Raises:
+        anthropic.APIError: Claude API 오류
+        ValueError: 평가 결과를 완성할 수 없는 경우
+    """
+    result, problems = normalize_evaluation(data)
+    if problems:
+        result = await repair_evaluation(client, article_body, article_title, result, problems)
+    return result
+
+
+# 부분 JSON 파싱용 패턴 (끝난 문자열, 숫자/리터럴)
+_JSON_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_JSON_LITERAL = re.compile(r'-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null')
+# 숫자 뒤에 이어질 수 있는 끝부분 (소수점, 지수)
+_JSON_LITERAL_TAIL = re.compile(r'[0-9.eE+\-]*')
+
+
+class _Incomplete(Exception):
+    """부분 JSON에서 값이 아직 끝나지 않음"""
+
+
+class _PartialJSONParser:
+    """
+    생성 중인(끝이 잘린) JSON 텍스트를 읽을 수 있는 만큼 해석하는 파서
+
+    - 끝나지 않은 문자열은 지금까지의 내용으로 해석합니다. 단, 최상위 객체의 값이 아닌 중첩된 문자열
+      (예: scores 안의 "8점")은 값이 바뀔 수 있으므로 ("1" → "10점") 버립니다.
+    - 끝나지 않은 숫자, true/false/null은 값이 바뀔 수 있으므로 ("1" → "10") 버립니다.
+    - 끝나지 않은 객체/배열은 지금까지 완성된 항목만 담아 반환합니다.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+        self.depth = 0  # 현재 읽고 있는 객체/배열의 중첩 깊이
+
+    def _skip_whitespace(self) -> None:
+        while self.pos < len(self.text) and self.text[self.pos] in " \t\r\n":
+            self.pos += 1
+
+    def _peek(self) -> str:
+        self._skip_whitespace()
+        if self.pos >= len(self.text):
+            raise _Incomplete
+        return self.text[self.pos]
+
+    def parse_value(self) -> Tuple[Any, bool]:
+        """값과 완결 여부를 반환합니다."""
+        char = self._peek()
+        if char == "{":
+            return self._parse_object()
+        if char == "[":
+            return self._parse_array()
+        if char == '"':
+            value, complete = self._parse_string()
+            if not complete and self.depth > 1:
+                raise _Incomplete
+            return value, complete
+        return self._parse_literal(), True
+
+    def _parse_string(self) -> Tuple[str, bool]:
+        start = self.pos
+        match = _JSON_STRING.match(self.text, start)
+        if match:
+            self.pos = match.end()
+            return json.loads(match.group(), strict=False), True
+        # 끝나지 않은 문자열: 잘린 이스케이프 시퀀스를 제외하고 해석
+        partial = self.text[start:]
+        partial = re.sub(r'\\(?:u[0-9a-fA-F]{0,3})?$', '', partial)
+        if len(re.search(r'\\*$', partial).group()) % 2:
+            partial = partial[:-1]
+        self.pos = len(self.text)
+        return json.loads(partial + '"', strict=False), False
+
+    def _parse_literal(self) -> Any:
+        match = _JSON_LITERAL.match(self.text, self.pos)
+        if not match or _JSON_LITERAL_TAIL.fullmatch(self.text, match.end()):
+            # 숫자/리터럴 뒤에 구분자가 와야 값이 끝난 것으로 봅니다. ("12." → "12.5")
+            raise _Incomplete
+        self.pos = match.end()
+        return json.loads(match.group())
+
+    def _parse_object(self) -> Tuple[Dict[str, Any], bool]:
+        result: Dict[str, Any] = {}
+        self.pos += 1
+        self.depth += 1
+        try:
+            if self._peek() == "}":
+                self.pos += 1
+                return result, True
+            while True:
+                if self._peek() != '"':
+                    raise ValueError("JSON 객체 키가 문자열이 아닙니다")
+                key, complete = self._parse_string()
+                if not complete or self._peek() != ":":
+                    return result, False
+                self.pos += 1
+                value, complete = self.parse_value()
+                result[key] = value
+                if not complete:
+                    return result, False
+                char = self._peek()
+                self.pos += 1
+                if char == "}":
+                    return result, True
+                if char != ",":
+                    raise ValueError("JSON 객체 구분자가 올바르지 않습니다")
+        except _Incomplete:
+            return result, False
+        finally:
+            self.depth -= 1
+
+    def _parse_array(self) -> Tuple[list, bool]:
+        result: list = []
+        self.pos += 1
+        self.depth += 1
+        try:
+            if self._peek() == "]":
+                self.pos += 1
+                return result, True
+            while True:
+                value, complete = self.parse_value()
+                result.append(value)
+                if not complete:
+                    return result, False
+                char = self._peek()
+                self.pos += 1
+                if char == "]":
+                    return result, True
+                if char != ",":
+                    raise ValueError("JSON 배열 구분자가 올바르지 않습니다")
+        except _Incomplete:
+            return result, False
+        finally:
+            self.depth -= 1
+
+
+def parse_partial_evaluation(response_text: str) -> Dict[str, Any]:
+    """
+    생성 중인 Claude 응답 텍스트에서 지금까지 확정된 평가 내용을 추출합니다.
+
+    Args:
+        response_text: 지금까지 받은 응답 텍스트
+
+    Returns:
+        evaluation_summary, scores, detailed_feedback 중 지금까지 나온 항목의 딕셔너리
+        (문자열은 생성 중인 내용일 수 있고, 점수는 값이 확정된 항목만 포함)
+    """
+    start = response_text.find("{")
+    if start < 0:
+        return {}
+    parser = _PartialJSONParser(response_text)
+    parser.pos = start
+    try:
+        value, _ = parser.parse_value()
+    except (_Incomplete, ValueError):
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+# 끝나지 않은 문자열 본문 (닫는 따옴표 또는 잘린 이스케이프 직전까지)
+_JSON_STRING_BODY = re.compile(r'(?:[^"\\]|\\.)*', re.DOTALL)
+# 끝에 있는 잘린 \uXXXX 이스케이프, 또는 짝(하위 서로게이트)이 아직 오지 않은 상위 서로게이트 이스케이프
+_JSON_INCOMPLETE_UNICODE = re.compile(r'\\u(?:[0-9a-fA-F]{0,3}|[dD][89abAB][0-9a-fA-F]{2})$')
+_JSON_WHITESPACE = re.compile(r'[ \t\r\n]*')
+
+
+class PartialEvaluationParser:
+    """
+    생성 중인 Claude 응답을 조각 단위로 받아 최상위 JSON 객체를 점진적으로 해석하는 파서
+
+    끝난 최상위 항목은 다시 해석하지 않고, 생성 중인 문자열 값(요약, 피드백)은
+    새로 받은 부분만 해석하여 이어 붙이므로 조각마다 드는 시간이 응답 전체 길이와 무관합니다.
+    문자열이 아닌 값(scores 객체)은 끝날 때까지 값의 시작부터 _PartialJSONParser로 다시 해석합니다.
+    결과 형식은 parse_partial_evaluation과 같습니다.
+    """
+
+    def __init__(self):
+        self.result: Dict[str, Any] = {}
+        self._text = ""
+        self._pos: Optional[int] = None  # 다음 항목을 읽을 위치 (None: 아직 "{"를 찾지 못함)
+        self._key: Optional[str] = None  # 값을 읽는 중인 항목의 키
+        self._string = False  # 값이 문자열이고 _pos부터 아직 해석하지 않은 본문
+        self._done = False
+
+    def feed(self, chunk: str) -> Dict[str, Any]:
+        """
+        응답 조각을 추가합니다.
+
+        Returns:
+            지금까지 확정된 평가 내용 (parse_partial_evaluation과 같은 형식, 호출마다 새 딕셔너리)
+        """
+        if self._done:
+            return dict(self.result)
+        self._text += chunk
+        try:
+            self._advance()
+        except ValueError:
+            # 형식이 잘못된 부분 - 지금까지 해석한 내용을 유지하고 다음 조각에서 다시 시도
+            pass
+        if self._pos is None:
+            self._text = ""
+        elif not self._done:
+            # 이미 해석한 부분은 버리고 위치를 다시 계산
+            self._text = self._text[self._pos:]
+            self._pos = 0
+        return dict(self.result)
+
+    def _skip_whitespace(self) -> bool:
+        """공백을 건너뛰고, 다음 글자가 도착했으면 True를 반환합니다."""
+        self._pos = _JSON_WHITESPACE.match(self._text, self._pos).end()
+        return self._pos < len(self._text)
+
+    def _advance(self) -> None:
+        text = self._text
+        if self._pos is None:
+            start = text.find("{")
+            if start < 0:
+                return
+            self._pos = start + 1
+
+        while True:
+            if self._string:
+                if not self._read_string():
+                    return
+                continue
+            if self._key is not None:
+                if not self._skip_whitespace():
+                    return
+                if text[self._pos] == '"':
+                    self._pos += 1
+                    self._string = True
+                    self.result[self._key] = ""
+                    continue
+                parser = _PartialJSONParser(text)
+                parser.pos, parser.depth = self._pos, 1
+                try:
+                    value, complete = parser.parse_value()
+                except _Incomplete:
+                    return
+                self.result[self._key] = value
+                if not complete:
+                    return
+                self._pos, self._key = parser.pos, None
+                continue
+
+            # 다음 항목의 키 (또는 구분자, 객체 끝)
+            if not self._skip_whitespace():
+                return
+            char = text[self._pos]
+            if char == "}":
+                self._done = True
+                return
+            if char == ",":
+                self._pos += 1
+                continue
+            if char != '"':
+                raise ValueError("JSON 객체 키가 문자열이 아닙니다")
+            match = _JSON_STRING.match(text, self._pos)
+            if match is None:
+                return
+            after = _JSON_WHITESPACE.match(text, match.end()).end()
+            if after >= len(text):
+                return
+            if text[after] != ":":
+                raise ValueError("JSON 객체 구분자가 올바르지 않습니다")
+            self._key = json.loads(match.group(), strict=False)
+            self._pos = after + 1
+
+    def _read_string(self) -> bool:
+        """
+        생성 중인 문자열 값의 새로 받은 부분을 해석하여 이어 붙입니다.
+
+        Returns:
+            문자열이 끝났으면 True
+        """
+        text = self._text
+        end = _JSON_STRING_BODY.match(text, self._pos).end()
+        complete = end < len(text) and text[end] == '"'
+        cut = end
+        if not complete:
+            # 잘린 \uXXXX 이스케이프와 짝이 오지 않은 서로게이트는 다음 조각과 함께 해석
+            # (잘린 하위 서로게이트 앞의 상위 서로게이트까지 두 번 확인)
+            for _ in range(2):
+                incomplete = _JSON_INCOMPLETE_UNICODE.search(text, self._pos, cut)
+                if incomplete is None:
+                    break
+                before = text[self._pos:incomplete.start()]
+                if (len(before) - len(before.rstrip("\\"))) % 2:
+                    break  # 이스케이프된 역슬래시 뒤의 일반 문자 "u..."
+                cut = incomplete.start()
+        if cut > self._pos:
+            segment = json.loads('"' + text[self._pos:cut] + '"', strict=False)
+            self.result[self._key] += segment
+        self._pos = cut
+        if not complete:
+            return False
+        self._pos, self._key, self._string = end + 1, None, False
+        return True
+
+
+def evaluation_cache_key(
+    article_body: str,
+    article_title: Optional[str] = None,
+    variant: str = ""
+) -> str:
+    """
+    평가 결과 캐시 키를 만듭니다.
+
+    공백을 정규화한 본문과 제목, 프롬프트 버전, 모델명을 합친 SHA-256 해시입니다.
+    공백만 다른 재제출은 같은 키가 되고, 프롬프트나 모델이 바뀌면 다른 키가 됩니다.
+
+    Args:
+        article_body: 기사 본문
+        article_title: 기사 제목 (선택사항)
+        variant: 같은 기사라도 결과가 달라지는 평가 방식 (긴 기사 처리 방식 등)
+
+    Returns:
+        16진수 해시 문자열
+    """
+    normalized_body = re.sub(r'\s+', ' ', article_body).strip()
+    normalized_title = re.sub(r'\s+', ' ', article_title or "").strip()
+    digest = hashlib.sha256()
+    for part in (PROMPT_VERSION, EVALUATION_MODEL, normalized_title, normalized_body):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    if variant:
+        digest.update(variant.encode("utf-8"))
+    return digest.hexdigest()
+
+
+async def request_evaluation(
+    client: anthropic.AsyncAnthropic,
+    article_body: str,
+    article_title: Optional[str] = None,
+    note: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Claude API를 호출하여 기사를 평가합니다. (캐시, 토큰 예산 미적용)
+
+    Args:
+        client: Anthropic 클라이언트
+        article_body: 기사 본문
+        article_title: 기사 제목 (선택사항)
+        note: 본문에 대한 참고 사항 (선택사항)
+
+    Returns:
+        평가 결과 딕셔너리
+
+    Raises:
+        anthropic.APIError: Claude API 오류
+        ValueError: 응답 파싱 또는 검증 실패
+    """
+    # Claude API 호출
+    logger.info("Claude API 호출 시작")
+    with metrics.LLM_REQUEST_SECONDS.time(call="evaluate"):
+        message = await client.messages.create(**build_request(article_body, article_title, note=note))
+    log_usage(getattr(message, "usage", None))
+
+    # 응답 검증 (누락/잘못된 항목은 보정 요청으로 채움)
+    logger.info(f"Claude API 응답 수신: stop_reason={message.stop_reason}")
+    data = extract_tool_input(message, EVALUATION_TOOL["name"])
+    return await complete_evaluation(client, article_body, article_title, data)
+
+
+def _plan_note(plan: InputPlan, index: int) -> Optional[str]:
+    """긴 기사를 생략하거나 나눈 경우 사용자 메시지에 덧붙일 참고 사항을 만듭니다."""
+    if plan.mode == "trim":
+        return "기사가 길어 본문 중간 일부를 생략했습니다 ((…중략…) 표시). 생략된 부분 때문에 감점하지 마세요."
+    if plan.mode == "chunk" and len(plan.parts) > 1:
+        return (
+            f"긴 기사를 {len(plan.parts)}개 부분으로 나눈 중 {index + 1}번째 부분입니다. "
+            "이 부분의 내용을 기준으로 평가하세요."
+        )
+    return None
+
+
+def _cache_variant(article_body: str, article_title: Optional[str], mode: str) -> str:
+    """예산을 넘는 기사는 처리 방식과 예산에 따라 결과가 달라지므로 캐시 키에 반영합니다."""
+    if not is_over_budget(article_body, article_title):
+        return ""
+    return f"{mode}:{EVALUATION_MAX_ARTICLE_TOKENS}:{EVALUATION_MAX_CHUNKS}"
+
+
+def planned_cache_key(article_body: str, article_title: Optional[str], mode: str) -> str:
+    """
+    긴 기사 처리 방식을 반영한 평가 캐시 키를 만듭니다.
+
+    evaluate, stream_evaluation과 일괄 평가가 같은 키를 사용하므로
+    같은 기사와 처리 방식의 결과는 경로와 관계없이 캐시를 공유합니다.
+    """
+    return evaluation_cache_key(article_body, article_title, _cache_variant(article_body, article_title, mode))
+
+
+def build_plan_request(plan: InputPlan, article_title: Optional[str] = None, index: int = 0) -> Dict[str, Any]:
+    """
+    입력 계획의 부분 하나를 평가하는 요청을 만듭니다. (생략/분할 참고 사항 포함)
+
+    Returns:
+        messages.create/messages.batches.create에 넘길 키워드 인자 딕셔너리
+    """
+    return build_request(plan.parts[index], article_title, note=_plan_note(plan, index))
+
+
+def merge_evaluations(results: List[Dict[str, Any]], weights: List[int]) -> Dict[str, Any]:
+    """
+    긴 기사의 부분별 평가 결과를 하나로 합칩니다.
+
+    점수는 부분 길이로 가중 평균하여 반올림하고, 요약은 리드가 들어 있는 첫 부분의 요약을,
+    상세 피드백은 부분별 피드백을 이어 붙여 사용합니다.
+
+    Args:
+        results: 부분별 평가 결과 (8개 점수가 모두 있는 결과)
+        weights: 부분별 가중치 (본문 글자 수)
+
+    Returns:
+        합친 평가 결과 딕셔너리
+    """
+    total = sum(weights) or 1
+    scores = {
+        key: int(sum(result["scores"][key] * weight for result, weight in zip(results, weights)) / total + 0.5)
+        for key in SCORE_KEYS
+    }
+    feedback = "\n\n".join(
+        f"[{index}/{len(results)}부분] {result['detailed_feedback']}"
+        for index, result in enumerate(results, 1)
+        if result.get("detailed_feedback")
+    )
+    return {
+        "evaluation_summary": results[0]["evaluation_summary"],
+        "scores": scores,
+        "detailed_feedback": feedback or None
+    }
+
+
+async def evaluate_plan(
+    client: anthropic.AsyncAnthropic,
+    plan: InputPlan,
+    article_title: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    입력 계획에 따라 기사를 평가합니다. (캐시 미사용)
+
+    부분이 여러 개이면 동시에 평가하므로 지연 시간은 부분 하나의 평가 시간 수준입니다.
+
+    Args:
+        client: Anthropic 클라이언트
+        plan: token_budget.plan_input이 만든 입력 계획
+        article_title: 기사 제목 (선택사항)
+
+    Returns:
+        평가 결과 딕셔너리 (input_budget에 입력 처리 보고서 포함)
+
+    Raises:
+        anthropic.APIError: Claude API 오류
+        ValueError: 응답 파싱 또는 검증 실패
+    """
+    if len(plan.parts) == 1:
+        result = await request_evaluation(client, plan.parts[0], article_title, _plan_note(plan, 0))
+    else:
+        results = await asyncio.gather(*(
+            request_evaluation(client, part, article_title, _plan_note(plan, index))
+            for index, part in enumerate(plan.parts)
+        ))
+        result = merge_evaluations(list(results), [len(part) for part in plan.parts])
+    return {**result, "input_budget": plan.report()}
+
+
+async def evaluate(
+    client: anthropic.AsyncAnthropic,
+    article_body: str,
+    article_title: Optional[str] = None,
+    use_cache: bool = True,
+    long_article_mode: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    캐시와 single-flight를 거쳐 기사를 평가합니다.
+
+    1. 콘텐츠 해시로 캐시를 조회하여 적중하면 즉시 반환합니다.
+    2. 같은 해시의 평가가 진행 중이면 새 호출 없이 그 결과를 기다립니다.
+    3. 그렇지 않으면 토큰 예산에 맞게 입력을 조정하여 Claude API를 호출하고
+       결과를 캐시에 저장합니다.
+
+    Args:
+        client: Anthropic 클라이언트
+        article_body: 기사 본문
+        article_title: 기사 제목 (선택사항)
+        use_cache: False이면 캐시를 조회하지 않고 새로 평가 (결과는 캐시에 갱신)
+        long_article_mode: 예산을 넘는 기사 처리 방식 (trim / chunk, None이면 기본값)
+
+    Returns:
+        평가 결과 딕셔너리
+
+    Raises:
+        anthropic.APIError: Claude API 오류
+        ValueError: 응답 파싱 또는 검증 실패, 지원하지 않는 처리 방식
+    """
+    mode = resolve_mode(long_article_mode)
+    cache_key = planned_cache_key(article_body, article_title, mode)
+    if use_cache:
+        cached = evaluation_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"평가 캐시 적중: {cache_key[:12]}")
+            return cached
+
+    async def run() -> Dict[str, Any]:
+        plan = await plan_input(client, EVALUATION_MODEL, article_body, article_title, mode)
+        result = await evaluate_plan(client, plan, article_title)
+        evaluation_cache.set(cache_key, result)
+        return result
+
+    return await evaluation_flight.do(cache_key, run)
+
+
+async def stream_text(
+    client: anthropic.AsyncAnthropic,
+    article_body: str,
+    article_title: Optional[str] = None,
+    note: Optional[str] = None
+) -> AsyncIterator[str]:
+    """
+    Claude 스트리밍 API로 평가 응답 JSON 텍스트를 조각 단위로 받습니다. (캐시 미사용)
+
+    평가 도구 입력(JSON)의 조각을 내보내며, 도구 대신 텍스트로 응답하면 텍스트 조각을 내보냅니다.
+    소비자가 중간에 멈추면 (클라이언트 연결 종료 등) 스트림도 닫습니다.
+
+    Args:
+        client: Anthropic 클라이언트
+        article_body: 기사 본문
+        article_title: 기사 제목 (선택사항)
+        note: 본문에 대한 참고 사항 (선택사항)
+
+    Yields:
+        응답 JSON 텍스트 조각
+
+    Raises:
+        anthropic.APIError: Claude API 오류
+    """
+    logger.info("Claude API 스트리밍 호출 시작")
+    start = time.perf_counter()
+    first = True
+    with metrics.LLM_REQUEST_SECONDS.time(call="stream"):
+        async with client.messages.stream(**build_request(article_body, article_title, note=note)) as stream:
+            async for event in stream:
+                if event.type != "content_block_delta":
+                    continue
+                if first:
+                    metrics.LLM_FIRST_TOKEN_SECONDS.observe(time.perf_counter() - start)
+                    first = False
+                if event.delta.type == "input_json_delta":
+                    yield event.delta.partial_json
+                elif event.delta.type == "text_delta":
+                    yield event.delta.text
+            message = await stream.get_final_message()
+            log_usage(message.usage)
+
+
+def _diff_partial(previous: Dict[str, Any], current: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """두 부분 평가 결과를 비교하여 새로 생성된 내용의 이벤트를 만듭니다."""
+    for field, event in (("evaluation_summary", "summary"), ("detailed_feedback", "feedback")):
+        text = current.get(field)
+        if not isinstance(text, str):
+            continue
+        before = previous.get(field)
+        before = before if isinstance(before, str) else ""
+        if len(text) > len(before):
+            yield event, {"delta": text[len(before):]}
+
+    # 최종 결과와 같은 형식(SCORE_KEYS 키, 1-10 정수)으로 정리한 점수만 내보냄
+    before_scores = normalize_scores(previous.get("scores"))
+    for key, value in normalize_scores(current.get("scores")).items():
+        if key not in before_scores:
+            yield "score", {"key": key, "value": value}
+
+
+async def stream_evaluation(
+    client: anthropic.AsyncAnthropic,
+    article_body: str,
+    article_title: Optional[str] = None,
+    use_cache: bool = True,
+    stream: Callable[..., AsyncIterator[str]] = stream_text,
+    long_article_mode: Optional[str] = None
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    기사를 평가하면서 생성되는 내용을 이벤트로 내보냅니다.
+
+    캐시에 적중하면 result 이벤트 하나만 내보냅니다. 그렇지 않으면 Claude 응답을
+    받는 대로 부분 파싱하여 다음 이벤트를 내보내고, 끝나면 결과를 캐시에 저장합니다.
+    - budget: 토큰 예산을 넘어 입력을 조정한 경우의 입력 처리 보고서 (첫 이벤트)
+    - summary: {"delta": 요약에 새로 추가된 텍스트}
+    - score: {"key": 차원 이름, "value": 점수} (값이 확정된 점수만, result와 같이 SCORE_KEYS 키와 1-10 정수로 정리)
+    - feedback: {"delta": 상세 피드백에 새로 추가된 텍스트}
+    - result: 전체 평가 결과 (evaluate의 반환값과 같은 형식)
+
+    긴 기사를 여러 부분으로 나눈 경우(chunk)에는 부분들을 동시에 평가하므로
+    조각 이벤트 없이 합친 result만 내보냅니다.
+    스트리밍 요청은 각자 응답을 받아야 하므로 single-flight로 합치지 않습니다.
+
+    Args:
+        client: Anthropic 클라이언트
+        article_body: 기사 본문
+        article_title: 기사 제목 (선택사항)
+        use_cache: False이면 캐시를 조회하지 않고 새로 평가 (결과는 캐시에 갱신)
+        stream: 응답 텍스트 조각을 내보내는 함수 (기본값 stream_text)
+        long_article_mode: 예산을 넘는 기사 처리 방식 (trim / chunk, None이면 기본값)
+
+    Yields:
+        (이벤트 이름, 데이터) 튜플
+
+    Raises:
+        anthropic.APIError: Claude API 오류
+        ValueError: 응답 파싱 또는 검증 실패, 지원하지 않는 처리 방식
+    """
+    mode = resolve_mode(long_article_mode)
+    cache_key = planned_cache_key(article_body, article_title, mode)
+    if use_cache:
+        cached = evaluation_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"평가 캐시 적중: {cache_key[:12]}")
+            yield "result", cached
+            return
+
+    plan = await plan_input(client, EVALUATION_MODEL, article_body, article_title, mode)
+    if plan.mode != "full":
+        yield "budget", plan.report()
+
+    if len(plan.parts) > 1:
+        result = await evaluate_plan(client, plan, article_title)
+    else:
+        body, note = plan.parts[0], _plan_note(plan, 0)
+        chunks: List[str] = []
+        parser = PartialEvaluationParser()
+        partial: Dict[str, Any] = {}
+        async for chunk in stream(client, body, article_title, note):
+            chunks.append(chunk)
+            current = parser.feed(chunk)
+            for event in _diff_partial(partial, current):
+                yield event
+            partial = current
+
+        response_text = "".join(chunks)
+        logger.info(f"Claude API 스트리밍 응답 수신: {len(response_text)} 문자")
+        try:
+            data = parse_evaluation_response(response_text)
+        except ValueError:
+            # 출력이 중간에 끊긴 경우 완성된 항목만 살리고 나머지는 보정 요청으로 채움
+            data = parse_partial_evaluation(response_text)
+            if not data:
+                raise
+        result = await complete_evaluation(client, body, article_title, data)
+        result["input_budget"] = plan.report()
+
+    evaluation_cache.set(cache_key, result)
+    yield "result", result
@@ -0,0 +1,753 @@
+"""
+HTTP 요청 모듈
+
+모든 스크래퍼와 resolve_url이 공통으로 사용하는 HTTP 계층입니다.
+프로세스 단위로 공유되는 세션이 호스트별 keep-alive 커넥션 풀을 유지하므로,
+같은 언론사에 대한 반복 요청은 TCP/TLS 핸드셰이크 없이 기존 연결을 재사용합니다.
+
+동기 API(get, head)는 requests 세션을, 비동기 API(get_async, head_async)는
+httpx.AsyncClient를 사용하며 두 API 모두 같은 FetchResponse와 requests 예외를 반환합니다.
+
+기사 페이지는 get_streamed / get_streamed_async로 스트리밍하여 내려받습니다.
+청크 단위로 점진적으로 디코딩하고, 최대 바이트 수를 넘거나 지정한 본문 컨테이너가
+닫히면 더 읽지 않고 멈추므로 요청당 메모리 사용량과 느린 응답의 꼬리 지연이 줄어듭니다.
+
+연결 타임아웃과 읽기 타임아웃은 따로 설정하며(언론사별 지정 가능), 비동기 API는
+deadline 모듈의 요청 마감 시각까지 남은 시간으로 타임아웃을 줄입니다.
+응답이 느린 요청은 hedged로 같은 요청을 하나 더 보내 먼저 끝난 결과를 쓸 수 있습니다.
+
+환경 변수:
+- SCRAPING_TIMEOUT: 응답 읽기 타임아웃 (초, 기본값 10)
+- SCRAPING_CONNECT_TIMEOUT: 연결 타임아웃 (초, 기본값 3)
+- SCRAPING_TIMEOUT_OVERRIDES: 언론사별 "연결:읽기" 타임아웃 (예: "naver.com=2:5,hani.co.kr=3:15")
+- SCRAPING_HEDGE_DELAY: 이 시간(초) 안에 끝나지 않은 페이지 요청을 하나 더 보냄 (기본값 0, 사용 안 함)
+- USER_AGENT: 요청 시 사용할 User-Agent 헤더
+- SCRAPING_POOL_CONNECTIONS: 유지할 호스트별 커넥션 풀 개수 (기본값 16)
+- SCRAPING_POOL_MAXSIZE: 호스트당 유지할 최대 커넥션 수 (기본값 32)
+- SCRAPING_HTTP2: "true"이면 httpx 기반 HTTP/2 클라이언트 사용 (h2 패키지 필요)
+- SCRAPING_MAX_BYTES: 페이지당 최대 다운로드 크기 (바이트, 기본값 5MB)
+- SCRAPING_MAX_BYTES_OVERRIDES: 언론사별 최대 크기 (예: "naver.com=3000000,daum.net=2000000")
+"""
+
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple, TypeVar
+import asyncio
+import codecs
+import os
+import re
+import threading
+import logging
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+import deadline
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+# 상수
+TIMEOUT = float(os.getenv("SCRAPING_TIMEOUT", "10"))  # 초 (응답 읽기)
+CONNECT_TIMEOUT = float(os.getenv("SCRAPING_CONNECT_TIMEOUT", "3"))  # 초
+HEDGE_DELAY = float(os.getenv("SCRAPING_HEDGE_DELAY", "0"))  # 초 (0이면 사용 안 함)
+USER_AGENT = os.getenv(
+    "USER_AGENT",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+)
+POOL_CONNECTIONS = int(os.getenv("SCRAPING_POOL_CONNECTIONS", "16"))
+POOL_MAXSIZE = int(os.getenv("SCRAPING_POOL_MAXSIZE", "32"))
+HTTP2_ENABLED = os.getenv("SCRAPING_HTTP2", "false").lower() == "true"
+
+# 스트리밍 다운로드
+MAX_BYTES = int(os.getenv("SCRAPING_MAX_BYTES", str(5 * 1024 * 1024)))
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 언론사(SOURCE_MAP 도메인 키)별 최대 다운로드 크기
+SITE_MAX_BYTES: Dict[str, int] = {
+    domain.strip(): int(limit)
+    for domain, _, limit in (
+        item.partition("=")
+        for item in os.getenv("SCRAPING_MAX_BYTES_OVERRIDES", "").split(",")
+        if "=" in item
+    )
+}
+
+
+def _parse_timeout_overrides(value: str) -> Dict[str, Tuple[float, float]]:
+    """"naver.com=2:5,hani.co.kr=3:15" 형식의 언론사별 (연결, 읽기) 타임아웃을 읽습니다."""
+    overrides: Dict[str, Tuple[float, float]] = {}
+    for item in value.split(","):
+        domain, _, timeouts = item.partition("=")
+        connect, _, read = timeouts.partition(":")
+        if domain.strip() and read:
+            overrides[domain.strip()] = (float(connect), float(read))
+    return overrides
+
+
+# 언론사(SOURCE_MAP 도메인 키)별 (연결, 읽기) 타임아웃
+SITE_TIMEOUTS = _parse_timeout_overrides(os.getenv("SCRAPING_TIMEOUT_OVERRIDES", ""))
+
+_CHARSET_PATTERN = re.compile(rb'charset=["\']?([\w-]+)', re.I)
+# 한국어 사이트의 EUC-KR 선언은 상위 호환인 CP949로 디코딩
+_ENCODING_ALIASES = {
+    "euc-kr": "cp949",
+    "euc_kr": "cp949",
+    "ks_c_5601-1987": "cp949",
+}
+
+
+@dataclass(frozen=True)
+class Timeouts:
+    """
+    요청 타임아웃
+
+    Attributes:
+        connect: 연결 타임아웃 (초, 커넥션 풀 대기 포함)
+        read: 응답 읽기 타임아웃 (초, 청크 사이 최대 간격)
+    """
+    connect: float = CONNECT_TIMEOUT
+    read: float = TIMEOUT
+
+
+def timeouts_for(site: Optional[str] = None) -> Timeouts:
+    """언론사별 타임아웃을 반환합니다. 지정이 없으면 CONNECT_TIMEOUT / TIMEOUT입니다."""
+    connect, read = SITE_TIMEOUTS.get(site or "", (CONNECT_TIMEOUT, TIMEOUT))
+    return Timeouts(connect, read)
+
+
+@dataclass
+class FetchResponse:
+    """
+    HTTP 응답 표준 구조
+
+    requests와 httpx 백엔드의 응답을 같은 형태로 다루기 위한 구조입니다.
+
+    Attributes:
+        url: 리다이렉트를 따라간 최종 URL
+        status_code: HTTP 상태 코드
+        text: 디코딩된 응답 본문 (HEAD 요청은 빈 문자열)
+        truncated: 스트리밍을 중간에 멈춘 이유
+            (None: 전체 수신, "container": 본문 컨테이너 종료, "max_bytes": 최대 크기 초과)
+    """
+    url: str
+    status_code: int
+    text: str
+    truncated: Optional[str] = None
+
+    def raise_for_status(self) -> None:
+        """
+        4xx/5xx 응답이면 requests.HTTPError를 발생시킵니다.
+
+        Raises:
+            requests.HTTPError: 에러 상태 코드 (e.response.status_code로 확인 가능)
+        """
+        if self.status_code >= 400:
+            raise requests.HTTPError(
+                f"{self.status_code} Error for url: {self.url}",
+                response=self
+            )
+
+
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_http2_client: Optional[httpx.Client] = None
+_http2_unavailable = False
+_async_client: Optional[httpx.AsyncClient] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_session() -> requests.Session:
+    """
+    공유 requests 세션을 반환합니다. 최초 호출 시 생성됩니다.
+
+    urllib3 PoolManager가 호스트마다 별도의 커넥션 풀을 관리하며,
+    POOL_CONNECTIONS개의 호스트 풀과 호스트당 POOL_MAXSIZE개의 연결을 유지합니다.
+
+    Returns:
+        커넥션 풀이 설정된 requests.Session
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({"User-Agent": USER_AGENT})
+                _session = session
+                logger.info(
+                    f"HTTP 세션 생성: pool_connections={POOL_CONNECTIONS}, "
+                    f"pool_maxsize={POOL_MAXSIZE}"
+                )
+    return _session
+
+
+def _get_http2_client():
+    """
+    공유 httpx HTTP/2 클라이언트를 반환합니다.
+
+    HTTP/2가 비활성화되었거나 h2 패키지가 설치되지 않은 경우 None을 반환하며,
+    이때 호출자는 requests 세션으로 대체합니다.
+    """
+    global _http2_client, _http2_unavailable
+    if not HTTP2_ENABLED or _http2_unavailable:
+        return None
+    if _http2_client is None:
+        with _lock:
+            if _http2_client is None and not _http2_unavailable:
+                try:
+                    _http2_client = httpx.Client(
+                        http2=True,
+                        headers={"User-Agent": USER_AGENT},
+                        limits=httpx.Limits(
+                            max_connections=POOL_CONNECTIONS * POOL_MAXSIZE,
+                            max_keepalive_connections=POOL_MAXSIZE
+                        )
+                    )
+                    logger.info("HTTP/2 클라이언트 생성 완료")
+                except ImportError:
+                    logger.warning("h2 패키지가 없어 HTTP/1.1 세션을 사용합니다")
+                    _http2_unavailable = True
+                    return None
+    return _http2_client
+
+
+def _translate_httpx_error(error: "httpx.HTTPError") -> requests.RequestException:
+    """httpx 예외를 스크래퍼가 처리하는 requests 예외로 변환합니다."""
+    if isinstance(error, httpx.TimeoutException):
+        return requests.Timeout(str(error))
+    return requests.ConnectionError(str(error))
+
+
+def request(
+    method: str,
+    url: str,
+    allow_redirects: bool = True,
+    timeout: float = TIMEOUT
+) -> FetchResponse:
+    """
+    공유 커넥션 풀을 사용하여 HTTP 요청을 보냅니다.
+
+    Args:
+        method: HTTP 메서드 ("GET", "HEAD")
+        url: 요청 URL
+        allow_redirects: 리다이렉트 추적 여부
+        timeout: 응답 읽기 타임아웃 (초, 연결은 CONNECT_TIMEOUT)
+
+    Returns:
+        FetchResponse 객체 (상태 코드 검사는 호출자가 raise_for_status로 수행)
+
+    Raises:
+        requests.Timeout: 요청 시간 초과
+        requests.RequestException: 네트워크 에러
+    """
+    client = _get_http2_client()
+    if client is not None:
+        try:
+            response = client.request(
+                method,
+                url,
+                follow_redirects=allow_redirects,
+                timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT)
+            )
+        except httpx.HTTPError as e:
+            raise _translate_httpx_error(e) from e
+        return FetchResponse(
+            url=str(response.url),
+            status_code=response.status_code,
+            text=response.text if method != "HEAD" else ""
+        )
+
+    response = get_session().request(
+        method,
+        url,
+        allow_redirects=allow_redirects,
+        timeout=(CONNECT_TIMEOUT, timeout)
+    )
+    return FetchResponse(
+        url=response.url,
+        status_code=response.status_code,
+        text=response.text if method != "HEAD" else ""
+    )
+
+
+def get(url: str, timeout: float = TIMEOUT) -> FetchResponse:
+    """공유 커넥션 풀로 GET 요청을 보냅니다."""
+    return request("GET", url, timeout=timeout)
+
+
+def head(url: str, allow_redirects: bool = True, timeout: float = TIMEOUT) -> FetchResponse:
+    """공유 커넥션 풀로 HEAD 요청을 보냅니다."""
+    return request("HEAD", url, allow_redirects=allow_redirects, timeout=timeout)
+
+
+def max_bytes_for(site: Optional[str] = None) -> int:
+    """언론사별 최대 다운로드 크기를 반환합니다. 지정이 없으면 MAX_BYTES입니다."""
+    return SITE_MAX_BYTES.get(site or "", MAX_BYTES)
+
+
+def _detect_encoding(content_type: str, head: bytes) -> str:
+    """
+    응답 인코딩을 결정합니다.
+
+    Content-Type 헤더의 charset, 문서 앞부분의 <meta charset> 선언, UTF-8 순으로 사용합니다.
+    """
+    match = (
+        _CHARSET_PATTERN.search(content_type.encode("latin-1", "ignore")) or
+        _CHARSET_PATTERN.search(head[:4096])
+    )
+    name = match.group(1).decode("ascii").lower() if match else "utf-8"
+    name = _ENCODING_ALIASES.get(name, name)
+    try:
+        codecs.lookup(name)
+    except LookupError:
+        name = "utf-8"
+    return name
+
+
+class ContainerCloseDetector:
+    """
+    스트리밍 중인 HTML에서 지정한 요소가 닫혔는지 감지합니다.
+
+    속성 패턴과 일치하는 시작 태그를 찾은 뒤 같은 이름의 태그 열림/닫힘 깊이를 세어,
+    깊이가 0이 되면 요소가 닫힌 것으로 판단합니다. 주석(<!-- -->)과 <script>, <style> 등
+    내용이 원문 텍스트인 요소 안의 태그 문자열(예: 스크립트의 "</div>")은 세지 않습니다.
+    청크 경계에 걸친 태그를 위해 처리하지 않은 마지막 부분만 보관하므로
+    문서 전체를 다시 검사하지 않습니다.
+
+    Args:
+        attr_pattern: 시작 태그 속성 정규식 (예: r'\bid="dic_area"')
+    """
+
+    _TAIL = 2048
+    # 내용 안의 태그를 세지 않는 구간의 시작 (주석, 원문 텍스트 요소)
+    _RAW_TEXT = r'<!--|<(script|style|textarea|title|xmp|noscript)\b'
+
+    def __init__(self, attr_pattern: str):
+        self._start = re.compile(r'<([a-zA-Z][\w-]*)\b[^>]*?' + attr_pattern + r'[^>]*>')
+        self._tag_pattern: Optional[re.Pattern] = None
+        self._skip_end: Optional[re.Pattern] = None
+        self._depth = 0
+        self._buffer = ""
+
+    def _skip(self, buffer: str, pos: int) -> int:
+        """
+        주석/원문 텍스트 요소의 끝을 찾습니다.
+
+        Returns:
+            구간이 끝난 위치, 아직 끝나지 않았으면 -1
+        """
+        match = self._skip_end.search(buffer, pos)
+        if match is None:
+            return -1
+        self._skip_end = None
+        return match.end()
+
+    def feed(self, text: str) -> bool:
+        """
+        새로 디코딩된 텍스트를 검사합니다.
+
+        Returns:
+            요소가 닫혔으면 True
+        """
+        buffer = self._buffer + text
+        if self._tag_pattern is None:
+            match = self._start.search(buffer)
+            if match is None:
+                self._buffer = buffer[-self._TAIL:]
+                return False
+            self._tag_pattern = re.compile(
+                self._RAW_TEXT + r'|<(/?)' + re.escape(match.group(1)) + r'\b', re.I
+            )
+            self._depth = 1
+            buffer = buffer[match.end():]
+
+        pos = 0
+        while True:
+            if self._skip_end is not None:
+                end = self._skip(buffer, pos)
+                if end < 0:
+                    # 끝 표시가 청크 경계에 걸칠 수 있으므로 마지막 몇 글자만 보관
+                    self._buffer = buffer[max(pos, len(buffer) - 16):]
+                    return False
+                pos = end
+                continue
+
+            match = self._tag_pattern.search(buffer, pos)
+            if match is None:
+                # 주석 시작(<!--)이나 태그 이름이 청크 경계에 걸칠 수 있으므로 마지막 부분 보관
+                self._buffer = buffer[max(pos, len(buffer) - 64):]
+                return False
+            if match.end() >= len(buffer):
+                # 태그 이름 뒤 글자가 아직 도착하지 않음 - 다음 청크에서 다시 검사
+                self._buffer = buffer[match.start():]
+                return False
+            pos = match.end()
+            if match.group(0) == "<!--":
+                self._skip_end = re.compile(r'-->')
+            elif match.group(1):
+                self._skip_end = re.compile(r'</' + match.group(1) + r'\s*>', re.I)
+            else:
+                self._depth += -1 if match.group(2) else 1
+                if self._depth == 0:
+                    return True
+
+
+class _StreamReader:
+    """청크를 점진적으로 디코딩하며 최대 크기와 조기 종료 조건을 검사합니다."""
+
+    def __init__(self, content_type: str, max_bytes: int, stop_after: Optional[str]):
+        self.content_type = content_type
+        self.max_bytes = max_bytes
+        self.detector = ContainerCloseDetector(stop_after) if stop_after else None
+        self.received = 0
+        self.truncated: Optional[str] = None
+        self._decoder = None
+        self._parts = []
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        청크를 추가합니다.
+
+        Returns:
+            더 읽지 않아도 되면 True
+        """
+        if self._decoder is None:
+            encoding = _detect_encoding(self.content_type, chunk)
+            self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        remaining = self.max_bytes - self.received
+        if len(chunk) > remaining:
+            chunk = chunk[:remaining]
+            self.truncated = "max_bytes"
+        self.received += len(chunk)
+        text = self._decoder.decode(chunk)
+        self._parts.append(text)
+        if self.truncated:
+            logger.warning(f"최대 다운로드 크기 초과, {self.max_bytes}바이트까지만 사용")
+            return True
+        if self.detector is not None and self.detector.feed(text):
+            self.truncated = "container"
+            return True
+        return False
+
+    def result(self, url: str, status_code: int) -> FetchResponse:
+        """지금까지 받은 내용으로 FetchResponse를 만듭니다."""
+        if self._decoder is not None:
+            self._parts.append(self._decoder.decode(b"", final=True))
+        return FetchResponse(
+            url=url,
+            status_code=status_code,
+            text="".join(self._parts),
+            truncated=self.truncated
+        )
+
+
+def _read_stream(
+    url: str,
+    status_code: int,
+    content_type: str,
+    chunks: Iterable[bytes],
+    max_bytes: int,
+    stop_after: Optional[str]
+) -> FetchResponse:
+    """동기 스트림에서 청크를 읽어 FetchResponse를 만듭니다. 에러 응답은 본문을 읽지 않습니다."""
+    reader = _StreamReader(content_type, max_bytes, stop_after)
+    if status_code < 400:
+        for chunk in chunks:
+            if reader.feed(chunk):
+                break
+    return reader.result(url, status_code)
+
+
+def get_streamed(
+    url: str,
+    max_bytes: int = MAX_BYTES,
+    stop_after: Optional[str] = None,
+    timeout: float = TIMEOUT
+) -> FetchResponse:
+    """
+    페이지를 스트리밍으로 내려받습니다.
+
+    최대 크기를 넘거나 stop_after 패턴의 요소가 닫히면 나머지 응답을 읽지 않고 연결을 닫습니다.
+    (중간에 닫은 연결은 커넥션 풀로 돌아가지 않습니다.)
+
+    Args:
+        url: 요청 URL
+        max_bytes: 최대 다운로드 크기 (디코딩 전, 압축 해제 후 바이트)
+        stop_after: 이 속성 패턴을 가진 요소가 닫히면 읽기 중단 (선택사항)
+        timeout: 응답 읽기 타임아웃 (초, 연결은 CONNECT_TIMEOUT)
+
+    Returns:
+        FetchResponse 객체 (중간에 멈춘 경우 truncated에 이유 기록)
+
+    Raises:
+        requests.Timeout: 요청 시간 초과
+        requests.RequestException: 네트워크 에러
+    """
+    client = _get_http2_client()
+    if client is not None:
+        try:
+            with client.stream(
+                "GET", url, follow_redirects=True, timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT)
+            ) as response:
+                return _read_stream(
+                    str(response.url),
+                    response.status_code,
+                    response.headers.get("content-type", ""),
+                    response.iter_bytes(STREAM_CHUNK_SIZE),
+                    max_bytes,
+                    stop_after
+                )
+        except httpx.HTTPError as e:
+            raise _translate_httpx_error(e) from e
+
+    with get_session().get(url, stream=True, timeout=(CONNECT_TIMEOUT, timeout)) as response:
+        return _read_stream(
+            response.url,
+            response.status_code,
+            response.headers.get("content-type", ""),
+            response.iter_content(STREAM_CHUNK_SIZE),
+            max_bytes,
+            stop_after
+        )
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    현재 이벤트 루프에서 사용할 공유 httpx.AsyncClient를 반환합니다.
+
+    클라이언트는 생성된 이벤트 루프에 묶이므로, 루프가 바뀌면(테스트, 리로드 등)
+    새 클라이언트를 생성합니다. SCRAPING_HTTP2가 켜져 있고 h2가 설치되어 있으면
+    HTTP/2를 사용합니다.
+
+    Returns:
+        커넥션 풀이 설정된 httpx.AsyncClient
+    """
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        limits = httpx.Limits(
+            max_connections=POOL_CONNECTIONS * POOL_MAXSIZE,
+            max_keepalive_connections=POOL_MAXSIZE
+        )
+        try:
+            client = httpx.AsyncClient(
+                http2=HTTP2_ENABLED,
+                headers={"User-Agent": USER_AGENT},
+                limits=limits
+            )
+        except ImportError:
+            logger.warning("h2 패키지가 없어 비동기 클라이언트가 HTTP/1.1을 사용합니다")
+            client = httpx.AsyncClient(headers={"User-Agent": USER_AGENT}, limits=limits)
+        _async_client = client
+        _async_client_loop = loop
+        logger.info(f"비동기 HTTP 클라이언트 생성: http2={HTTP2_ENABLED}")
+    return _async_client
+
+
+def _async_timeout(timeout: Optional[Timeouts]) -> Tuple[httpx.Timeout, bool]:
+    """
+    비동기 요청의 httpx 타임아웃을 만듭니다. 요청 마감 시각이 있으면 남은 시간 이하로 줄입니다.
+
+    Returns:
+        (httpx.Timeout, 마감 시각 때문에 줄였는지 여부)
+
+    Raises:
+        deadline.DeadlineExceeded: 남은 시간이 없는 경우
+    """
+    timeout = timeout or Timeouts()
+    connect = deadline.clamp(timeout.connect)
+    read = deadline.clamp(timeout.read)
+    clamped = (connect, read) != (timeout.connect, timeout.read)
+    return httpx.Timeout(read, connect=connect, pool=connect), clamped
+
+
+def _translate_async_error(error: "httpx.HTTPError", clamped: bool) -> Exception:
+    """httpx 예외를 변환합니다. 마감 시각 때문에 줄인 타임아웃이 지나면 DeadlineExceeded입니다."""
+    if clamped and isinstance(error, httpx.TimeoutException):
+        return deadline.DeadlineExceeded(f"요청 시간 예산을 모두 사용했습니다: {error}", site_timeout=True)
+    return _translate_httpx_error(error)
+
+
+async def request_async(
+    method: str,
+    url: str,
+    allow_redirects: bool = True,
+    timeout: Optional[Timeouts] = None
+) -> FetchResponse:
+    """
+    공유 비동기 커넥션 풀을 사용하여 HTTP 요청을 보냅니다.
+
+    이벤트 루프를 막지 않으며, 예외와 반환값은 request()와 동일합니다.
+
+    Args:
+        method: HTTP 메서드 ("GET", "HEAD")
+        url: 요청 URL
+        allow_redirects: 리다이렉트 추적 여부
+        timeout: 연결/읽기 타임아웃 (None이면 기본값, 요청 마감 시각까지 남은 시간 이하로 줄임)
+
+    Returns:
+        FetchResponse 객체
+
+    Raises:
+        requests.Timeout: 요청 시간 초과
+        requests.RequestException: 네트워크 에러
+        deadline.DeadlineExceeded: 요청 마감 시각 초과
+    """
+    httpx_timeout, clamped = _async_timeout(timeout)
+    try:
+        response = await get_async_client().request(
+            method,
+            url,
+            follow_redirects=allow_redirects,
+            timeout=httpx_timeout
+        )
+    except httpx.HTTPError as e:
+        raise _translate_async_error(e, clamped) from e
+    return FetchResponse(
+        url=str(response.url),
+        status_code=response.status_code,
+        text=response.text if method != "HEAD" else ""
+    )
+
+
+async def get_async(url: str, timeout: Optional[Timeouts] = None) -> FetchResponse:
+    """공유 비동기 커넥션 풀로 GET 요청을 보냅니다."""
+    return await request_async("GET", url, timeout=timeout)
+
+
+async def head_async(
+    url: str,
+    allow_redirects: bool = True,
+    timeout: Optional[Timeouts] = None
+) -> FetchResponse:
+    """공유 비동기 커넥션 풀로 HEAD 요청을 보냅니다."""
+    return await request_async("HEAD", url, allow_redirects=allow_redirects, timeout=timeout)
+
+
+async def get_streamed_async(
+    url: str,
+    max_bytes: int = MAX_BYTES,
+    stop_after: Optional[str] = None,
+    timeout: Optional[Timeouts] = None
+) -> FetchResponse:
+    """
+    get_streamed의 비동기 버전입니다.
+
+    Args:
+        url: 요청 URL
+        max_bytes: 최대 다운로드 크기 (디코딩 전, 압축 해제 후 바이트)
+        stop_after: 이 속성 패턴을 가진 요소가 닫히면 읽기 중단 (선택사항)
+        timeout: 연결/읽기 타임아웃 (None이면 기본값, 요청 마감 시각까지 남은 시간 이하로 줄임)
+
+    Returns:
+        FetchResponse 객체 (중간에 멈춘 경우 truncated에 이유 기록)
+
+    Raises:
+        requests.Timeout: 요청 시간 초과
+        requests.RequestException: 네트워크 에러
+        deadline.DeadlineExceeded: 요청 마감 시각 초과
+    """
+    httpx_timeout, clamped = _async_timeout(timeout)
+    try:
+        async with get_async_client().stream(
+            "GET", url, follow_redirects=True, timeout=httpx_timeout
+        ) as response:
+            reader = _StreamReader(response.headers.get("content-type", ""), max_bytes, stop_after)
+            if response.status_code < 400:
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    if reader.feed(chunk):
+                        break
+            return reader.result(str(response.url), response.status_code)
+    except httpx.HTTPError as e:
+        raise _translate_async_error(e, clamped) from e
+
+
+# 헤지 요청 통계 (보낸 횟수 / 헤지 요청이 먼저 끝난 횟수)
+hedge_counts: Dict[str, int] = {"sent": 0, "won": 0}
+
+
+async def hedged(
+    func: Callable[[], Awaitable[V]],
+    delay: float = HEDGE_DELAY,
+    can_hedge: Optional[Callable[[], bool]] = None
+) -> V:
+    """
+    func()가 delay초 안에 끝나지 않으면 같은 요청을 하나 더 보내 먼저 성공한 결과를 반환합니다.
+
+    느린 응답의 꼬리 지연을 줄이기 위한 것으로, 멱등 요청(GET)에만 사용합니다.
+    delay가 0이거나 요청 마감 시각까지 delay보다 적게 남았으면 헤지하지 않습니다.
+    먼저 실패한 요청은 나머지 요청을 기다리며, 둘 다 실패하면 마지막 예외를 발생시킵니다.
+    헤지 요청도 func()로 만들므로 언론사 요청 제한은 func 안에서 요청마다 적용해야 합니다.
+
+    Args:
+        func: 요청 코루틴을 만드는 함수 (인자 없음)
+        delay: 헤지 요청을 보내기까지 기다리는 시간 (초)
+        can_hedge: 헤지 요청을 보낼 시점에 호출하여 False이면 보내지 않음 (예: 요청 한도 소진)
+
+    Returns:
+        먼저 성공한 요청의 결과
+    """
+    left = deadline.remaining()
+    if delay <= 0 or (left is not None and left <= delay):
+        return await func()
+
+    primary = asyncio.ensure_future(func())
+    pending = {primary}
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if done or (can_hedge is not None and not can_hedge()):
+            return await primary
+
+        hedge_counts["sent"] += 1
+        logger.info(f"응답 지연, 헤지 요청 전송 ({delay:g}초 경과)")
+        pending.add(asyncio.ensure_future(func()))
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is not primary:
+                        hedge_counts["won"] += 1
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def aclose() -> None:
+    """
+    동기/비동기 클라이언트를 모두 닫습니다.
+
+    FastAPI lifespan 종료 시 호출합니다.
+    """
+    global _async_client, _async_client_loop
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+        _async_client_loop = None
+    close()
+
+
+def close() -> None:
+    """
+    공유 세션과 HTTP/2 클라이언트를 닫습니다.
+
+    서버 종료 시 호출하여 유지 중인 keep-alive 연결을 정리합니다.
+    """
+    global _session, _http2_client
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+        if _http2_client is not None:
+            _http2_client.close()
+            _http2_client = None
@@ -6,23 +6,62 @@ FastAPI 서버
 
 엔드포인트:
 - POST /scrape: 기사 URL을 받아 스크래핑 수행
+- POST /scrape/batch: 여러 기사 URL을 동시에 스크래핑하여 NDJSON으로 스트리밍
+- POST /evaluate: 기사 본문을 Claude로 평가
+- POST /evaluate/stream: 평가 내용을 생성되는 대로 Server-Sent Events로 스트리밍
+- POST /evaluate/batch: 여러 기사를 Message Batches API로 일괄 평가하는 작업 제출
+- GET /evaluate/batch, GET /evaluate/batch/{job_id}: 일괄 평가 작업 목록/상태 조회
+- POST /analyze: 기사 URL을 받아 서버에서 스크래핑과 평가를 한 번에 수행
+- POST /analyze/stream: 스크래핑한 기사를 먼저 보내고 평가 내용을 SSE로 스트리밍
 - GET /health: 서버 상태 확인
+- GET /cache/stats: 캐시 적중/미스 통계
+- GET /metrics: 단계별 지연 시간, 언론사별 성공/실패, 캐시 적중률 등 Prometheus 형식 지표
+- GET /admin/domains: 언론사별 서킷 브레이커/속도 제한 상태
+- POST /admin/domains/{domain}/reset: 언론사 서킷 수동 초기화
 """
 
-from fastapi import FastAPI, HTTPException, status
+from contextlib import asynccontextmanager, suppress
+from fastapi import Depends, FastAPI, Header, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, HttpUrl, Field
-from typing import Optional, Dict
+from typing import Optional, Dict, List, AsyncIterator
+import asyncio
+import json
 import logging
+import math
 import os
+import secrets
 from dotenv import load_dotenv
 import anthropic
 
-from scraper import scrape_article, Article
-
-# 환경 변수 로드
+# 환경 변수 로드 (스크래핑 모듈이 import 시점에 설정을 읽으므로 먼저 로드)
 load_dotenv()
 
+from scraper import (
+    scrape_article_async,
+    scrape_articles_async,
+    Article,
+    article_cache,
+    article_flight,
+    redirect_cache,
+    redirect_flight
+)
+from evaluator import (
+    create_client,
+    evaluate,
+    evaluation_cache,
+    evaluation_flight,
+    stream_evaluation,
+    usage_stats
+)
+import batch_evaluator
+import deadline
+import fetcher
+import metrics
+import politeness
+import scraper
+
 # 로깅 설정
 logging.basicConfig(
     level=os.getenv("LOG_LEVEL", "INFO"),
@@ -30,13 +69,34 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 수명 주기 관리 - 일괄 평가 폴링과 파싱 프로세스 풀 시작, 종료 시 공유 HTTP 커넥션 풀 정리"""
+    scraper.start_parse_pool()
+    poller = None
+    if anthropic_client is not None:
+        poller = asyncio.create_task(batch_evaluator.run_poller(anthropic_client))
+    yield
+    if poller is not None:
+        poller.cancel()
+        with suppress(asyncio.CancelledError):
+            await poller
+    batch_evaluator.job_store.close()
+    scraper.shutdown_parse_pool()
+    await fetcher.aclose()
+    if anthropic_client is not None:
+        await anthropic_client.close()
+    logger.info("HTTP 커넥션 풀 정리 완료")
+
+
 # FastAPI 앱 인스턴스 생성
 app = FastAPI(
     title="CR Template Hub API",
     description="한국 주요 언론사 기사 스크래핑 API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -50,15 +110,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 엔드포인트별 응답 시간 기록 (CORS 처리를 포함하도록 가장 바깥에 추가)
+app.add_middleware(metrics.MetricsMiddleware)
+
 logger.info(f"CORS enabled for origins: {allowed_origins}")
 
+# 일괄 스크래핑 요청당 최대 URL 수
+BATCH_MAX_URLS = int(os.getenv("BATCH_MAX_URLS", "500"))
+
+# 언론사 상태 조회/서킷 초기화(/admin/domains) 엔드포인트 토큰 (설정하지 않으면 엔드포인트 사용 불가)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
 # Anthropic 클라이언트 초기화
 anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
 if not anthropic_api_key:
     logger.warning("ANTHROPIC_API_KEY가 설정되지 않았습니다. /evaluate 엔드포인트를 사용할 수 없습니다.")
     anthropic_client = None
 else:
-    anthropic_client = anthropic.Anthropic(api_key=anthropic_api_key)
+    anthropic_client = create_client(anthropic_api_key)
     logger.info("Anthropic 클라이언트 초기화 완료")
 
 
@@ -71,11 +140,16 @@ class ScrapeRequest(BaseModel):
         description="스크래핑할 기사 URL",
         example="https://n.news.naver.com/mnews/article/001/0014612345"
     )
+    bypass_cache: bool = Field(
+        False,
+        description="true이면 캐시된 결과를 무시하고 새로 스크래핑 (결과는 캐시에 갱신)"
+    )
 
     class Config:
         json_schema_extra = {
             "example": {
-                "url": "https://n.news.naver.com/mnews/article/001/0014612345"
+                "url": "https://n.news.naver.com/mnews/article/001/0014612345",
+                "bypass_cache": False
             }
         }
 
@@ -102,6 +176,41 @@ class ArticleResponse(BaseModel):
         }
 
 
+class BatchScrapeRequest(BaseModel):
+    """일괄 스크래핑 요청 모델"""
+    urls: List[str] = Field(
+        ...,
+        description="스크래핑할 기사 URL 목록",
+        min_length=1,
+        max_length=BATCH_MAX_URLS
+    )
+    bypass_cache: bool = Field(
+        False,
+        description="true이면 캐시된 결과를 무시하고 새로 스크래핑 (결과는 캐시에 갱신)"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "urls": [
+                    "https://n.news.naver.com/mnews/article/001/0014612345",
+                    "https://www.yna.co.kr/view/AKR20251115000100001"
+                ],
+                "bypass_cache": False
+            }
+        }
+
+
+class BatchScrapeResult(BaseModel):
+    """일괄 스크래핑 결과 (NDJSON 한 줄) 모델"""
+    index: int = Field(..., description="요청 목록에서의 URL 순서 (0부터 시작)")
+    url: str = Field(..., description="요청한 URL")
+    status: str = Field(..., description="처리 결과 (ok 또는 error)")
+    article: Optional[ArticleResponse] = Field(None, description="스크래핑 결과 (성공 시)")
+    error: Optional[str] = Field(None, description="에러 메시지 (실패 시)")
+    detail: Optional[str] = Field(None, description="에러 상세 정보 (실패 시)")
+
+
 class ErrorResponse(BaseModel):
     """에러 응답 모델"""
     error: str = Field(..., description="에러 메시지")
@@ -127,6 +236,15 @@ class EvaluateRequest(BaseModel):
         None,
         description="기사 제목 (선택사항)"
     )
+    bypass_cache: bool = Field(
+        False,
+        description="true이면 캐시된 평가 결과를 무시하고 새로 평가 (결과는 캐시에 갱신)"
+    )
+    long_article_mode: Optional[str] = Field(
+        None,
+        description="토큰 예산을 넘는 긴 기사 처리 방식 (trim: 중간 생략, chunk: 나눠 평가 후 합침, 생략 시 서버 기본값)",
+        pattern="^(trim|chunk)$"
+    )
 
     class Config:
         json_schema_extra = {
@@ -137,11 +255,23 @@ class EvaluateRequest(BaseModel):
         }
 
 
+class InputBudgetReport(BaseModel):
+    """평가 입력 토큰 예산 보고서 모델"""
+    mode: str = Field(..., description="적용한 방식 (full: 그대로, trim: 중간 생략, chunk: 나눠 평가 후 합침)")
+    estimated_tokens: int = Field(..., description="기사(제목+본문) 토큰 수")
+    budget: int = Field(..., description="평가 한 번의 기사 토큰 예산")
+    counted_by: str = Field(..., description="토큰 수 계산 방식 (estimate 또는 api)")
+    parts: int = Field(..., description="평가한 부분 수")
+    original_chars: int = Field(..., description="원문 본문 글자 수")
+    evaluated_chars: int = Field(..., description="평가에 사용한 본문 글자 수")
+
+
 class EvaluationResponse(BaseModel):
     """기사 평가 결과 응답 모델"""
     evaluation_summary: str = Field(..., description="평가 요약")
     scores: Dict[str, int] = Field(..., description="8차원 평가 점수 (1-10)")
     detailed_feedback: Optional[str] = Field(None, description="상세 피드백")
+    input_budget: Optional[InputBudgetReport] = Field(None, description="입력 토큰 예산 보고서 (긴 기사 처리 내역)")
 
     class Config:
         json_schema_extra = {
@@ -162,6 +292,189 @@ class EvaluationResponse(BaseModel):
         }
 
 
+class BatchEvaluateArticle(BaseModel):
+    """일괄 평가 요청의 기사 하나"""
+    article_body: str = Field(..., description="평가할 기사 본문", min_length=10)
+    article_title: Optional[str] = Field(None, description="기사 제목 (선택사항)")
+
+
+class BatchEvaluateRequest(BaseModel):
+    """일괄 평가 요청 모델"""
+    articles: List[BatchEvaluateArticle] = Field(
+        ...,
+        description="평가할 기사 목록",
+        min_length=1,
+        max_length=batch_evaluator.EVALUATION_BATCH_MAX_ITEMS
+    )
+    bypass_cache: bool = Field(
+        False,
+        description="true이면 캐시된 평가 결과가 있어도 다시 평가 (결과는 캐시에 갱신)"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "articles": [
+                    {"article_body": "서울 - 오늘 국회에서는...", "article_title": "국회, 새로운 법안 통과"},
+                    {"article_body": "부산 - 해운대구는...", "article_title": None}
+                ],
+                "bypass_cache": False
+            }
+        }
+
+
+class BatchEvaluationItem(BaseModel):
+    """일괄 평가 작업의 기사별 결과 모델"""
+    index: int = Field(..., description="요청 목록에서의 기사 순서 (0부터 시작)")
+    status: str = Field(..., description="처리 결과 (pending, ok 또는 error)")
+    evaluation: Optional[EvaluationResponse] = Field(None, description="평가 결과 (성공 시)")
+    error: Optional[str] = Field(None, description="에러 메시지 (실패 시)")
+
+
+class BatchJobResponse(BaseModel):
+    """일괄 평가 작업 상태 응답 모델"""
+    job_id: str = Field(..., description="작업 ID")
+    batch_id: Optional[str] = Field(None, description="Message Batches API 배치 ID (모든 기사가 캐시 적중이면 없음)")
+    status: str = Field(..., description="작업 상태 (in_progress, canceling, ended)")
+    created_at: str = Field(..., description="제출 시각 (UTC)")
+    updated_at: str = Field(..., description="마지막 상태 갱신 시각 (UTC)")
+    total: int = Field(..., description="전체 기사 수")
+    succeeded: int = Field(..., description="평가 완료 기사 수")
+    errored: int = Field(..., description="평가 실패 기사 수")
+    pending: int = Field(..., description="결과 대기 중인 기사 수")
+    results: Optional[List[BatchEvaluationItem]] = Field(None, description="기사별 결과 (results=true일 때)")
+
+
+class AnalyzeRequest(BaseModel):
+    """스크래핑+평가 요청 모델"""
+    url: str = Field(
+        ...,
+        description="분석할 기사 URL",
+        example="https://n.news.naver.com/mnews/article/001/0014612345"
+    )
+    bypass_cache: bool = Field(
+        False,
+        description="true이면 캐시된 스크래핑/평가 결과를 무시하고 새로 수행 (결과는 캐시에 갱신)"
+    )
+    long_article_mode: Optional[str] = Field(
+        None,
+        description="토큰 예산을 넘는 긴 기사 처리 방식 (trim: 중간 생략, chunk: 나눠 평가 후 합침, 생략 시 서버 기본값)",
+        pattern="^(trim|chunk)$"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "url": "https://n.news.naver.com/mnews/article/001/0014612345",
+                "bypass_cache": False
+            }
+        }
+
+
+class AnalyzeResponse(BaseModel):
+    """스크래핑+평가 결과 응답 모델"""
+    article: ArticleResponse = Field(..., description="스크래핑 결과")
+    evaluation: Optional[EvaluationResponse] = Field(None, description="평가 결과 (평가 실패 시 없음)")
+    evaluation_error: Optional[ErrorResponse] = Field(None, description="평가 실패 정보 (스크래핑 결과는 유지)")
+
+
+def to_article_response(article: Article) -> ArticleResponse:
+    """Article 객체를 ArticleResponse 형식으로 변환합니다."""
+    return ArticleResponse(
+        title=article.title,
+        author=article.author,
+        press=article.press,
+        published_at=article.published_at,
+        body=article.body,
+        original_url=article.original_url
+    )
+
+
+def to_evaluation_response(data: Dict) -> EvaluationResponse:
+    """평가 결과 딕셔너리를 EvaluationResponse 형식으로 변환합니다."""
+    return EvaluationResponse(
+        evaluation_summary=data.get("evaluation_summary", ""),
+        scores=data.get("scores", {}),
+        detailed_feedback=data.get("detailed_feedback"),
+        input_budget=data.get("input_budget")
+    )
+
+
+async def scrape_or_raise(url: str, use_cache: bool = True) -> Article:
+    """
+    기사를 스크래핑하고, 실패하면 /scrape와 같은 HTTP 에러를 발생시킵니다.
+
+    스크래핑 전체에 SCRAPING_DEADLINE의 시간 예산을 적용하여 응답 시간의 상한을 보장합니다.
+
+    Raises:
+        HTTPException: 잘못된 URL, 지원하지 않는 언론사 등 (400),
+            언론사 장애로 요청 중단 (503), 시간 예산 초과 (504) 또는 서버 내부 오류 (500)
+    """
+    try:
+        # 스크래핑 실행 (이벤트 루프를 막지 않는 비동기 파이프라인)
+        article: Article = await deadline.run_with_deadline(
+            scrape_article_async(url, use_cache=use_cache)
+        )
+        logger.info(f"스크래핑 성공: {article.title[:50]}...")
+        return article
+
+    except politeness.DomainUnavailableError as e:
+        # 언론사 장애 또는 요청 한도 초과 - 언론사에 요청하지 않고 바로 실패 (503 Service Unavailable)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "언론사 일시 접속 불가",
+                "detail": str(e)
+            },
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+        )
+
+    except deadline.DeadlineExceeded as e:
+        # 시간 예산 안에 끝나지 않음 (504 Gateway Timeout)
+        logger.warning(f"스크래핑 시간 초과: {url}, {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail={
+                "error": "스크래핑 시간 초과",
+                "detail": str(e)
+            }
+        )
+
+    except ValueError as e:
+        # 스크래핑 로직에서 발생한 예상된 에러 (400 Bad Request)
+        logger.warning(f"스크래핑 실패 (클라이언트 오류): {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "스크래핑 실패",
+                "detail": str(e)
+            }
+        )
+
+    except Exception as e:
+        # 예상하지 못한 서버 내부 오류 (500 Internal Server Error)
+        logger.error(f"스크래핑 실패 (서버 오류): {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "서버 내부 오류",
+                "detail": "스크래핑 처리 중 예상치 못한 오류가 발생했습니다"
+            }
+        )
+
+
+def evaluation_error(e: Exception) -> Dict[str, str]:
+    """평가 중 발생한 예외를 로그에 남기고 에러 응답 형식({"error", "detail"})으로 변환합니다."""
+    if isinstance(e, anthropic.APIError):
+        logger.error(f"Claude API 오류: {str(e)}", exc_info=True)
+        return {"error": "Claude API 오류", "detail": str(e)}
+    if isinstance(e, ValueError):
+        logger.warning(f"평가 실패 (클라이언트 오류): {str(e)}")
+        return {"error": "평가 실패", "detail": str(e)}
+    logger.error(f"평가 실패 (서버 오류): {str(e)}", exc_info=True)
+    return {"error": "서버 내부 오류", "detail": "평가 처리 중 예상치 못한 오류가 발생했습니다"}
+
+
 # API 엔드포인트
 
 @app.get("/", tags=["Root"])
@@ -186,6 +499,150 @@ async def health_check():
     }
 
 
+@app.get("/cache/stats", tags=["Admin"])
+async def cache_stats():
+    """캐시 통계 엔드포인트 - 캐시별 크기, 적중/미스 횟수, 적중률, 진행 중인 작업 합치기 통계와 Claude 프롬프트 캐시 사용량 반환"""
+    return {
+        "article": article_cache.stats(),
+        "redirect": redirect_cache.stats(),
+        "article_in_flight": article_flight.stats(),
+        "redirect_in_flight": redirect_flight.stats(),
+        "evaluation": evaluation_cache.stats(),
+        "evaluation_in_flight": evaluation_flight.stats(),
+        "prompt": usage_stats()
+    }
+
+
+# /metrics 출력 시점에 읽는 지표 - 각 모듈이 이미 집계하는 통계를 그대로 사용
+_CACHES = (article_cache, redirect_cache, evaluation_cache)
+_FLIGHTS = (article_flight, redirect_flight, evaluation_flight)
+_TOKEN_TYPES = ("input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens")
+
+metrics.CallbackMetric(
+    "cache_hits_total", "캐시 적중 횟수", ("cache",),
+    lambda: {(c.name,): c.stats()["hits"] for c in _CACHES}, type="counter"
+)
+metrics.CallbackMetric(
+    "cache_misses_total", "캐시 미스 횟수", ("cache",),
+    lambda: {(c.name,): c.stats()["misses"] for c in _CACHES}, type="counter"
+)
+metrics.CallbackMetric(
+    "cache_hit_ratio", "캐시 적중률 (서버 시작 이후)", ("cache",),
+    lambda: {(c.name,): c.stats()["hit_rate"] for c in _CACHES}
+)
+metrics.CallbackMetric(
+    "cache_entries", "캐시 항목 수", ("cache",),
+    lambda: {(c.name,): c.stats()["size"] for c in _CACHES}
+)
+metrics.CallbackMetric(
+    "in_flight_tasks", "진행 중인 스크래핑/리다이렉트 확인/평가 작업 수", ("flight",),
+    lambda: {(f.name,): f.stats()["in_flight"] for f in _FLIGHTS}
+)
+metrics.CallbackMetric(
+    "in_flight_joined_total", "진행 중인 작업에 합류한 요청 수", ("flight",),
+    lambda: {(f.name,): f.stats()["followers"] for f in _FLIGHTS}, type="counter"
+)
+metrics.CallbackMetric(
+    "circuit_open", "언론사 서킷 상태 (0: closed, 1: open, 0.5: half_open)", ("domain",),
+    lambda: {
+        (domain,): {politeness.CLOSED: 0, politeness.OPEN: 1}.get(info["state"], 0.5)
+        for domain, info in politeness.stats().items()
+    }
+)
+metrics.CallbackMetric(
+    "domain_rejected_total", "서킷이 열려 있거나 요청 한도 초과로 보내지 않은 요청 수", ("domain",),
+    lambda: {(domain,): info["rejected"] for domain, info in politeness.stats().items()}, type="counter"
+)
+metrics.CallbackMetric(
+    "hedged_requests_total", "헤지 요청 수 (result: sent 보낸 수, won 먼저 끝난 수)", ("result",),
+    lambda: {(key,): value for key, value in fetcher.hedge_counts.items()}, type="counter"
+)
+metrics.CallbackMetric(
+    "llm_tokens_total", "Claude API 토큰 사용량", ("type",),
+    lambda: {(key,): usage_stats()[key] for key in _TOKEN_TYPES}, type="counter"
+)
+
+
+@app.get("/metrics", tags=["Admin"], response_class=Response)
+async def metrics_endpoint():
+    """지표 엔드포인트 - 단계별 지연 시간 히스토그램, 언론사별 성공/실패, 캐시 적중률, 진행 중인 작업 수를 Prometheus 텍스트 형식으로 반환"""
+    return Response(content=metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    X-Admin-Token 헤더가 ADMIN_TOKEN과 일치하지 않으면 에러를 발생시킵니다.
+
+    Raises:
+        HTTPException: ADMIN_TOKEN이 설정되지 않았으면 403, 토큰이 없거나 다르면 401
+    """
+    if not ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "error": "관리자 토큰 미설정",
+                "detail": "ADMIN_TOKEN 환경 변수가 설정되지 않아 관리 엔드포인트를 사용할 수 없습니다"
+            }
+        )
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "error": "인증 실패",
+                "detail": "X-Admin-Token 헤더의 관리자 토큰이 올바르지 않습니다"
+            }
+        )
+
+
+ADMIN_ERROR_RESPONSES = {
+    401: {
+        "description": "관리자 토큰 누락 또는 불일치",
+        "model": ErrorResponse
+    },
+    403: {
+        "description": "ADMIN_TOKEN 미설정",
+        "model": ErrorResponse
+    }
+}
+
+
+@app.get(
+    "/admin/domains",
+    responses=ADMIN_ERROR_RESPONSES,
+    dependencies=[Depends(require_admin_token)],
+    tags=["Admin"]
+)
+async def domain_stats():
+    """언론사별 상태 엔드포인트 - 서킷 상태(closed/open/half_open), 연속 실패 횟수, 남은 요청 토큰, 거부 횟수 반환"""
+    return politeness.stats()
+
+
+@app.post(
+    "/admin/domains/{domain}/reset",
+    responses={
+        **ADMIN_ERROR_RESPONSES,
+        404: {
+            "description": "요청한 적이 없는 언론사",
+            "model": ErrorResponse
+        }
+    },
+    dependencies=[Depends(require_admin_token)],
+    tags=["Admin"]
+)
+async def reset_domain(domain: str):
+    """언론사 서킷 초기화 엔드포인트 - 장애 복구를 확인한 뒤 시험 요청을 기다리지 않고 요청을 재개"""
+    stats = politeness.reset(domain)
+    if stats is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "언론사 없음",
+                "detail": f"요청 기록이 없는 언론사입니다: {domain}"
+            }
+        )
+    return stats
+
+
 @app.post(
     "/scrape",
     response_model=ArticleResponse,
@@ -201,6 +658,14 @@ async def health_check():
         500: {
             "description": "서버 내부 오류 (스크래핑 실패, 네트워크 오류 등)",
             "model": ErrorResponse
+        },
+        503: {
+            "description": "언론사 접속 장애로 요청 일시 중단 (Retry-After 헤더 참고)",
+            "model": ErrorResponse
+        },
+        504: {
+            "description": "스크래핑 시간 예산(SCRAPING_DEADLINE) 초과",
+            "model": ErrorResponse
         }
     },
     tags=["Scraping"]
@@ -242,42 +707,112 @@ async def scrape_news_article(request: ScrapeRequest):
     """
     logger.info(f"스크래핑 요청 수신: {request.url}")
 
-    try:
-        # 스크래핑 실행
-        article: Article = scrape_article(request.url)
+    article = await scrape_or_raise(request.url, use_cache=not request.bypass_cache)
 
-        logger.info(f"스크래핑 성공: {article.title[:50]}...")
+    # Article 객체를 ArticleResponse 형식으로 변환
+    return to_article_response(article)
 
-        # Article 객체를 ArticleResponse 형식으로 변환
-        return ArticleResponse(
-            title=article.title,
-            author=article.author,
-            press=article.press,
-            published_at=article.published_at,
-            body=article.body,
-            original_url=article.original_url
-        )
 
-    except ValueError as e:
-        # 스크래핑 로직에서 발생한 예상된 에러 (400 Bad Request)
-        logger.warning(f"스크래핑 실패 (클라이언트 오류): {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "error": "스크래핑 실패",
-                "detail": str(e)
-            }
-        )
+@app.post(
+    "/scrape/batch",
+    responses={
+        200: {
+            "description": "URL별 결과를 완료 순서대로 NDJSON (한 줄에 BatchScrapeResult 하나)으로 스트리밍",
+            "content": {"application/x-ndjson": {}}
+        },
+        422: {
+            "description": "잘못된 요청 (URL 목록 누락, 최대 개수 초과 등)"
+        }
+    },
+    tags=["Scraping"]
+)
+async def scrape_news_articles_batch(request: BatchScrapeRequest):
+    """
+    여러 기사 URL을 동시에 스크래핑하고, 완료되는 순서대로 결과를 NDJSON으로 스트리밍합니다.
 
-    except Exception as e:
-        # 예상하지 못한 서버 내부 오류 (500 Internal Server Error)
-        logger.error(f"스크래핑 실패 (서버 오류): {str(e)}", exc_info=True)
+    전체 동시 실행 수(BATCH_MAX_CONCURRENCY)와 언론사별 동시 실행 수
+    (BATCH_PER_DOMAIN_CONCURRENCY)가 제한되며, 느린 언론사가 빠른 언론사의 결과를 막지 않습니다.
+    URL별 실패는 전체 요청을 중단하지 않고 해당 줄에 에러로 기록됩니다.
+
+    **요청 예시:**
+    ```json
+    {
+        "urls": [
+            "https://n.news.naver.com/mnews/article/001/0014612345",
+            "https://www.yna.co.kr/view/AKR20251115000100001"
+        ]
+    }
+    ```
+
+    **응답 예시 (application/x-ndjson):**
+    ```
+    {"index": 1, "url": "https://www.yna.co.kr/...", "status": "ok", "article": {...}}
+    {"index": 0, "url": "https://n.news.naver.com/...", "status": "error", "error": "스크래핑 실패", "detail": "..."}
+    ```
+    """
+    logger.info(f"일괄 스크래핑 요청 수신: {len(request.urls)}건")
+
+    async def stream_results() -> AsyncIterator[str]:
+        succeeded = 0
+        async for index, url, result in scrape_articles_async(
+            request.urls,
+            use_cache=not request.bypass_cache
+        ):
+            if isinstance(result, Article):
+                succeeded += 1
+                item = BatchScrapeResult(
+                    index=index,
+                    url=url,
+                    status="ok",
+                    article=to_article_response(result)
+                )
+            elif isinstance(result, deadline.DeadlineExceeded):
+                logger.warning(f"스크래핑 시간 초과: {url}, {str(result)}")
+                item = BatchScrapeResult(
+                    index=index,
+                    url=url,
+                    status="error",
+                    error="스크래핑 시간 초과",
+                    detail=str(result)
+                )
+            elif isinstance(result, ValueError):
+                logger.warning(f"스크래핑 실패 (클라이언트 오류): {url}, {str(result)}")
+                item = BatchScrapeResult(
+                    index=index,
+                    url=url,
+                    status="error",
+                    error="스크래핑 실패",
+                    detail=str(result)
+                )
+            else:
+                logger.error(f"스크래핑 실패 (서버 오류): {url}, {str(result)}", exc_info=result)
+                item = BatchScrapeResult(
+                    index=index,
+                    url=url,
+                    status="error",
+                    error="서버 내부 오류",
+                    detail="스크래핑 처리 중 예상치 못한 오류가 발생했습니다"
+                )
+            yield item.model_dump_json(exclude_none=True) + "\n"
+
+        logger.info(f"일괄 스크래핑 완료: {succeeded}/{len(request.urls)}건 성공")
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
+# Anthropic 클라이언트가 없을 때의 에러 응답
+MISSING_API_KEY_ERROR = {
+    "error": "API 키 미설정",
+    "detail": "ANTHROPIC_API_KEY 환경 변수가 설정되지 않았습니다"
+}
+
+
+def require_anthropic_client() -> None:
+    """Anthropic 클라이언트가 없으면 400 에러를 발생시킵니다."""
+    if not anthropic_client:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "서버 내부 오류",
-                "detail": "스크래핑 처리 중 예상치 못한 오류가 발생했습니다"
-            }
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=MISSING_API_KEY_ERROR
         )
 
 
@@ -343,94 +878,20 @@ async def evaluate_article(request: EvaluateRequest):
     logger.info("기사 평가 요청 수신")
 
     # Anthropic 클라이언트 확인
-    if not anthropic_client:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "error": "API 키 미설정",
-                "detail": "ANTHROPIC_API_KEY 환경 변수가 설정되지 않았습니다"
-            }
-        )
+    require_anthropic_client()
 
     try:
-        # Claude에게 보낼 프롬프트 구성
-        evaluation_prompt = f"""당신은 저널리즘 윤리 전문가입니다. 다음 기사를 8가지 차원으로 평가해주세요.
-
-**평가 기준:**
-1. 진실성 (Truth): 사실과 의견 구분, 출처 명시
-2. 정확성 (Accuracy): 통계 정확성, 인용 정확성
-3. 공정성 (Fairness): 다양한 관점, 균형 잡힌 보도
-4. 투명성 (Transparency): 출처 공개, 이해관계 명시
-5. 맥락 (Context): 배경 정보, 역사적 맥락
-6. 인권 존중 (Human Rights): 취약 집단 보호, 차별 없는 표현
-7. 책임성 (Accountability): 오류 정정, 피해 구제
-8. 독립성 (Independence): 외부 압력으로부터 자유
-
-**기사 제목:** {request.article_title if request.article_title else "제목 없음"}
-
-**기사 본문:**
-{request.article_body}
-
-**요구사항:**
-1. 각 차원별로 1-10점으로 평가하세요 (10점이 가장 우수)
-2. 전체 평가 요약을 2-3문장으로 작성하세요
-3. 상세 피드백을 제공하세요 (개선이 필요한 부분 중심)
-
-**응답 형식 (JSON):**
-{{
-  "evaluation_summary": "전체 평가 요약 (2-3문장)",
-  "scores": {{
-    "진실성": <점수>,
-    "정확성": <점수>,
-    "공정성": <점수>,
-    "투명성": <점수>,
-    "맥락": <점수>,
-    "인권_존중": <점수>,
-    "책임성": <점수>,
-    "독립성": <점수>
-  }},
-  "detailed_feedback": "상세 피드백 (개선이 필요한 부분 중심)"
-}}
-
-JSON 형식으로만 응답하세요. 다른 텍스트는 포함하지 마세요."""
-
-        # Claude API 호출
-        logger.info("Claude API 호출 시작")
-        message = anthropic_client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2048,
-            messages=[
-                {
-                    "role": "user",
-                    "content": evaluation_prompt
-                }
-            ]
+        evaluation_data = await evaluate(
+            anthropic_client,
+            request.article_body,
+            request.article_title,
+            use_cache=not request.bypass_cache,
+            long_article_mode=request.long_article_mode
         )
 
-        # 응답 파싱
-        response_text = message.content[0].text
-        logger.info(f"Claude API 응답 수신: {len(response_text)} 문자")
-
-        # JSON 파싱
-        import json
-        try:
-            evaluation_data = json.loads(response_text)
-        except json.JSONDecodeError:
-            # JSON이 아닌 경우, 텍스트에서 JSON 부분 추출 시도
-            import re
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                evaluation_data = json.loads(json_match.group())
-            else:
-                raise ValueError("Claude API 응답을 JSON으로 파싱할 수 없습니다")
-
         logger.info("기사 평가 완료")
 
-        return EvaluationResponse(
-            evaluation_summary=evaluation_data.get("evaluation_summary", ""),
-            scores=evaluation_data.get("scores", {}),
-            detailed_feedback=evaluation_data.get("detailed_feedback")
-        )
+        return to_evaluation_response(evaluation_data)
 
     except anthropic.APIError as e:
         logger.error(f"Claude API 오류: {str(e)}", exc_info=True)
@@ -463,6 +924,380 @@ JSON 형식으로만 응답하세요. 다른 텍스트는 포함하지 마세요
         )
 
 
+# 프록시(nginx 등)가 이벤트를 모아서 보내지 않도록 버퍼링 비활성화
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def sse_event(event: str, data: Dict) -> str:
+    """Server-Sent Events 프레임 하나를 만듭니다."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def evaluation_events(
+    article_body: str,
+    article_title: Optional[str],
+    use_cache: bool = True,
+    long_article_mode: Optional[str] = None
+) -> AsyncIterator[str]:
+    """
+    평가 이벤트를 SSE 프레임으로 만듭니다. (/evaluate/stream, /analyze/stream 공용)
+
+    실패는 스트리밍 도중 상태 코드를 바꿀 수 없으므로 마지막 error 이벤트로 전송합니다.
+    """
+    try:
+        async for event, data in stream_evaluation(
+            anthropic_client,
+            article_body,
+            article_title,
+            use_cache=use_cache,
+            long_article_mode=long_article_mode
+        ):
+            if event == "result":
+                data = to_evaluation_response(data).model_dump()
+            yield sse_event(event, data)
+        logger.info("기사 스트리밍 평가 완료")
+
+    except Exception as e:
+        yield sse_event("error", evaluation_error(e))
+
+
+@app.post(
+    "/evaluate/stream",
+    responses={
+        200: {
+            "description": "평가 내용을 생성되는 대로 Server-Sent Events로 스트리밍",
+            "content": {"text/event-stream": {}}
+        },
+        400: {
+            "description": "잘못된 요청 (기사 본문 누락, API 키 미설정 등)",
+            "model": ErrorResponse
+        }
+    },
+    tags=["Evaluation"]
+)
+async def evaluate_article_stream(request: EvaluateRequest):
+    """
+    /evaluate와 같은 평가를 수행하되, Claude가 생성하는 내용을 받는 대로 SSE로 스트리밍합니다.
+
+    전체 응답을 기다리지 않고 요약과 점수를 먼저 보여줄 수 있습니다.
+    캐시에 적중하면 result 이벤트 하나만 전송합니다.
+
+    **이벤트:**
+    - budget: 긴 기사의 입력을 조정한 경우 입력 토큰 예산 보고서 (첫 이벤트)
+    - summary: `{"delta": "요약에 새로 추가된 텍스트"}`
+    - score: `{"key": "진실성", "value": 8}` (값이 확정된 점수만)
+    - feedback: `{"delta": "상세 피드백에 새로 추가된 텍스트"}`
+    - result: 전체 평가 결과 (/evaluate 응답과 같은 형식, 마지막 이벤트)
+    - error: `{"error": "...", "detail": "..."}` (스트리밍 도중 실패한 경우, 마지막 이벤트)
+
+    **응답 예시 (text/event-stream):**
+    ```
+    event: summary
+    data: {"delta": "이 기사는 전반적으로"}
+
+    event: score
+    data: {"key": "진실성", "value": 8}
+
+    event: result
+    data: {"evaluation_summary": "...", "scores": {...}, "detailed_feedback": "..."}
+    ```
+    """
+    logger.info("기사 스트리밍 평가 요청 수신")
+
+    # 스트리밍이 시작되면 상태 코드를 바꿀 수 없으므로 API 키는 미리 확인
+    require_anthropic_client()
+
+    return StreamingResponse(
+        evaluation_events(
+            request.article_body,
+            request.article_title,
+            use_cache=not request.bypass_cache,
+            long_article_mode=request.long_article_mode
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+@app.post(
+    "/analyze",
+    response_model=AnalyzeResponse,
+    responses={
+        200: {
+            "description": "스크래핑 성공 (평가 실패 시 evaluation 대신 evaluation_error 포함)",
+            "model": AnalyzeResponse
+        },
+        400: {
+            "description": "잘못된 요청 (URL 형식 오류, 지원하지 않는 언론사 등)",
+            "model": ErrorResponse
+        },
+        500: {
+            "description": "서버 내부 오류 (스크래핑 실패, 네트워크 오류 등)",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "언론사 접속 장애로 요청 일시 중단 (Retry-After 헤더 참고)",
+            "model": ErrorResponse
+        },
+        504: {
+            "description": "스크래핑 시간 예산(SCRAPING_DEADLINE) 초과",
+            "model": ErrorResponse
+        }
+    },
+    tags=["Analysis"]
+)
+async def analyze_article(request: AnalyzeRequest):
+    """
+    기사 URL을 받아 서버에서 스크래핑과 평가를 한 번에 수행합니다.
+
+    /scrape 후 받은 본문을 다시 /evaluate로 올리는 두 번의 왕복 대신 한 번의 요청으로
+    기사와 평가 결과를 함께 받습니다. 스크래핑 실패는 /scrape와 같은 에러로 응답하고,
+    평가 실패(API 키 미설정 포함)는 스크래핑 결과를 유지한 채 evaluation_error로 알려줍니다.
+
+    **요청 예시:**
+    ```json
+    {
+        "url": "https://n.news.naver.com/mnews/article/001/0014612345"
+    }
+    ```
+
+    **성공 응답 예시 (200):**
+    ```json
+    {
+        "article": {"title": "기사 제목", "body": "기사 본문 내용...", ...},
+        "evaluation": {"evaluation_summary": "...", "scores": {...}, "detailed_feedback": "..."}
+    }
+    ```
+    """
+    logger.info(f"기사 분석 요청 수신: {request.url}")
+
+    article = await scrape_or_raise(request.url, use_cache=not request.bypass_cache)
+
+    if not anthropic_client:
+        return AnalyzeResponse(
+            article=to_article_response(article),
+            evaluation_error=ErrorResponse(**MISSING_API_KEY_ERROR)
+        )
+
+    try:
+        evaluation_data = await evaluate(
+            anthropic_client,
+            article.body,
+            article.title,
+            use_cache=not request.bypass_cache,
+            long_article_mode=request.long_article_mode
+        )
+    except Exception as e:
+        return AnalyzeResponse(
+            article=to_article_response(article),
+            evaluation_error=ErrorResponse(**evaluation_error(e))
+        )
+
+    logger.info("기사 분석 완료")
+    return AnalyzeResponse(
+        article=to_article_response(article),
+        evaluation=to_evaluation_response(evaluation_data)
+    )
+
+
+@app.post(
+    "/analyze/stream",
+    responses={
+        200: {
+            "description": "스크래핑한 기사를 먼저 보내고 평가 내용을 생성되는 대로 Server-Sent Events로 스트리밍",
+            "content": {"text/event-stream": {}}
+        },
+        400: {
+            "description": "잘못된 요청 (URL 형식 오류, 지원하지 않는 언론사 등)",
+            "model": ErrorResponse
+        },
+        500: {
+            "description": "서버 내부 오류 (스크래핑 실패, 네트워크 오류 등)",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "언론사 접속 장애로 요청 일시 중단 (Retry-After 헤더 참고)",
+            "model": ErrorResponse
+        },
+        504: {
+            "description": "스크래핑 시간 예산(SCRAPING_DEADLINE) 초과",
+            "model": ErrorResponse
+        }
+    },
+    tags=["Analysis"]
+)
+async def analyze_article_stream(request: AnalyzeRequest):
+    """
+    /analyze와 같은 분석을 수행하되, 기사를 먼저 보내고 평가 내용을 SSE로 스트리밍합니다.
+
+    스크래핑은 응답을 시작하기 전에 끝내므로 스크래핑 실패는 /scrape와 같은 상태 코드로 응답합니다.
+    첫 이벤트(article)로 기사를 받아 바로 표시하고, 이후 이벤트는 /evaluate/stream과 같습니다.
+    API 키가 설정되지 않았으면 article 다음에 error 이벤트를 보냅니다.
+
+    **이벤트:**
+    - article: 스크래핑 결과 (/scrape 응답과 같은 형식, 첫 이벤트)
+    - budget, summary, score, feedback, result, error: /evaluate/stream 참고
+
+    **응답 예시 (text/event-stream):**
+    ```
+    event: article
+    data: {"title": "기사 제목", "body": "기사 본문 내용...", ...}
+
+    event: summary
+    data: {"delta": "이 기사는 전반적으로"}
+
+    event: result
+    data: {"evaluation_summary": "...", "scores": {...}, "detailed_feedback": "..."}
+    ```
+    """
+    logger.info(f"기사 스트리밍 분석 요청 수신: {request.url}")
+
+    article = await scrape_or_raise(request.url, use_cache=not request.bypass_cache)
+
+    async def stream_events() -> AsyncIterator[str]:
+        yield sse_event("article", to_article_response(article).model_dump())
+        if not anthropic_client:
+            yield sse_event("error", MISSING_API_KEY_ERROR)
+            return
+        async for frame in evaluation_events(
+            article.body,
+            article.title,
+            use_cache=not request.bypass_cache,
+            long_article_mode=request.long_article_mode
+        ):
+            yield frame
+
+    return StreamingResponse(
+        stream_events(),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+@app.post(
+    "/evaluate/batch",
+    response_model=BatchJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        202: {
+            "description": "작업 제출 성공 (결과는 GET /evaluate/batch/{job_id}로 조회)",
+            "model": BatchJobResponse
+        },
+        400: {
+            "description": "잘못된 요청 (API 키 미설정 등)",
+            "model": ErrorResponse
+        },
+        500: {
+            "description": "서버 내부 오류 (배치 제출 실패 등)",
+            "model": ErrorResponse
+        }
+    },
+    tags=["Evaluation"]
+)
+async def submit_batch_evaluation(request: BatchEvaluateRequest):
+    """
+    여러 기사를 Anthropic Message Batches API로 일괄 평가하는 작업을 제출합니다.
+
+    보관된 기사를 대량으로 다시 평가할 때 사용합니다. 배치는 보통 수 분에서 수 시간 안에
+    처리되며, 서버가 주기적으로(EVALUATION_BATCH_POLL_INTERVAL) 상태를 조회하여 결과를 저장합니다.
+    평가 캐시에 결과가 있는 기사는 배치에 넣지 않고 바로 완료 처리합니다.
+
+    **요청 예시:**
+    ```json
+    {
+        "articles": [
+            {"article_body": "서울 - 오늘 국회에서...", "article_title": "국회, 새로운 법안 통과"}
+        ]
+    }
+    ```
+    """
+    logger.info(f"일괄 평가 요청 수신: {len(request.articles)}건")
+    require_anthropic_client()
+
+    try:
+        job = await batch_evaluator.submit_job(
+            anthropic_client,
+            [(article.article_body, article.article_title) for article in request.articles],
+            use_cache=not request.bypass_cache
+        )
+        return BatchJobResponse(**job)
+
+    except anthropic.APIError as e:
+        logger.error(f"Claude API 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "Claude API 오류",
+                "detail": str(e)
+            }
+        )
+
+    except ValueError as e:
+        logger.warning(f"일괄 평가 제출 실패 (클라이언트 오류): {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "일괄 평가 제출 실패",
+                "detail": str(e)
+            }
+        )
+
+
+@app.get("/evaluate/batch", response_model=List[BatchJobResponse], tags=["Evaluation"])
+async def list_batch_evaluations(limit: int = 50):
+    """최근 일괄 평가 작업 목록을 반환합니다 (기사별 결과 제외)."""
+    jobs = await asyncio.to_thread(batch_evaluator.job_store.list_jobs, limit)
+    return [BatchJobResponse(**job) for job in jobs]
+
+
+@app.get(
+    "/evaluate/batch/{job_id}",
+    response_model=BatchJobResponse,
+    responses={
+        404: {
+            "description": "없는 작업",
+            "model": ErrorResponse
+        },
+        500: {
+            "description": "서버 내부 오류 (배치 조회 실패 등)",
+            "model": ErrorResponse
+        }
+    },
+    tags=["Evaluation"]
+)
+async def get_batch_evaluation(job_id: str, results: bool = False, refresh: bool = False):
+    """
+    일괄 평가 작업 상태를 조회합니다.
+
+    - results=true: 기사별 평가 결과를 함께 반환합니다.
+    - refresh=true: 다음 폴링 주기를 기다리지 않고 배치 상태를 바로 조회합니다.
+    """
+    if refresh and await asyncio.to_thread(batch_evaluator.job_store.get_job, job_id) is not None:
+        require_anthropic_client()
+        try:
+            await batch_evaluator.poll_job(anthropic_client, job_id)
+        except anthropic.APIError as e:
+            logger.error(f"Claude API 오류: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "error": "Claude API 오류",
+                    "detail": str(e)
+                }
+            )
+
+    job = await asyncio.to_thread(batch_evaluator.job_store.get_job, job_id, include_results=results)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "작업 없음",
+                "detail": f"일괄 평가 작업을 찾을 수 없습니다: {job_id}"
+            }
+        )
+    return BatchJobResponse(**job)
+
+
 if __name__ == "__main__":
     import uvicorn
 
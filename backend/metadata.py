@@ -0,0 +1,230 @@
+"""
+기사 메타데이터 추출 모듈
+
+대부분의 언론사는 <head>에 구조화된 메타데이터를 넣어 둡니다.
+- JSON-LD (<script type="application/ld+json">의 NewsArticle 등, <body>에 두는 언론사도 있음)
+- OpenGraph / article 메타 태그 (og:title, article:published_time 등)
+
+스크래퍼는 CSS 셀렉터 목록으로 본문 영역을 여러 번 탐색하기 전에 이 모듈로
+<head>와 JSON-LD 스크립트만 읽어 제목, 기자명, 발행일시를 먼저 찾고, 빠진 항목만 셀렉터로 찾습니다.
+발행일시는 시간대를 반영하여 한국 표준시(KST) 기준 "YYYY-MM-DD HH:MM"으로 변환합니다.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+import json
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# 한국 표준시 (시간대 정보가 없는 발행일시는 KST로 간주)
+KST = timezone(timedelta(hours=9), "KST")
+
+# "2025.11.14 09:30", "2025-11-14 09:30:00+09:00", "2025/11/14T09:30" 등
+_DATETIME_PATTERN = re.compile(
+    r'(\d{4})[.\-/]\s*(\d{1,2})[.\-/]\s*(\d{1,2})\.?'
+    r'(?:[T\s]+(\d{1,2}):(\d{2})(?::(\d{2}))?(?:\.\d+)?)?'
+    r'\s*(Z|[+-]\d{2}:?\d{2})?'
+)
+
+# 기사로 간주할 JSON-LD @type (NewsArticle, ReportageNewsArticle, Article 등)
+_ARTICLE_TYPE = re.compile(r'Article$')
+
+# 메타 태그 우선순위 (앞에 있는 태그를 먼저 사용)
+TITLE_META = ("og:title", "twitter:title")
+AUTHOR_META = ("author", "dable:author", "article:author")
+PUBLISHED_META = ("article:published_time", "og:article:published_time", "dable:published_time", "pubdate")
+
+
+@dataclass
+class ArticleMetadata:
+    """
+    <head>에서 찾은 기사 메타데이터 (찾지 못한 항목은 None)
+
+    Attributes:
+        title: 기사 제목
+        author: 기자명 (여러 명이면 ", "로 연결)
+        published_at: 발행일시 (KST 기준 YYYY-MM-DD HH:MM 형식)
+    """
+    title: Optional[str] = None
+    author: Optional[str] = None
+    published_at: Optional[str] = None
+
+
+def normalize_datetime(value: str) -> str:
+    """
+    날짜/시간 문자열을 KST 기준 "YYYY-MM-DD HH:MM"으로 변환합니다.
+
+    시간대 정보(+09:00, Z 등)가 있으면 KST로 환산하고, 없으면 KST로 간주합니다.
+    시각 없이 날짜만 있으면 "YYYY-MM-DD"를 반환합니다.
+
+    Args:
+        value: ISO 8601 또는 "YYYY.MM.DD HH:MM" 형식의 문자열
+
+    Returns:
+        "YYYY-MM-DD HH:MM" (날짜만 있으면 "YYYY-MM-DD") 형식의 문자열
+
+    Raises:
+        ValueError: 날짜를 해석할 수 없는 경우
+
+    Examples:
+        >>> normalize_datetime("2025-11-14T01:30:00Z")
+        "2025-11-14 10:30"
+        >>> normalize_datetime("2025.11.14 09:30")
+        "2025-11-14 09:30"
+    """
+    text = value.strip()
+    try:
+        if len(text) == 10:
+            # 날짜만 있는 ISO 값 (datetime.fromisoformat은 00:00으로 해석하므로 별도 처리)
+            return date.fromisoformat(text).isoformat()
+        dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        match = _DATETIME_PATTERN.search(text)
+        if not match:
+            raise ValueError(f"날짜 형식을 해석할 수 없습니다: {value}")
+        year, month, day, hour, minute, second, offset = match.groups()
+        if hour is None and re.search(r'\d{1,2}:\d{2}', text[match.end():]):
+            # "2025.11.14. 오후 2:30"처럼 시각을 해석할 수 없는 형식
+            raise ValueError(f"날짜 형식을 해석할 수 없습니다: {value}")
+        if hour is None:
+            return date(int(year), int(month), int(day)).isoformat()
+        dt = datetime(
+            int(year), int(month), int(day),
+            int(hour), int(minute), int(second or 0)
+        )
+        if offset:
+            if offset == "Z":
+                tz = timezone.utc
+            else:
+                sign = -1 if offset[0] == "-" else 1
+                digits = offset[1:].replace(":", "")
+                tz = timezone(sign * timedelta(hours=int(digits[:2]), minutes=int(digits[2:])))
+            dt = dt.replace(tzinfo=tz)
+
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(KST)
+    return dt.strftime("%Y-%m-%d %H:%M")
+
+
+def _iter_json_ld_nodes(data: Any) -> Iterator[Dict[str, Any]]:
+    """JSON-LD 값에서 객체를 모두 꺼냅니다 (배열과 @graph 포함)."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_json_ld_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _iter_json_ld_nodes(data["@graph"])
+
+
+def _is_article(node: Dict[str, Any]) -> bool:
+    """JSON-LD 객체가 기사 유형인지 확인합니다."""
+    types = node.get("@type")
+    if isinstance(types, str):
+        types = [types]
+    return any(isinstance(t, str) and _ARTICLE_TYPE.search(t) for t in types or ())
+
+
+def _person_names(value: Any) -> List[str]:
+    """JSON-LD author 값에서 사람 이름만 꺼냅니다 (단체는 제외)."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [name for item in value for name in _person_names(item)]
+    if isinstance(value, dict) and value.get("@type") != "Organization":
+        name = value.get("name")
+        return [name] if isinstance(name, str) else []
+    return []
+
+
+def _clean(value: Optional[str]) -> Optional[str]:
+    """공백을 정리하고 빈 문자열은 None으로 바꿉니다."""
+    if not isinstance(value, str):
+        return None
+    value = re.sub(r'\s+', ' ', value).strip()
+    return value or None
+
+
+def _from_json_ld(scripts: List[str]) -> ArticleMetadata:
+    """JSON-LD 스크립트 본문 목록에서 첫 번째 기사 객체의 메타데이터를 읽습니다."""
+    for text in scripts:
+        try:
+            data = json.loads(text, strict=False)
+        except ValueError:
+            continue
+        for node in _iter_json_ld_nodes(data):
+            if not _is_article(node):
+                continue
+            names = [name for name in map(_clean, _person_names(node.get("author"))) if name]
+            return ArticleMetadata(
+                title=_clean(node.get("headline")),
+                author=", ".join(dict.fromkeys(names)) or None,
+                published_at=_clean(node.get("datePublished")),
+            )
+    return ArticleMetadata()
+
+
+def extract_metadata(soup) -> ArticleMetadata:
+    """
+    문서의 <head>에서 기사 메타데이터를 추출합니다.
+
+    JSON-LD 기사 객체를 우선 사용하고, 빠진 항목은 메타 태그에서 찾습니다.
+    메타 태그는 <head>에서만, JSON-LD 스크립트는 <body>에 있는 것까지 문서 전체에서 찾습니다.
+
+    Args:
+        soup: parsers.parse_html이 반환한 문서 객체
+
+    Returns:
+        ArticleMetadata 객체 (찾지 못한 항목은 None)
+    """
+    scripts: List[str] = [elem.get_text() for elem in soup.select('script[type="application/ld+json"]')]
+    meta: Dict[str, str] = {}
+    head = soup.find("head")
+    for elem in head.select("meta") if head else ():
+        key = elem.get("property") or elem.get("name") or elem.get("itemprop")
+        content = elem.get("content")
+        if key and content and key.lower() not in meta:
+            meta[key.lower()] = content
+
+    result = _from_json_ld(scripts) if scripts else ArticleMetadata()
+    if result.title is None:
+        result.title = next((_clean(meta[k]) for k in TITLE_META if _clean(meta.get(k))), None)
+    if result.author is None:
+        # article:author는 기자 페이지 URL인 경우가 많으므로 제외
+        result.author = next(
+            (_clean(meta[k]) for k in AUTHOR_META
+             if _clean(meta.get(k)) and not meta[k].startswith("http")),
+            None
+        )
+    if result.published_at is None:
+        result.published_at = next((_clean(meta[k]) for k in PUBLISHED_META if _clean(meta.get(k))), None)
+
+    # 발행일시는 KST로 변환하고, 해석할 수 없으면 셀렉터로 다시 찾도록 비웁니다.
+    if result.published_at is not None:
+        try:
+            result.published_at = normalize_datetime(result.published_at)
+        except ValueError:
+            logger.debug(f"메타데이터 발행일시 해석 실패: {result.published_at}")
+            result.published_at = None
+    return result
+
+
+def strip_site_suffix(title: str, *site_names: Optional[str]) -> str:
+    """
+    og:title 등에 붙는 " | 언론사명", " - 언론사명" 꼬리를 제거합니다.
+
+    Args:
+        title: 제목
+        site_names: 제거할 언론사/서비스 이름
+
+    Returns:
+        꼬리를 제거한 제목 (제거 후 빈 문자열이 되면 원래 제목)
+    """
+    for name in filter(None, site_names):
+        stripped = re.sub(r'\s*[|\-–:]\s*' + re.escape(name) + r'\s*$', '', title)
+        if stripped and stripped != title:
+            return stripped
+    return title
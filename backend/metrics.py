@@ -0,0 +1,312 @@
+"""
+지표 수집 모듈
+
+Prometheus 텍스트 형식(0.0.4)으로 내보낼 카운터, 게이지, 히스토그램을 제공합니다.
+외부 라이브러리 없이 프로세스 안에 값을 모으며, /metrics 엔드포인트가 render()로 출력합니다.
+
+수집 지표:
+- scrape_stage_seconds: 스크래핑 단계별(resolve, fetch, parse, cleanup) 소요 시간
+- scrape_results_total: 언론사별 스크래핑 요청 결과 (ok, cached, error, timeout, unavailable)
+- llm_request_seconds / llm_first_token_seconds: Claude API 호출 종류별 소요 시간, 스트리밍 첫 응답 시간
+- http_request_duration_seconds / http_requests_in_flight: 엔드포인트별 응답 시간과 처리 중인 요청 수
+- 캐시 적중/미스, single-flight 진행 중인 작업 수 등은 CallbackMetric으로 출력 시점에 읽습니다.
+
+멀티 워커(uvicorn --workers)로 실행하면 워커마다 따로 집계됩니다.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+import math
+import threading
+import time
+
+# 지연 시간 히스토그램 기본 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+_registry: List["_Metric"] = []
+_lock = threading.Lock()
+
+
+def _escape(value: str) -> str:
+    """레이블 값의 역슬래시, 큰따옴표, 줄바꿈을 이스케이프합니다."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """
+    지표 공통 구조
+
+    Attributes:
+        name: 지표 이름
+        help: 설명
+        labelnames: 레이블 이름 목록
+    """
+
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        _registry.append(self)
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} 레이블이 맞지 않습니다: {sorted(labels)} (필요: {self.labelnames})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], Sequence[str], float]]:
+        """(이름, 레이블 이름, 레이블 값, 값) 목록을 반환합니다."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        for name, labelnames, labelvalues, value in self.samples():
+            lines.append(f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """증가만 하는 누적 값"""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """값을 amount만큼 늘립니다."""
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with _lock:
+            items = sorted(self._values.items())
+        for values, value in items:
+            yield self.name, self.labelnames, values, value
+
+
+class Gauge(_Metric):
+    """늘거나 줄어드는 현재 값"""
+
+    type = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """값을 amount만큼 늘립니다."""
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        """값을 amount만큼 줄입니다."""
+        self.inc(-amount, **labels)
+
+    @contextmanager
+    def track(self, **labels: Any) -> Iterator[None]:
+        """구간 안에 있는 동안 값을 1 늘립니다. (처리 중인 작업 수)"""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def samples(self):
+        with _lock:
+            items = sorted(self._values.items())
+        for values, value in items:
+            yield self.name, self.labelnames, values, value
+
+
+class Histogram(_Metric):
+    """
+    관측값 분포 (버킷별 누적 개수, 합계, 개수)
+
+    Attributes:
+        buckets: 버킷 상한 목록 (오름차순, +Inf는 자동 추가)
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 값 → [버킷별 개수..., +Inf 개수], 합계
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """관측값 하나를 기록합니다."""
+        key = self._key(labels)
+        with _lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """구간의 소요 시간(초)을 기록합니다. 예외가 발생해도 기록합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self):
+        with _lock:
+            items = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+        bucket_labels = self.labelnames + ("le",)
+        for values, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", bucket_labels, values + (_format_value(bound),), cumulative
+            yield f"{self.name}_sum", self.labelnames, values, total
+            yield f"{self.name}_count", self.labelnames, values, cumulative
+
+
+class CallbackMetric(_Metric):
+    """
+    출력할 때 함수를 호출하여 값을 읽는 지표 (다른 모듈이 이미 집계하는 통계용)
+
+    Args:
+        func: 레이블 값 튜플 → 값 딕셔너리를 반환하는 함수
+        type: "counter" 또는 "gauge"
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str],
+        func: Callable[[], Dict[LabelValues, float]],
+        type: str = "gauge"
+    ):
+        super().__init__(name, help, labelnames)
+        self.func = func
+        self.type = type
+
+    def samples(self):
+        for values, value in sorted(self.func().items()):
+            yield self.name, self.labelnames, tuple(str(v) for v in values), value
+
+
+def render() -> str:
+    """
+    등록된 모든 지표를 Prometheus 텍스트 형식으로 출력합니다.
+
+    Returns:
+        /metrics 응답 본문
+    """
+    lines: List[str] = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# 스크래핑/평가 파이프라인 공통 지표
+SCRAPE_STAGE_SECONDS = Histogram(
+    "scrape_stage_seconds",
+    "스크래핑 단계별 소요 시간 (resolve: 단축 URL 리다이렉트 확인, fetch: 다운로드, "
+    "parse: 파싱과 추출 전체, cleanup: 그중 본문 정리)",
+    ("stage", "domain")
+)
+SCRAPE_RESULTS = Counter(
+    "scrape_results_total",
+    "언론사별 스크래핑 요청 결과 (ok, cached: 캐시 적중, error, timeout, unavailable)",
+    ("domain", "outcome")
+)
+LLM_REQUEST_SECONDS = Histogram(
+    "llm_request_seconds",
+    "Claude API 호출 소요 시간 (call: evaluate, stream, repair, count_tokens)",
+    ("call",),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+)
+LLM_FIRST_TOKEN_SECONDS = Histogram(
+    "llm_first_token_seconds",
+    "Claude 스트리밍 호출의 첫 응답 조각까지 걸린 시간",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0)
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "엔드포인트별 응답 시간 (스트리밍 응답은 마지막 바이트까지)",
+    ("method", "path", "status")
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "처리 중인 HTTP 요청 수"
+)
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청의 응답 시간과 처리 중인 요청 수를 기록하는 ASGI 미들웨어
+
+    경로 레이블은 매칭된 라우트의 경로 템플릿(예: /evaluate/batch/{job_id})을 사용하여
+    레이블 값의 종류가 엔드포인트 수를 넘지 않도록 하며, 매칭되지 않은 요청은 "unmatched"로 기록합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        with HTTP_REQUESTS_IN_FLIGHT.track():
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                path = getattr(route, "path", None) or "unmatched"
+                HTTP_REQUEST_SECONDS.observe(
+                    time.perf_counter() - start,
+                    method=scope.get("method", ""),
+                    path=path,
+                    status=str(status)
+                )
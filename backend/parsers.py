@@ -0,0 +1,441 @@
+"""
+HTML 파서 백엔드 모듈
+
+스크래퍼가 사용하는 HTML 파서를 교체할 수 있도록 공통 인터페이스를 제공합니다.
+모든 백엔드는 BeautifulSoup과 같은 메서드(select_one, select, find, find_all,
+get, get_text, decompose)와 같은 CSS 셀렉터 의미를 가지므로
+스크래퍼 코드는 백엔드와 무관하게 동작합니다.
+
+지원 백엔드:
+- html.parser: BeautifulSoup + 파이썬 내장 파서 (가장 느리지만 추가 의존성 없음)
+- lxml: BeautifulSoup + lxml 파서 (기본값)
+- selectolax: selectolax(lexbor) 파서 (가장 빠름, selectolax 패키지 필요)
+
+부분 파싱:
+- BeautifulSoup 백엔드는 스크래퍼가 사용하는 셀렉터 목록(targets)을 받으면
+  <head>, 문서 어디에 있든 JSON-LD 스크립트, 셀렉터에 해당하는 요소(및 그 하위 트리)만 트리로 만듭니다.
+  내비게이션, 댓글, 광고, 본문 밖의 인라인 스크립트는 객체로 만들지 않으므로
+  파싱 시간과 최대 메모리 사용량이 줄어듭니다.
+- selectolax는 C로 구현된 파서라 전체 문서를 파싱해도 충분히 빠르므로 targets를 무시합니다.
+
+본문 정리:
+- NoiseFilter는 본문 하위 트리를 한 번 순회하면서 광고, 스크립트, 관련 기사 등을
+  건너뛰고 텍스트를 모읍니다 (요소를 찾아 decompose()하는 두 번의 탐색을 대체).
+
+환경 변수:
+- HTML_PARSER: 전역 기본 백엔드 (기본값 lxml)
+- HTML_PARSER_OVERRIDES: 언론사별 백엔드 (예: "naver.com=selectolax,daum.net=lxml")
+- HTML_PARSE_TARGETED: "false"이면 부분 파싱을 끄고 항상 전체 문서를 파싱 (기본값 true)
+"""
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple, Union
+import logging
+import os
+import re
+
+from bs4 import BeautifulSoup, CData, FeatureNotFound, NavigableString, SoupStrainer, Tag
+import soupsieve
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax는 선택 기능
+    LexborHTMLParser = None
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_PARSER = "html.parser"
+SUPPORTED_PARSERS = ("html.parser", "lxml", "selectolax")
+
+DEFAULT_PARSER = os.getenv("HTML_PARSER", "lxml")
+TARGETED_PARSING = os.getenv("HTML_PARSE_TARGETED", "true").lower() == "true"
+
+# 항상 남길 태그 (메타데이터가 있는 <head>)
+ALWAYS_KEEP_TAGS = ("head",)
+
+# 항상 남길 속성 조건 (<body>에 있는 JSON-LD 기사 메타데이터)
+ALWAYS_KEEP_ATTRS = (("type", "application/ld+json"),)
+
+
+def _parse_overrides(value: str) -> Dict[str, str]:
+    """"도메인=백엔드,..." 형식의 환경 변수 값을 딕셔너리로 변환합니다."""
+    overrides = {}
+    for item in value.split(","):
+        if "=" in item:
+            domain, backend = item.split("=", 1)
+            overrides[domain.strip()] = backend.strip()
+    return overrides
+
+
+# 언론사(SOURCE_MAP 도메인 키)별 백엔드 지정
+SITE_PARSERS: Dict[str, str] = _parse_overrides(os.getenv("HTML_PARSER_OVERRIDES", ""))
+
+
+class TargetStrainer(SoupStrainer):
+    """
+    셀렉터 목록에 등장하는 요소만 트리로 만드는 SoupStrainer
+
+    각 셀렉터의 가장 바깥(첫 번째) 단순 셀렉터에서 id, class, 속성 조건을 추출하여
+    그중 하나라도 만족하는 요소를 남기고, 조건이 태그 이름뿐이면 태그 이름으로 남깁니다.
+    <head>와 JSON-LD 스크립트(ALWAYS_KEEP_TAGS, ALWAYS_KEEP_ATTRS)는 셀렉터와 관계없이 남깁니다.
+    남긴 요소는 하위 트리 전체가 유지되므로 "A > B", "A B" 같은 하위 요소 셀렉터와
+    본문 정리 로직은 전체 문서를 파싱한 경우와 같은 결과를 얻습니다.
+    """
+
+    def __init__(self, selectors: Iterable[str]):
+        super().__init__()
+        self.keep_tags: Set[str] = set(ALWAYS_KEEP_TAGS)
+        self.keep_ids: Set[str] = set()
+        self.keep_classes: Set[str] = set()
+        self.keep_attrs: Set[Tuple[str, str]] = set(ALWAYS_KEEP_ATTRS)
+        for selector in selectors:
+            for part in selector.split(","):
+                compound = re.split(r'[\s>+~]+', part.strip())[0]
+                ids = re.findall(r'#([\w-]+)', compound)
+                classes = re.findall(r'\.([\w-]+)', compound)
+                attrs = re.findall(r'\[([\w-]+)="([^"]*)"\]', compound)
+                self.keep_ids.update(ids)
+                self.keep_classes.update(classes)
+                self.keep_attrs.update(attrs)
+                if not (ids or classes or attrs):
+                    tag = re.match(r'[a-zA-Z][\w-]*', compound)
+                    if tag:
+                        self.keep_tags.add(tag.group().lower())
+
+    def _allows(self, name: str, attrs) -> bool:
+        """태그 이름과 속성으로 요소를 남길지 판단합니다."""
+        if name in self.keep_tags:
+            return True
+        if not attrs:
+            return False
+        if attrs.get("id") in self.keep_ids:
+            return True
+        classes = attrs.get("class")
+        if classes:
+            if isinstance(classes, str):
+                classes = classes.split()
+            if not self.keep_classes.isdisjoint(classes):
+                return True
+        return any(attrs.get(key) == value for key, value in self.keep_attrs)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return self._allows(name, attrs)
+
+    def search_tag(self, name, attrs=None):
+        # beautifulsoup4 < 4.13 호환
+        return self._allows(name, attrs)
+
+    def allow_string_creation(self, string: str) -> bool:
+        # 남긴 요소 밖의 문자열은 버립니다.
+        return False
+
+    @property
+    def excludes_everything(self) -> bool:
+        return False
+
+
+@lru_cache(maxsize=64)
+def _strainer_for(targets: Tuple[str, ...]) -> TargetStrainer:
+    """셀렉터 목록별 TargetStrainer를 한 번만 만들어 재사용합니다."""
+    return TargetStrainer(targets)
+
+
+class SelectolaxNode:
+    """
+    selectolax 노드를 BeautifulSoup 태그와 같은 인터페이스로 감싼 래퍼
+
+    스크래퍼가 사용하는 BeautifulSoup 메서드만 구현합니다.
+    """
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        self._node = node
+
+    @property
+    def name(self) -> str:
+        """태그 이름"""
+        return self._node.tag
+
+    def select_one(self, selector: str) -> Optional["SelectolaxNode"]:
+        """CSS 셀렉터와 일치하는 첫 번째 하위 요소를 반환합니다."""
+        node = self._node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def select(self, selector: str) -> List["SelectolaxNode"]:
+        """CSS 셀렉터와 일치하는 모든 하위 요소를 반환합니다."""
+        return [SelectolaxNode(node) for node in self._node.css(selector)]
+
+    def find(self, name: str, attrs: Optional[Dict[str, str]] = None) -> Optional["SelectolaxNode"]:
+        """태그 이름과 속성 값이 일치하는 첫 번째 하위 요소를 반환합니다."""
+        selector = name + "".join(f'[{key}="{value}"]' for key, value in (attrs or {}).items())
+        return self.select_one(selector)
+
+    def find_all(
+        self,
+        names: Union[str, List[str]],
+        class_: Optional[Pattern] = None
+    ) -> List["SelectolaxNode"]:
+        """
+        태그 이름이 일치하고 class 속성이 정규식과 일치하는 모든 하위 요소를 반환합니다.
+
+        BeautifulSoup과 마찬가지로 class 값 중 하나, 또는 class 속성 전체가
+        정규식과 일치하면 선택됩니다.
+        """
+        if isinstance(names, str):
+            names = [names]
+        matched = []
+        for node in self._node.css(", ".join(names)):
+            if class_ is not None:
+                classes = node.attributes.get("class") or ""
+                if not classes:
+                    continue
+                if not (class_.search(classes) or any(class_.search(c) for c in classes.split())):
+                    continue
+            matched.append(SelectolaxNode(node))
+        return matched
+
+    def get(self, attr: str, default: Optional[str] = None) -> Optional[str]:
+        """속성 값을 반환합니다. 없으면 default를 반환합니다."""
+        value = self._node.attributes.get(attr)
+        return default if value is None else value
+
+    def get_text(self) -> str:
+        """하위 텍스트를 모두 이어 붙여 반환합니다."""
+        return self._node.text(deep=True, separator="", strip=False)
+
+    def decompose(self) -> None:
+        """요소를 트리에서 제거합니다."""
+        self._node.decompose()
+
+    def __bool__(self) -> bool:
+        return True
+
+
+class CompiledSelector:
+    """
+    미리 컴파일한 CSS 셀렉터
+
+    BeautifulSoup의 select_one/select는 호출할 때마다 셀렉터 문자열을 해석하므로,
+    언론사 프로필처럼 반복 사용하는 셀렉터는 시작 시 한 번만 컴파일합니다.
+    selectolax 문서에는 lexbor가 직접 해석하도록 셀렉터 문자열을 그대로 전달합니다.
+
+    Attributes:
+        css: 원본 CSS 셀렉터 문자열
+    """
+
+    __slots__ = ("css", "_sieve")
+
+    def __init__(self, css: str):
+        self.css = css
+        self._sieve = soupsieve.compile(css)
+
+    def select_one(self, node):
+        """node 하위에서 셀렉터와 일치하는 첫 번째 요소를 반환합니다."""
+        if isinstance(node, SelectolaxNode):
+            return node.select_one(self.css)
+        return self._sieve.select_one(node)
+
+    def select(self, node) -> list:
+        """node 하위에서 셀렉터와 일치하는 모든 요소를 반환합니다."""
+        if isinstance(node, SelectolaxNode):
+            return node.select(self.css)
+        return self._sieve.select(node)
+
+    def match(self, node: Tag) -> bool:
+        """BeautifulSoup 태그 자신이 셀렉터와 일치하는지 확인합니다."""
+        return self._sieve.match(node)
+
+    def __repr__(self) -> str:
+        return f"CompiledSelector({self.css!r})"
+
+
+# 단순 셀렉터 (태그 이름, .class, #id 조합) 형식
+_SIMPLE_SELECTOR = re.compile(r'^([a-zA-Z][\w-]*)?((?:[.#][\w-]+)*)$')
+
+# BeautifulSoup get_text()가 기본으로 포함하는 문자열 종류 (주석, 선언 등 제외)
+_MAIN_CONTENT_STRING_TYPES = {NavigableString, CData}
+
+
+class NoiseFilter:
+    """
+    본문에서 광고, 스크립트, 관련 기사 등 불필요한 요소를 건너뛰며 텍스트를 모으는 필터
+
+    BeautifulSoup 문서는 요소를 select/find_all로 찾아 decompose()하는 대신,
+    본문 하위 트리를 한 번만 순회하면서 각 요소가 불필요한 요소인지 판별하여
+    해당 하위 트리를 건너뛰고 나머지 텍스트를 모읍니다.
+    트리를 변경하지 않으므로 요소 제거 비용이 없고, 순회는 본문 크기에 비례합니다.
+    selectolax 문서는 C로 구현된 셀렉터 검색과 요소 제거를 그대로 사용합니다.
+
+    다음 중 하나에 해당하는 요소를 불필요한 요소로 판별합니다.
+    - selector에 일치하는 요소 (".ad", "a.button" 같은 단순 셀렉터는 미리 분해하여
+      집합 조회로 판별하고, 그 밖의 셀렉터는 요소별로 CSS 일치 여부를 확인)
+    - tags 중 하나이면서 class 값 중 하나, 또는 class 속성 전체가 class_pattern과 일치하는 요소
+      (BeautifulSoup find_all(tags, class_=pattern)과 같은 규칙)
+    """
+
+    __slots__ = (
+        "_selector", "_tags", "_classes", "_ids", "_compounds", "_complex",
+        "_pattern_tags", "_class_pattern",
+    )
+
+    def __init__(
+        self,
+        selector: str = "",
+        tags: Iterable[str] = (),
+        class_pattern: Optional[Pattern] = None
+    ):
+        self._selector = selector
+        self._tags: Set[str] = set()
+        self._classes: Set[str] = set()
+        self._ids: Set[str] = set()
+        self._compounds: List[Tuple[Optional[str], FrozenSet[str], Optional[str]]] = []
+        self._complex: List[CompiledSelector] = []
+        for part in filter(None, (p.strip() for p in selector.split(","))):
+            match = _SIMPLE_SELECTOR.match(part)
+            if not match:
+                self._complex.append(CompiledSelector(part))
+                continue
+            tag = match.group(1).lower() if match.group(1) else None
+            classes = frozenset(re.findall(r'\.([\w-]+)', match.group(2)))
+            ids = re.findall(r'#([\w-]+)', match.group(2))
+            if len(ids) > 1:
+                self._complex.append(CompiledSelector(part))
+            elif tag and not classes and not ids:
+                self._tags.add(tag)
+            elif not tag and len(classes) == 1 and not ids:
+                self._classes.update(classes)
+            elif not tag and not classes and ids:
+                self._ids.add(ids[0])
+            else:
+                self._compounds.append((tag, classes, ids[0] if ids else None))
+        self._pattern_tags: FrozenSet[str] = frozenset(tags)
+        self._class_pattern = class_pattern
+
+    def _is_noise(self, name: str, element_id: Optional[str], class_attr: str, classes: List[str]) -> bool:
+        """태그 이름, id, class 값으로 불필요한 요소인지 판별합니다."""
+        if name in self._tags:
+            return True
+        if element_id is not None and element_id in self._ids:
+            return True
+        if classes and not self._classes.isdisjoint(classes):
+            return True
+        for tag, required_classes, required_id in self._compounds:
+            if (
+                (tag is None or tag == name)
+                and required_classes.issubset(classes)
+                and (required_id is None or required_id == element_id)
+            ):
+                return True
+        if self._class_pattern is not None and name in self._pattern_tags and class_attr:
+            pattern = self._class_pattern
+            if pattern.search(class_attr) or any(pattern.search(c) for c in classes):
+                return True
+        return False
+
+    def text(self, elem) -> str:
+        """
+        불필요한 요소를 제외한 elem의 하위 텍스트를 모두 이어 붙여 반환합니다.
+
+        elem 자신은 판별하지 않으며, 결과는 불필요한 요소를 제거한 뒤 get_text()를 호출한 것과 같습니다.
+
+        Args:
+            elem: BeautifulSoup 태그 또는 SelectolaxNode
+
+        Returns:
+            텍스트 (공백 정리 전)
+        """
+        if isinstance(elem, SelectolaxNode):
+            return self._selectolax_text(elem)
+        return self._bs4_text(elem)
+
+    def _bs4_text(self, elem: Tag) -> str:
+        """BeautifulSoup 태그를 순회하여 텍스트를 모읍니다."""
+        string_types = getattr(elem, "interesting_string_types", None) or _MAIN_CONTENT_STRING_TYPES
+        parts: List[str] = []
+        stack = list(reversed(elem.contents))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Tag):
+                class_value = node.attrs.get("class")
+                if isinstance(class_value, str):
+                    class_attr, classes = class_value, class_value.split()
+                elif class_value:
+                    class_attr, classes = " ".join(class_value), class_value
+                else:
+                    class_attr, classes = "", []
+                if self._is_noise(node.name, node.attrs.get("id"), class_attr, classes):
+                    continue
+                if self._complex and any(s.match(node) for s in self._complex):
+                    continue
+                stack.extend(reversed(node.contents))
+            elif type(node) in string_types:
+                parts.append(node)
+        return "".join(parts)
+
+    def _selectolax_text(self, elem: SelectolaxNode) -> str:
+        """
+        selectolax 노드에서 불필요한 요소를 제거한 뒤 텍스트를 모읍니다.
+
+        lexbor는 셀렉터 검색, 요소 제거, 텍스트 수집이 모두 C로 구현되어 있어
+        파이썬에서 노드를 하나씩 순회하는 것보다 빠르므로 제거 방식을 유지합니다.
+        """
+        if self._selector:
+            for node in elem.select(self._selector):
+                node.decompose()
+        if self._class_pattern is not None and self._pattern_tags:
+            for node in elem.find_all(sorted(self._pattern_tags), class_=self._class_pattern):
+                node.decompose()
+        return elem.get_text()
+
+
+def resolve_backend(backend: Optional[str] = None, site: Optional[str] = None) -> str:
+    """
+    사용할 파서 백엔드 이름을 결정합니다.
+
+    우선순위: 명시한 backend > 언론사별 설정(SITE_PARSERS) > 전역 기본값(HTML_PARSER)
+
+    Args:
+        backend: 명시적으로 지정한 백엔드 (선택사항)
+        site: SOURCE_MAP 도메인 키 (선택사항)
+
+    Returns:
+        백엔드 이름
+    """
+    name = backend or SITE_PARSERS.get(site or "") or DEFAULT_PARSER
+    if name not in SUPPORTED_PARSERS:
+        logger.warning(f"지원하지 않는 파서 백엔드: {name}, {FALLBACK_PARSER} 사용")
+        return FALLBACK_PARSER
+    if name == "selectolax" and LexborHTMLParser is None:
+        logger.warning("selectolax가 설치되지 않아 lxml 백엔드를 사용합니다")
+        return "lxml"
+    return name
+
+
+def parse_html(
+    html: str,
+    backend: Optional[str] = None,
+    site: Optional[str] = None,
+    targets: Optional[Tuple[str, ...]] = None
+):
+    """
+    HTML을 파싱하여 BeautifulSoup 호환 문서 객체를 반환합니다.
+
+    Args:
+        html: HTML 문자열
+        backend: 파서 백엔드 (생략 시 resolve_backend 규칙 적용)
+        site: SOURCE_MAP 도메인 키 (언론사별 백엔드 선택용)
+        targets: 스크래퍼가 사용할 셀렉터 목록 (지정 시 해당 요소와 <head>, JSON-LD 스크립트만 파싱)
+
+    Returns:
+        BeautifulSoup 객체 또는 SelectolaxNode (문서 루트)
+    """
+    name = resolve_backend(backend, site)
+    if name == "selectolax":
+        return SelectolaxNode(LexborHTMLParser(html).root)
+    parse_only = _strainer_for(targets) if targets and TARGETED_PARSING else None
+    try:
+        return BeautifulSoup(html, name, parse_only=parse_only)
+    except FeatureNotFound:
+        logger.warning(f"{name} 파서를 사용할 수 없어 {FALLBACK_PARSER}를 사용합니다")
+        return BeautifulSoup(html, FALLBACK_PARSER, parse_only=parse_only)
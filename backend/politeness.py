@@ -0,0 +1,369 @@
+"""
+언론사별 요청 제한 모듈
+
+언론사(SOURCE_MAP 도메인 키)와 알려진 단축 URL 호스트마다 토큰 버킷 속도 제한과 서킷 브레이커를 둡니다.
+그 밖의 호스트는 모두 하나의 공유 상태("other")를 사용하여, 클라이언트가 보낸 임의의 호스트명으로
+상태가 끝없이 늘어나지 않도록 합니다.
+
+- 속도 제한: 초당 SCRAPING_RATE_LIMIT개의 토큰이 채워지고 최대 SCRAPING_RATE_BURST개까지
+  쌓이는 버킷에서 요청마다 토큰 하나를 씁니다. 토큰이 없으면 채워질 때까지 기다리고,
+  SCRAPING_RATE_MAX_WAIT초 이상 기다려야 하면 기다리지 않고 바로 실패합니다.
+- 서킷 브레이커: 타임아웃, 연결 실패, 5xx 응답이 CIRCUIT_FAILURE_THRESHOLD번 연속되면
+  서킷을 열고, CIRCUIT_RESET_TIMEOUT초 동안 해당 언론사 요청을 보내지 않고 바로 실패합니다.
+  그 뒤 요청 하나만 시험 삼아 보내(half_open) 성공하면 닫고, 실패하면 다시 엽니다.
+
+언론사 장애 시 요청마다 SCRAPING_TIMEOUT만큼 워커를 붙잡지 않고 즉시 DomainUnavailableError로
+실패하며, 상태는 stats()로 확인하고 reset()으로 수동 복구할 수 있습니다.
+(비동기 스크래핑 경로에만 적용됩니다.)
+
+환경 변수:
+- SCRAPING_RATE_LIMIT: 언론사별 초당 요청 수 (기본값 5)
+- SCRAPING_RATE_BURST: 언론사별 순간 최대 요청 수 (기본값 10)
+- SCRAPING_RATE_LIMIT_OVERRIDES: 언론사별 초당 요청 수 (예: "naver.com=20,hani.co.kr=2")
+- SCRAPING_RATE_MAX_WAIT: 토큰을 기다리는 최대 시간 (초, 기본값 5)
+- CIRCUIT_FAILURE_THRESHOLD: 서킷을 여는 연속 실패 횟수 (기본값 5)
+- CIRCUIT_RESET_TIMEOUT: 서킷이 열린 뒤 시험 요청을 보내기까지의 시간 (초, 기본값 30)
+- SCRAPING_SHORTLINK_HOSTS: 상태를 따로 두는 단축 URL 호스트 (쉼표 구분, 기본값 "naver.me,bit.ly,t.co")
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+import asyncio
+import logging
+import math
+import os
+import time
+
+import requests
+
+import deadline
+from site_profiles import SITE_PROFILES
+
+logger = logging.getLogger(__name__)
+
+# 상수
+RATE_LIMIT = float(os.getenv("SCRAPING_RATE_LIMIT", "5"))  # 초당 요청 수
+RATE_BURST = int(os.getenv("SCRAPING_RATE_BURST", "10"))
+RATE_MAX_WAIT = float(os.getenv("SCRAPING_RATE_MAX_WAIT", "5"))  # 초
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))  # 초
+
+# 언론사(SOURCE_MAP 도메인 키)별 초당 요청 수
+SITE_RATE_LIMITS: Dict[str, float] = {
+    domain.strip(): float(limit)
+    for domain, _, limit in (
+        item.partition("=")
+        for item in os.getenv("SCRAPING_RATE_LIMIT_OVERRIDES", "").split(",")
+        if "=" in item
+    )
+}
+
+# 상태를 따로 두는 단축 URL 호스트
+SHORTLINK_HOSTS = frozenset(
+    host.strip().lower()
+    for host in os.getenv("SCRAPING_SHORTLINK_HOSTS", "naver.me,bit.ly,t.co").split(",")
+    if host.strip()
+)
+
+# 언론사·단축 URL 호스트가 아닌 모든 호스트가 공유하는 상태의 키
+OTHER = "other"
+
+# 서킷 상태
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class DomainUnavailableError(ValueError):
+    """
+    언론사 요청을 보내지 않고 바로 실패한 경우 (서킷이 열려 있거나 요청 한도 초과)
+
+    Attributes:
+        domain: 언론사 도메인 키
+        retry_after: 다시 시도할 수 있을 때까지의 예상 시간 (초)
+    """
+
+    def __init__(self, message: str, domain: str, retry_after: float):
+        super().__init__(message)
+        self.domain = domain
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한기
+
+    Attributes:
+        rate: 초당 채워지는 토큰 수
+        burst: 최대 토큰 수
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        토큰 하나를 예약하고 사용 가능해질 때까지 기다려야 하는 시간을 반환합니다.
+
+        토큰이 모자라면 잔량이 음수가 되어 뒤에 오는 요청이 그만큼 더 기다립니다.
+        """
+        self._refill()
+        self._tokens -= 1
+        return max(0.0, -self._tokens / self.rate)
+
+    def cancel(self) -> None:
+        """예약한 토큰을 돌려줍니다."""
+        self._tokens += 1
+
+    @property
+    def tokens(self) -> float:
+        """현재 남은 토큰 수"""
+        self._refill()
+        return self._tokens
+
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 서킷 브레이커
+
+    Attributes:
+        failure_threshold: 서킷을 여는 연속 실패 횟수
+        reset_timeout: 서킷이 열린 뒤 시험 요청을 허용하기까지의 시간 (초)
+        state: 서킷 상태 (closed, open, half_open)
+        failures: 연속 실패 횟수
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._probing = False
+
+    def retry_after(self) -> float:
+        """시험 요청을 보낼 수 있을 때까지 남은 시간 (초)"""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """
+        요청을 보내도 되는지 확인합니다.
+
+        열린 서킷은 reset_timeout이 지나면 half_open으로 바뀌어 요청 하나만 허용합니다.
+        """
+        if self.state == OPEN and self.retry_after() == 0:
+            self.state = HALF_OPEN
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """요청 성공을 기록합니다. 시험 요청이 성공하면 서킷을 닫습니다."""
+        if self.state != CLOSED:
+            logger.info("서킷 닫힘: 시험 요청 성공")
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_failure(self, error: str) -> None:
+        """요청 실패를 기록합니다. 연속 실패가 한도에 이르거나 시험 요청이 실패하면 서킷을 엽니다."""
+        self.failures += 1
+        self.last_error = error
+        self._probing = False
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """결과 없이 끝난 요청(취소 등)의 시험 요청 자리를 돌려줍니다."""
+        self._probing = False
+
+
+class DomainGuard:
+    """
+    언론사 하나의 속도 제한기와 서킷 브레이커
+
+    Attributes:
+        domain: 언론사 도메인 키
+        bucket: 토큰 버킷
+        breaker: 서킷 브레이커
+    """
+
+    def __init__(self, domain: str):
+        self.domain = domain
+        self.bucket = TokenBucket(SITE_RATE_LIMITS.get(domain, RATE_LIMIT), RATE_BURST)
+        self.breaker = CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT)
+        self.rejected = 0
+
+    def _reject(self, message: str, retry_after: float) -> DomainUnavailableError:
+        self.rejected += 1
+        logger.warning(f"언론사 요청 거부: {self.domain}, {message}")
+        return DomainUnavailableError(message, self.domain, retry_after)
+
+    def can_send_now(self) -> bool:
+        """
+        기다리지 않고 바로 요청을 보낼 수 있는지 확인합니다. (서킷이 닫혀 있고 남은 토큰이 있음)
+
+        헤지 요청처럼 꼭 필요하지 않은 요청을 요청 한도를 기다려 보내지 않도록 확인하는 데 사용합니다.
+        """
+        return self.breaker.state == CLOSED and self.bucket.tokens >= 1
+
+    @asynccontextmanager
+    async def request(self) -> AsyncIterator[None]:
+        """
+        언론사에 요청 하나를 보내는 구간입니다.
+
+        서킷과 요청 한도를 확인하고, 구간에서 발생한 예외로 성공/실패를 기록합니다.
+        타임아웃, 연결 실패, 5xx 응답만 실패로 보며 404 등 4xx 응답은 사이트가 살아 있으므로 성공입니다.
+        요청 마감 시각 때문에 줄인 타임아웃이 지나거나(DeadlineExceeded) 마감 시각에 작업이 취소된
+        경우도 사이트가 응답하지 않은 것이므로 실패입니다. 클라이언트 연결 종료 등 마감 전에
+        바깥에서 취소한 요청은 성공/실패 어느 쪽으로도 기록하지 않습니다.
+
+        Raises:
+            DomainUnavailableError: 서킷이 열려 있거나 토큰을 기다리는 시간이 RATE_MAX_WAIT를 넘는 경우
+        """
+        if not self.breaker.allow():
+            retry_after = self.breaker.retry_after()
+            raise self._reject(
+                f"언론사 접속 장애로 요청을 일시 중단했습니다: {self.domain} "
+                f"({max(1, math.ceil(retry_after))}초 후 재시도)",
+                retry_after
+            )
+
+        wait = self.bucket.reserve()
+        if wait > RATE_MAX_WAIT:
+            self.bucket.cancel()
+            self.breaker.release()
+            raise self._reject(
+                f"언론사 요청이 많아 잠시 후 다시 시도해주세요: {self.domain}",
+                wait
+            )
+
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except BaseException:
+                # 요청을 보내기 전에 취소됨 - 사이트와 무관하므로 기록하지 않음
+                self.breaker.release()
+                raise
+
+        try:
+            yield
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code < 500:
+                self.breaker.record_success()
+            else:
+                self._failure(e)
+            raise
+        except requests.RequestException as e:
+            self._failure(e)
+            raise
+        except deadline.DeadlineExceeded as e:
+            if e.site_timeout:
+                self._failure(e)
+            else:
+                self.breaker.release()
+            raise
+        except asyncio.CancelledError:
+            if deadline.expired():
+                self._failure(deadline.DeadlineExceeded("요청 마감 시각까지 응답이 없어 취소했습니다"))
+            else:
+                self.breaker.release()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        else:
+            self.breaker.record_success()
+
+    def _failure(self, error: Exception) -> None:
+        previous = self.breaker.state
+        self.breaker.record_failure(f"{type(error).__name__}: {error}")
+        if self.breaker.state == OPEN and previous != OPEN:
+            logger.error(
+                f"서킷 열림: {self.domain}, 연속 실패 {self.breaker.failures}회, "
+                f"{self.breaker.reset_timeout:.0f}초 동안 요청 중단"
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """상태를 반환합니다."""
+        return {
+            "domain": self.domain,
+            "state": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "retry_after": round(self.breaker.retry_after(), 1),
+            "last_error": self.breaker.last_error,
+            "rate_limit": self.bucket.rate,
+            "tokens": round(self.bucket.tokens, 2),
+            "rejected": self.rejected,
+        }
+
+
+_guards: Dict[str, DomainGuard] = {}
+
+
+def guard_key(domain: str) -> str:
+    """
+    도메인 키(또는 호스트명)의 상태 키를 반환합니다.
+
+    SITE_PROFILES 도메인 키와 SHORTLINK_HOSTS는 그대로, 그 밖의 호스트는 OTHER를 사용합니다.
+    """
+    if domain in SITE_PROFILES or domain in SHORTLINK_HOSTS:
+        return domain
+    return OTHER
+
+
+def guard_for(domain: str) -> DomainGuard:
+    """
+    언론사의 DomainGuard를 반환합니다. 처음 요청하는 언론사이면 생성합니다.
+
+    알려진 언론사·단축 URL 호스트가 아니면 공유 DomainGuard(OTHER)를 반환합니다.
+    """
+    key = guard_key(domain)
+    guard = _guards.get(key)
+    if guard is None:
+        guard = _guards[key] = DomainGuard(key)
+    return guard
+
+
+def stats() -> Dict[str, Dict[str, Any]]:
+    """
+    요청한 적이 있는 모든 언론사의 상태를 반환합니다.
+
+    Returns:
+        도메인 키 → 서킷 상태, 연속 실패 횟수, 남은 토큰 수 등
+    """
+    return {domain: guard.stats() for domain, guard in sorted(_guards.items())}
+
+
+def reset(domain: str) -> Optional[Dict[str, Any]]:
+    """
+    언론사의 서킷을 닫고 실패 기록을 지웁니다. (장애 복구 확인 후 수동 재개)
+
+    요청한 적이 없는 언론사의 상태는 새로 만들지 않습니다.
+
+    Returns:
+        초기화한 뒤의 상태, 해당 언론사의 상태가 없으면 None
+    """
+    guard = _guards.get(domain)
+    if guard is None:
+        return None
+    guard.breaker.record_success()
+    guard.breaker.last_error = None
+    logger.info(f"서킷 수동 초기화: {domain}")
+    return guard.stats()
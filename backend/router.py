@@ -0,0 +1,128 @@
+"""
+URL 라우터 모듈
+
+기사 URL의 호스트명으로 언론사 프로필을 찾고, 같은 기사의 여러 URL 변형
+(모바일, AMP, 인쇄용, 구형 쿼리 방식 등)을 하나의 정식 URL로 정규화합니다.
+
+- 라우팅: 호스트명을 점(.) 단위로 잘라 긴 접미사부터 딕셔너리에서 찾으므로
+  언론사 수와 관계없이 호스트명 레이블 수만큼만 조회합니다.
+  URL 문자열 전체가 아닌 호스트명만 보므로 쿼리 파라미터에 다른 도메인이 들어 있어도
+  잘못 매칭되지 않습니다. (예: "https://example.com/?ref=naver.com"은 지원하지 않는 URL)
+- 정규화: 프로필의 url_patterns 중 하나와 일치하면 canonical_template으로 정식 URL을,
+  fetch_template(없으면 정식 URL)으로 실제로 내려받을 URL을 만듭니다.
+  템플릿에는 패턴의 이름 있는 그룹과 쿼리 파라미터를 사용할 수 있습니다.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+from urllib.parse import parse_qsl, urlsplit
+import re
+
+from site_profiles import SiteProfile
+
+_SAFE_VALUE = re.compile(r'[\w-]+')
+
+
+@dataclass(frozen=True)
+class RoutedURL:
+    """
+    정규화된 기사 URL
+
+    Attributes:
+        profile: 언론사 프로필
+        canonical_url: 정식 URL (결과 캐시 키, 같은 기사의 모든 변형이 공유)
+        fetch_url: 실제로 내려받을 URL (언론사별로 가장 가벼운 페이지 변형)
+    """
+    profile: SiteProfile
+    canonical_url: str
+    fetch_url: str
+
+
+def hostname(url: str) -> str:
+    """URL의 호스트명을 소문자로 반환합니다 (포트, 사용자 정보, 끝의 점 제외)."""
+    try:
+        host = urlsplit(url.strip()).hostname or ""
+    except ValueError:
+        return ""
+    return host.rstrip(".")
+
+
+class SiteRouter:
+    """
+    호스트명 접미사 색인으로 언론사 프로필을 찾는 라우터
+
+    Attributes:
+        profiles: 도메인 키 → SiteProfile
+    """
+
+    def __init__(self, profiles: Iterable[SiteProfile]):
+        self.profiles: Dict[str, SiteProfile] = {profile.domain: profile for profile in profiles}
+
+    def route_host(self, host: str) -> Optional[SiteProfile]:
+        """
+        호스트명에 해당하는 프로필을 반환합니다.
+
+        "n.news.naver.com"이면 "n.news.naver.com", "news.naver.com", "naver.com" 순으로 찾습니다.
+        """
+        labels = host.split(".")
+        for i in range(len(labels) - 1):
+            profile = self.profiles.get(".".join(labels[i:]))
+            if profile is not None:
+                return profile
+        return None
+
+    def route(self, url: str) -> Optional[SiteProfile]:
+        """
+        URL에 해당하는 프로필을 반환합니다.
+
+        Args:
+            url: 기사 URL
+
+        Returns:
+            SiteProfile, 지원하지 않는 호스트이면 None
+        """
+        return self.route_host(hostname(url))
+
+    def canonicalize(self, url: str) -> Optional[RoutedURL]:
+        """
+        URL을 정식 URL과 내려받을 URL로 정규화합니다.
+
+        Args:
+            url: 기사 URL
+
+        Returns:
+            RoutedURL, 지원하지 않거나 프로필의 URL 패턴과 일치하지 않으면 None
+
+        Examples:
+            >>> router.canonicalize("https://m.news.naver.com/read.nhn?oid=001&aid=0014612345").canonical_url
+            "https://n.news.naver.com/mnews/article/001/0014612345"
+        """
+        try:
+            parts = urlsplit(url.strip())
+            host = (parts.hostname or "").rstrip(".")
+        except ValueError:
+            return None
+        if parts.scheme not in ("http", "https"):
+            return None
+        profile = self.route_host(host)
+        if profile is None or not profile.url_regexes:
+            return None
+
+        target = host + parts.path
+        for regex in profile.url_regexes:
+            match = regex.fullmatch(target)
+            if match is None:
+                continue
+            # 쿼리 파라미터는 영문자·숫자 값만 템플릿에 사용
+            values = {
+                key: value for key, value in parse_qsl(parts.query) if _SAFE_VALUE.fullmatch(value)
+            }
+            values.update({key: value for key, value in match.groupdict().items() if value is not None})
+            try:
+                canonical_url = profile.canonical_template.format_map(values)
+                fetch_url = (profile.fetch_template or profile.canonical_template).format_map(values)
+            except KeyError:
+                # 템플릿에 필요한 쿼리 파라미터가 없는 URL
+                continue
+            return RoutedURL(profile, canonical_url, fetch_url)
+        return None
@@ -10,26 +10,90 @@
 
 참고:
 - 모든 스크래퍼는 표준 Article 데이터클래스 형식으로 결과를 반환합니다.
+- 언론사별 추출 규칙은 site_profiles 모듈의 SiteProfile로 선언하고,
+  parse_with_profile 하나가 모든 언론사의 HTML을 Article로 변환합니다.
+  scrape_article과 scrape_article_async는 같은 파서(PARSER_MAP)를 사용합니다.
+- HTML 파서 백엔드는 parsers 모듈에서 전역 또는 언론사별로 선택합니다.
+- 같은 기사를 동시에 스크래핑하는 비동기 요청은 정식 URL 기준으로 합쳐져
+  다운로드와 파싱을 한 번만 수행합니다. (단축 URL 리다이렉트 확인도 마찬가지)
+- 비동기 요청은 politeness 모듈의 언론사별 속도 제한과 서킷 브레이커를 거칩니다.
+- 비동기 스크래핑은 deadline 모듈의 요청 마감 시각 안에서 리다이렉트 확인, 다운로드,
+  파싱을 수행하며, 각 요청은 언론사별 연결/읽기 타임아웃을 사용합니다.
+- 비동기 스크래핑의 HTML 파싱과 본문 정리는 기본적으로 스레드에서, HTML_PARSE_PROCESSES가
+  설정되어 있으면 프로세스 풀에서 실행되어 여러 CPU 코어를 사용합니다.
 - CSS 셀렉터는 웹사이트 구조 변경에 따라 조정이 필요할 수 있습니다.
 - 실제 사용 전 각 언론사별 테스트를 권장합니다.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional, Dict, Callable
+from functools import partial
+from typing import Optional, Dict, Callable, AsyncIterator, List, Tuple, Union
+from urllib.parse import urldefrag
+import asyncio
+import multiprocessing
+import os
+import time
 import re
 import requests
-from bs4 import BeautifulSoup
 import logging
 
+import deadline
+import fetcher
+import metrics
+import politeness
+from cache import SingleFlight, TTLCache
+from parsers import CompiledSelector, parse_html, resolve_backend, FALLBACK_PARSER, TARGETED_PARSING
+from metadata import ArticleMetadata, extract_metadata, normalize_datetime, strip_site_suffix
+from router import SiteRouter, hostname
+from site_profiles import SITE_PROFILES, SiteProfile
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# 상수
-TIMEOUT = 10  # 초
-USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+# 단축 URL 리다이렉트 캐시 (단축 URL → 최종 URL)
+REDIRECT_CACHE_TTL = float(os.getenv("REDIRECT_CACHE_TTL", "3600"))  # 초
+REDIRECT_CACHE_SIZE = int(os.getenv("REDIRECT_CACHE_SIZE", "10000"))
+redirect_cache: TTLCache[str] = TTLCache("redirect", REDIRECT_CACHE_SIZE, REDIRECT_CACHE_TTL)
+
+# 스크래핑 결과 캐시 (정식 URL → Article)
+ARTICLE_CACHE_TTL = float(os.getenv("ARTICLE_CACHE_TTL", "1800"))  # 초
+ARTICLE_CACHE_SIZE = int(os.getenv("ARTICLE_CACHE_SIZE", "2000"))
+article_cache: TTLCache["Article"] = TTLCache("article", ARTICLE_CACHE_SIZE, ARTICLE_CACHE_TTL)
+
+# 진행 중인 작업 테이블 - 같은 기사(정식 URL)의 동시 스크래핑과
+# 같은 단축 URL의 동시 리다이렉트 확인을 하나의 요청으로 합침
+article_flight = SingleFlight("article")
+redirect_flight = SingleFlight("redirect")
+
+# HTML 파싱 프로세스 수 (0이면 이벤트 루프의 스레드 풀에서 파싱)
+PARSE_PROCESSES = int(os.getenv("HTML_PARSE_PROCESSES", "0"))
+
+# 일괄 스크래핑 동시 실행 한도 (전체 / 언론사별)
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "32"))
+BATCH_PER_DOMAIN_CONCURRENCY = int(os.getenv("BATCH_PER_DOMAIN_CONCURRENCY", "4"))
+
+# 아래 값은 모두 언론사 프로필(site_profiles.SITE_PROFILES)에서 만들어집니다.
+# 본문 컨테이너가 닫히면 다운로드를 멈출 언론사 (본문 컨테이너 시작 태그의 속성 패턴)
+STREAM_STOP_AFTER: Dict[str, str] = {
+    domain: profile.stream_stop_after
+    for domain, profile in SITE_PROFILES.items() if profile.stream_stop_after
+}
+
+# 본문 컨테이너에서 다운로드를 멈춘 페이지의 본문이 이보다 짧으면 (글자 수)
+# 컨테이너가 예상보다 일찍 닫힌 것으로 보고 전체 페이지를 다시 받아 파싱
+EARLY_STOP_MIN_BODY_CHARS = 200
 
+# 도메인별 결과 캐시 유지 시간 (목록에 없는 도메인은 ARTICLE_CACHE_TTL 사용)
+ARTICLE_CACHE_TTLS: Dict[str, float] = {
+    domain: profile.cache_ttl
+    for domain, profile in SITE_PROFILES.items() if profile.cache_ttl is not None
+}
+
+# 호스트명 → 언론사 프로필 라우터 (URL 변형 정규화 포함)
+router = SiteRouter(SITE_PROFILES.values())
 
 @dataclass
 class Article:
@@ -40,7 +104,7 @@ class Article:
         title: 기사 제목
         author: 기자명 (이메일 포함 가능)
         press: 언론사명
-        published_at: 발행일시 (YYYY-MM-DD HH:MM 형식)
+        published_at: 발행일시 (KST 기준 YYYY-MM-DD HH:MM 형식)
         body: 기사 본문 (텍스트만, HTML 태그 제거)
         original_url: 원본 기사 URL
     """
@@ -117,10 +181,50 @@ def parse_daum_date(date_text: str) -> str:
         return date_text
 
 
+def is_canonical_url(url: str) -> bool:
+    """
+    URL이 지원 언론사의 기사 URL 패턴과 일치하는지 확인합니다.
+
+    일치하는 URL은 모바일·AMP 등 변형이어도 네트워크 요청 없이 정식 URL로 정규화할 수 있습니다.
+
+    Args:
+        url: 확인할 URL
+
+    Returns:
+        언론사 프로필의 url_patterns 중 하나와 일치하면 True
+
+    Examples:
+        >>> is_canonical_url("https://n.news.naver.com/mnews/article/001/0014612345")
+        True
+        >>> is_canonical_url("https://naver.me/abcdef")
+        False
+    """
+    return router.canonicalize(url) is not None
+
+
+def _resolve_without_request(url: str) -> Optional[str]:
+    """
+    네트워크 요청 없이 최종 URL을 알 수 있으면 반환합니다.
+
+    기사 URL 패턴과 일치하면 정식 URL을, 이전에 해소한 단축 URL은 캐시된 값을 반환합니다.
+    """
+    routed = router.canonicalize(url)
+    if routed is not None:
+        logger.info(f"기사 URL, 리다이렉트 확인 생략: {url} → {routed.canonical_url}")
+        return routed.canonical_url
+    cached = redirect_cache.get(url)
+    if cached is not None:
+        logger.info(f"리다이렉트 캐시 적중: {url} → {cached}")
+    return cached
+
+
 def resolve_url(url: str) -> str:
     """
     단축 URL을 실제 URL로 변환합니다.
 
+    기사 URL 패턴과 일치하면 HEAD 요청 없이 정식 URL을 반환하고,
+    단축 URL의 해소 결과는 redirect_cache에 REDIRECT_CACHE_TTL 동안 보관합니다.
+
     Args:
         url: 원본 URL (단축 URL 가능)
 
@@ -130,40 +234,43 @@ def resolve_url(url: str) -> str:
     Raises:
         requests.RequestException: 네트워크 에러
     """
+    resolved = _resolve_without_request(url)
+    if resolved is not None:
+        return resolved
+
     try:
-        response = requests.head(
-            url,
-            allow_redirects=True,
-            timeout=TIMEOUT,
-            headers={'User-Agent': USER_AGENT}
-        )
-        return response.url
+        response = fetcher.head(url, allow_redirects=True)
     except requests.RequestException as e:
         logger.error(f"URL 리다이렉트 실패: {url}, 에러: {e}")
         raise
+    redirect_cache.set(url, response.url)
+    return response.url
 
 
-def scrape_naver(url: str) -> Article:
+def fetch_page(url: str, stop_early: bool = True) -> fetcher.FetchResponse:
     """
-    네이버 뉴스 기사를 스크래핑합니다.
+    공유 커넥션 풀로 기사 페이지를 스트리밍하여 내려받습니다.
 
-    URL 패턴: n.news.naver.com/mnews/article/{언론사코드}/{기사번호}
+    언론사별 최대 다운로드 크기를 적용하고, STREAM_STOP_AFTER에 등록된 언론사는
+    본문 컨테이너가 닫히는 즉시 다운로드를 멈춥니다.
 
     Args:
-        url: 네이버 뉴스 기사 URL
+        url: 기사 URL
+        stop_early: False이면 본문 컨테이너 이후도 끝까지 내려받음
 
     Returns:
-        Article 객체
+        FetchResponse 객체 (text: HTML, truncated: 중간에 멈춘 이유)
 
     Raises:
-        ValueError: 필수 요소를 찾을 수 없는 경우
+        ValueError: 기사를 찾을 수 없거나(404) 요청 시간이 초과된 경우
         requests.RequestException: 네트워크 에러
     """
+    site = source_key(url)
     try:
-        response = requests.get(
+        response = fetcher.get_streamed(
             url,
-            timeout=TIMEOUT,
-            headers={'User-Agent': USER_AGENT}
+            max_bytes=fetcher.max_bytes_for(site),
+            stop_after=STREAM_STOP_AFTER.get(site) if stop_early else None
         )
         response.raise_for_status()
     except requests.HTTPError as e:
@@ -173,236 +280,194 @@ def scrape_naver(url: str) -> Article:
     except requests.Timeout:
         raise ValueError(f"요청 시간 초과: {url}")
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    return response
 
-    # 제목 추출
-    title_elem = soup.select_one('#title_area > span')
-    if not title_elem:
-        raise ValueError("제목을 찾을 수 없습니다")
-    title = clean_text(title_elem.get_text())
-
-    # 언론사 추출
-    press_elem = soup.select_one('img.media_end_head_top_logo_img.light_type')
-    if not press_elem:
-        raise ValueError("언론사 정보를 찾을 수 없습니다")
-    press = press_elem.get('title', '')
-
-    # 기자명 추출
-    author_elem = soup.select_one('.media_end_head_journalist_name')
-    author = clean_text(author_elem.get_text()) if author_elem else "기자 정보 없음"
-
-    # 발행일시 추출
-    date_elem = soup.select_one('.media_end_head_info_datestamp_time')
-    if not date_elem:
-        raise ValueError("발행일시를 찾을 수 없습니다")
-
-    # data-date-time 속성에서 추출 (ISO 형식)
-    published_raw = date_elem.get('data-date-time', '')
-    if published_raw:
-        # ISO 형식 (2025-11-14T10:30:00+09:00) → YYYY-MM-DD HH:MM
-        try:
-            dt = datetime.fromisoformat(published_raw.replace('+09:00', ''))
-            published_at = dt.strftime('%Y-%m-%d %H:%M')
-        except ValueError:
-            published_at = clean_text(date_elem.get_text())
-    else:
-        published_at = clean_text(date_elem.get_text())
 
-    # 본문 추출
-    body_elem = soup.select_one('#dic_area')
-    if not body_elem:
-        raise ValueError("본문을 찾을 수 없습니다")
+def is_early_stop_suspect(page: fetcher.FetchResponse, article: "Article") -> bool:
+    """
+    본문 컨테이너에서 다운로드를 멈춘 페이지의 파싱 결과가 잘렸을 수 있는지 확인합니다.
 
-    # 본문 내 불필요한 요소 제거
-    for tag in body_elem.select('script, style, a.media_end_head_autosummary_button'):
-        tag.decompose()
+    잘못된 마크업 등으로 컨테이너가 실제보다 일찍 닫힌 것으로 감지되면 파싱은 성공하지만
+    본문이 앞부분만 남습니다. 이런 결과가 캐시되지 않도록 본문이
+    EARLY_STOP_MIN_BODY_CHARS보다 짧으면 전체 페이지로 다시 확인합니다.
+    """
+    return page.truncated == "container" and len(article.body) < EARLY_STOP_MIN_BODY_CHARS
 
-    # 광고 및 관련 기사 제거
-    for tag in body_elem.find_all(['div', 'span'], class_=re.compile(r'ad|banner|related', re.I)):
-        tag.decompose()
 
-    body = clean_text(body_elem.get_text())
+def scrape_with_parser(parser_func: Callable[..., "Article"], url: str) -> "Article":
+    """
+    기사 페이지를 내려받아 parser_func로 파싱합니다.
 
-    return Article(
-        title=title,
-        author=author,
-        press=press,
-        published_at=published_at,
-        body=body,
-        original_url=url
-    )
+    본문 컨테이너에서 다운로드를 멈춘 페이지의 파싱이 실패하거나
+    (필요한 요소가 본문 뒤에 있는 경우) 본문이 잘렸을 수 있으면
+    (is_early_stop_suspect) 전체 페이지를 다시 받아 파싱합니다.
 
+    Args:
+        parser_func: PARSER_MAP의 파서 함수
+        url: 기사 URL
 
-def scrape_daum(url: str) -> Article:
+    Returns:
+        Article 객체
+    """
+    page = fetch_page(url)
+    try:
+        article = run_parser(parser_func, page.text, url)
+    except Exception as e:
+        if page.truncated != "container":
+            raise
+        logger.warning(f"조기 종료한 페이지 파싱 실패, 전체 페이지로 재시도: {url}, 에러: {e}")
+        return run_parser(parser_func, fetch_page(url, stop_early=False).text, url)
+    if is_early_stop_suspect(page, article):
+        logger.warning(f"조기 종료한 페이지의 본문이 짧음, 전체 페이지로 재시도: {url}")
+        return run_parser(parser_func, fetch_page(url, stop_early=False).text, url)
+    return article
+
+
+def run_parser(
+    parser_func: Callable[..., "Article"],
+    html: str,
+    url: str,
+    timings: Optional[Dict[str, float]] = None
+) -> "Article":
     """
-    다음 뉴스 기사를 스크래핑합니다.
+    설정된 파서 백엔드로 기사를 파싱하고, 실패하면 html.parser로 다시 시도합니다.
 
-    URL 패턴: v.daum.net/v/{기사ID}
+    빠른 파서(lxml, selectolax)가 일부 페이지의 잘못된 마크업을 다르게 해석하거나,
+    부분 파싱 대상에서 필요한 요소가 빠져 필수 요소를 찾지 못하는 경우를 대비하여
+    html.parser로 전체 문서를 다시 파싱합니다.
 
     Args:
-        url: 다음 뉴스 기사 URL
+        parser_func: PARSER_MAP의 파서 함수
+        html: 기사 페이지 HTML
+        url: 기사 URL
+        timings: 전달하면 단계별 소요 시간(초)을 기록할 딕셔너리 (parse_with_profile 참고)
 
     Returns:
         Article 객체
 
     Raises:
-        ValueError: 필수 요소를 찾을 수 없는 경우
-        requests.RequestException: 네트워크 에러
+        ValueError: html.parser로도 필수 요소를 찾을 수 없는 경우
     """
     try:
-        response = requests.get(
-            url,
-            timeout=TIMEOUT,
-            headers={'User-Agent': USER_AGENT}
-        )
-        response.raise_for_status()
-    except requests.HTTPError as e:
-        if e.response.status_code == 404:
-            raise ValueError(f"기사를 찾을 수 없습니다: {url}")
-        raise
-    except requests.Timeout:
-        raise ValueError(f"요청 시간 초과: {url}")
-
-    soup = BeautifulSoup(response.text, 'html.parser')
-
-    # 제목 추출
-    title_elem = soup.select_one('.tit_view')
-    if not title_elem:
-        raise ValueError("제목을 찾을 수 없습니다")
-    title = clean_text(title_elem.get_text())
-
-    # 언론사 추출
-    press_elem = soup.select_one('img#kakaoServiceLogo')
-    if not press_elem:
-        raise ValueError("언론사 정보를 찾을 수 없습니다")
-    press = press_elem.get('alt', '')
-
-    # 기자명 추출
-    author_elem = soup.select_one('.info_view .txt_info')
-    author = clean_text(author_elem.get_text()) if author_elem else "기자 정보 없음"
-
-    # 발행일시 추출
-    date_elem = soup.select_one('.info_view .num_date')
-    if not date_elem:
-        raise ValueError("발행일시를 찾을 수 없습니다")
-
-    published_text = clean_text(date_elem.get_text())
-    # "입력 2025.11.14. 오후 2:30" → "2025-11-14 14:30" 형식으로 변환
-    published_at = parse_daum_date(published_text)
-
-    # 본문 추출
-    body_elem = soup.select_one('.article_view')
-    if not body_elem:
-        raise ValueError("본문을 찾을 수 없습니다")
-
-    # 본문 내 불필요한 요소 제거
-    for tag in body_elem.select('script, style'):
-        tag.decompose()
-
-    # "관련기사", "인기기사" 섹션 제거
-    for tag in body_elem.find_all(['div', 'section'], class_=re.compile(r'related|popular|recommend', re.I)):
-        tag.decompose()
+        return parser_func(html, url, timings=timings)
+    except Exception as e:
+        backend = resolve_backend(site=source_key(url))
+        if backend == FALLBACK_PARSER and not TARGETED_PARSING:
+            raise
+        logger.warning(f"{backend} 파싱 실패, {FALLBACK_PARSER} 전체 파싱으로 재시도: {url}, 에러: {e}")
+        return parser_func(html, url, backend=FALLBACK_PARSER, targeted=False, timings=timings)
+
+
+# 발행일시 변환 규칙 이름 → 변환 함수 (site_profiles.DATE_FORMATS와 대응)
+# 변환 함수는 해석할 수 없는 값에 ValueError를 발생시킵니다.
+DATE_FORMATTERS: Dict[str, Callable[[str], str]] = {
+    "iso": normalize_datetime,
+    "korean": parse_daum_date,
+}
 
-    body = clean_text(body_elem.get_text())
 
-    return Article(
-        title=title,
-        author=author,
-        press=press,
-        published_at=published_at,
-        body=body,
-        original_url=url
-    )
+def _select_first(soup, selectors: Tuple[CompiledSelector, ...]):
+    """셀렉터를 순서대로 시도하여 처음 찾은 요소를 반환합니다."""
+    for selector in selectors:
+        elem = selector.select_one(soup)
+        if elem:
+            return elem
+    return None
 
 
-def scrape_yonhap(url: str) -> Article:
+def _extract_published_at(profile: SiteProfile, date_elem) -> str:
+    """발행일시 요소에서 프로필 규칙에 따라 발행일시 문자열을 추출합니다."""
+    value = next((date_elem.get(attr) for attr in profile.date_attrs if date_elem.get(attr)), None)
+    if value is None:
+        value = clean_text(date_elem.get_text())
+    if profile.date_format is None:
+        return value
+    try:
+        return DATE_FORMATTERS[profile.date_format](value)
+    except ValueError:
+        return clean_text(date_elem.get_text())
+
+
+def parse_with_profile(
+    profile: SiteProfile,
+    html: str,
+    url: str,
+    backend: Optional[str] = None,
+    targeted: bool = True,
+    timings: Optional[Dict[str, float]] = None
+) -> Article:
     """
-    연합뉴스 기사를 스크래핑합니다.
+    언론사 프로필에 따라 기사 HTML에서 Article을 추출합니다.
 
-    URL 패턴: www.yna.co.kr/view/...
+    모든 언론사가 이 함수 하나로 파싱되며, 언론사별 차이는 SiteProfile에만 있습니다.
+    제목, 기자명, 발행일시는 <head>의 JSON-LD/메타 태그에서 먼저 찾고
+    빠진 항목만 셀렉터 목록으로 찾습니다.
+    셀렉터와 정규식은 프로필을 만들 때 컴파일된 것을 사용하고,
+    본문은 트리를 변경하지 않고 NoiseFilter로 불필요한 요소를 건너뛰며 수집합니다.
 
     Args:
-        url: 연합뉴스 기사 URL
+        profile: 언론사 프로필
+        html: 기사 페이지 HTML
+        url: 기사 URL
+        backend: HTML 파서 백엔드 (생략 시 전역/언론사별 설정 사용)
+        targeted: True이면 프로필이 사용하는 셀렉터에 해당하는 부분만 파싱
+        timings: 전달하면 본문 정리 소요 시간(초)을 "cleanup" 키에 누적
 
     Returns:
         Article 객체
 
     Raises:
         ValueError: 필수 요소를 찾을 수 없는 경우
-        requests.RequestException: 네트워크 에러
-
-    Note:
-        CSS 셀렉터는 웹사이트 구조 변경에 따라 조정이 필요할 수 있습니다.
     """
-    try:
-        response = requests.get(
-            url,
-            timeout=TIMEOUT,
-            headers={'User-Agent': USER_AGENT}
-        )
-        response.raise_for_status()
-    except requests.HTTPError as e:
-        if e.response.status_code == 404:
-            raise ValueError(f"기사를 찾을 수 없습니다: {url}")
-        raise
-    except requests.Timeout:
-        raise ValueError(f"요청 시간 초과: {url}")
+    targets = profile.targets if targeted else None
+    soup = parse_html(html, backend, site=profile.domain, targets=targets)
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    # <head>의 JSON-LD/메타 태그에서 먼저 찾고, 빠진 항목만 셀렉터로 탐색
+    meta = extract_metadata(soup) if profile.metadata_fields else ArticleMetadata()
 
-    # 제목 추출 - 여러 패턴 시도
-    title_elem = (
-        soup.select_one('h1.tit') or
-        soup.select_one('.article-head h1') or
-        soup.select_one('h1')
-    )
-    if not title_elem:
-        raise ValueError("제목을 찾을 수 없습니다")
-    title = clean_text(title_elem.get_text())
-
-    # 언론사 - 연합뉴스로 고정
-    press = "연합뉴스"
+    # 제목 추출
+    title = meta.title if "title" in profile.metadata_fields else None
+    if title:
+        title = strip_site_suffix(title, profile.press, profile.name)
+    else:
+        title_elem = _select_first(soup, profile.title_selectors)
+        if not title_elem:
+            raise ValueError("제목을 찾을 수 없습니다")
+        title = clean_text(title_elem.get_text())
+
+    # 언론사 추출 (포털은 페이지에서, 언론사 사이트는 고정값)
+    if profile.press_element_selectors:
+        press_elem = _select_first(soup, profile.press_element_selectors)
+        if not press_elem:
+            raise ValueError("언론사 정보를 찾을 수 없습니다")
+        press = press_elem.get(profile.press_attr, '')
+    else:
+        press = profile.press
 
     # 기자명 추출
-    author_elem = (
-        soup.select_one('.writer') or
-        soup.select_one('.byline') or
-        soup.select_one('.journalist')
-    )
-    author = clean_text(author_elem.get_text()) if author_elem else "기자 정보 없음"
+    author = meta.author if "author" in profile.metadata_fields else None
+    if not author:
+        author_elem = _select_first(soup, profile.author_selectors)
+        author = clean_text(author_elem.get_text()) if author_elem else "기자 정보 없음"
 
     # 발행일시 추출
-    date_elem = (
-        soup.select_one('div.info-box01 span.txt-time') or
-        soup.select_one('.update-time') or
-        soup.select_one('time') or
-        soup.select_one('.date')
-    )
-    if not date_elem:
-        raise ValueError("발행일시를 찾을 수 없습니다")
-
-    published_text = clean_text(date_elem.get_text())
-    # 표준 형식으로 변환 시도
-    published_at = published_text
+    published_at = meta.published_at if "published_at" in profile.metadata_fields else None
+    if not published_at:
+        date_elem = _select_first(soup, profile.date_selectors)
+        if not date_elem:
+            raise ValueError("발행일시를 찾을 수 없습니다")
+        published_at = _extract_published_at(profile, date_elem)
 
     # 본문 추출
-    body_elem = (
-        soup.select_one('.article-body') or
-        soup.select_one('.story-news') or
-        soup.select_one('.content')
-    )
+    body_elem = _select_first(soup, profile.body_selectors)
     if not body_elem:
         raise ValueError("본문을 찾을 수 없습니다")
 
-    # 본문 내 불필요한 요소 제거
-    for tag in body_elem.select('script, style, .ad, .adrs, .related-news'):
-        tag.decompose()
-
-    # 광고 및 관련 기사 제거
-    for tag in body_elem.find_all(['div', 'aside'], class_=re.compile(r'ad|banner|related|recommend', re.I)):
-        tag.decompose()
-
-    body = clean_text(body_elem.get_text())
+    # 스크립트, 광고, 관련 기사 등을 건너뛰며 본문 텍스트를 한 번의 순회로 수집
+    start = time.perf_counter()
+    body = clean_text(profile.noise_filter.text(body_elem))
+    if timings is not None:
+        timings["cleanup"] = timings.get("cleanup", 0.0) + time.perf_counter() - start
 
     return Article(
         title=title,
@@ -414,347 +479,328 @@ def scrape_yonhap(url: str) -> Article:
     )
 
 
-def scrape_chosun(url: str) -> Article:
-    """
-    조선일보 기사를 스크래핑합니다.
+# 도메인 → 파서 함수 매핑 (html, url, backend=None, targeted=True, timings=None) → Article
+PARSER_MAP: Dict[str, Callable[..., Article]] = {
+    domain: partial(parse_with_profile, profile)
+    for domain, profile in SITE_PROFILES.items()
+}
 
-    URL 패턴: www.chosun.com/...
+# 도메인 → 스크래퍼 함수 매핑 (url) → Article
+SOURCE_MAP: Dict[str, Callable[[str], Article]] = {
+    domain: partial(scrape_with_parser, parser_func)
+    for domain, parser_func in PARSER_MAP.items()
+}
 
-    Args:
-        url: 조선일보 기사 URL
 
-    Returns:
-        Article 객체
+_parse_pool: Optional[ProcessPoolExecutor] = None
 
-    Raises:
-        ValueError: 필수 요소를 찾을 수 없는 경우
-        requests.RequestException: 네트워크 에러
 
-    Note:
-        CSS 셀렉터는 웹사이트 구조 변경에 따라 조정이 필요할 수 있습니다.
+def _parse_in_worker(domain: str, html: str, url: str) -> Tuple[Article, Dict[str, float]]:
     """
-    try:
-        response = requests.get(
-            url,
-            timeout=TIMEOUT,
-            headers={'User-Agent': USER_AGENT}
-        )
-        response.raise_for_status()
-    except requests.HTTPError as e:
-        if e.response.status_code == 404:
-            raise ValueError(f"기사를 찾을 수 없습니다: {url}")
-        raise
-    except requests.Timeout:
-        raise ValueError(f"요청 시간 초과: {url}")
+    프로세스 풀 워커에서 기사를 파싱합니다.
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    언론사 프로필(컴파일된 셀렉터 등)은 워커가 import한 PARSER_MAP을 사용하므로
+    프로세스 사이에는 도메인 키, HTML, URL과 결과 Article(문자열 6개)만 오갑니다.
+    워커에서 잰 단계별 소요 시간도 함께 돌려주어 부모 프로세스의 지표에 기록합니다.
+    """
+    timings: Dict[str, float] = {}
+    return run_parser(PARSER_MAP[domain], html, url, timings), timings
 
-    # 제목 추출 - 여러 패턴 시도
-    title_elem = (
-        soup.select_one('h1.article-header__headline') or
-        soup.select_one('.article-title') or
-        soup.select_one('h1[itemprop="headline"]') or
-        soup.select_one('h1')
-    )
-    if not title_elem:
-        raise ValueError("제목을 찾을 수 없습니다")
-    title = clean_text(title_elem.get_text())
 
-    # 언론사 - 조선일보로 고정
-    press = "조선일보"
+def get_parse_pool() -> ProcessPoolExecutor:
+    """
+    HTML 파싱 프로세스 풀을 반환합니다. 최초 호출 시 생성됩니다.
 
-    # 기자명 추출
-    author_elem = (
-        soup.select_one('.article-header__reporter') or
-        soup.select_one('.byline') or
-        soup.select_one('[itemprop="author"]') or
-        soup.select_one('.reporter')
-    )
-    author = clean_text(author_elem.get_text()) if author_elem else "기자 정보 없음"
+    워커는 spawn 방식으로 시작하여 부모 프로세스의 이벤트 루프, 스레드, 커넥션 풀을 물려받지 않습니다.
+    """
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=PARSE_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.info(f"HTML 파싱 프로세스 풀 생성: {PARSE_PROCESSES}개")
+    return _parse_pool
 
-    # 발행일시 추출
-    date_elem = (
-        soup.select_one('.article-header__date') or
-        soup.select_one('time') or
-        soup.select_one('[itemprop="datePublished"]') or
-        soup.select_one('.date')
-    )
-    if not date_elem:
-        raise ValueError("발행일시를 찾을 수 없습니다")
-
-    # datetime 속성이 있으면 사용
-    published_at = (
-        date_elem.get('datetime') or
-        date_elem.get('content') or
-        clean_text(date_elem.get_text())
-    )
 
-    # 본문 추출 - 조선일보 특정 셀렉터 우선
-    body_elem = (
-        soup.select_one('section.article-body') or
-        soup.find('section', {'itemprop': 'articleBody'}) or
-        soup.select_one('.article-content') or
-        soup.select_one('.story-body')
-    )
-    if not body_elem:
-        raise ValueError("본문을 찾을 수 없습니다")
-
-    # 본문 내 불필요한 요소 제거
-    for tag in body_elem.select('script, style, .ad, .advertisement, .related-article'):
-        tag.decompose()
+def start_parse_pool() -> None:
+    """
+    프로세스 풀을 만들고 워커를 미리 시작합니다. (첫 요청이 워커 시작 시간을 기다리지 않도록)
 
-    # 광고 및 관련 기사 제거
-    for tag in body_elem.find_all(['div', 'aside', 'section'], class_=re.compile(r'ad|banner|related|recommend|promotion', re.I)):
-        tag.decompose()
+    HTML_PARSE_PROCESSES가 0이면 아무것도 하지 않습니다. FastAPI lifespan 시작 시 호출합니다.
+    """
+    if PARSE_PROCESSES <= 0:
+        return
+    pool = get_parse_pool()
+    for _ in range(PARSE_PROCESSES):
+        pool.submit(int)
 
-    body = clean_text(body_elem.get_text())
 
-    return Article(
-        title=title,
-        author=author,
-        press=press,
-        published_at=published_at,
-        body=body,
-        original_url=url
-    )
+def shutdown_parse_pool() -> None:
+    """
+    프로세스 풀을 종료합니다. FastAPI lifespan 종료 시 호출합니다.
+    """
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
 
 
-def scrape_joongang(url: str) -> Article:
+async def parse_async(domain: str, html: str, url: str) -> Article:
     """
-    중앙일보 기사를 스크래핑합니다.
+    이벤트 루프를 막지 않고 기사를 파싱합니다.
 
-    URL 패턴: www.joongang.co.kr/article/...
+    HTML_PARSE_PROCESSES가 0보다 크면 프로세스 풀에서 파싱하여 GIL과 관계없이
+    여러 코어를 사용하고, 0이면 스레드에서 파싱합니다. 결과는 run_parser와 같습니다.
+    파싱 전체(parse)와 그중 본문 정리(cleanup) 소요 시간을 scrape_stage_seconds에 기록합니다.
 
     Args:
-        url: 중앙일보 기사 URL
+        domain: SOURCE_MAP 도메인 키
+        html: 기사 페이지 HTML
+        url: 기사 URL
 
     Returns:
         Article 객체
 
     Raises:
         ValueError: 필수 요소를 찾을 수 없는 경우
-        requests.RequestException: 네트워크 에러
-
-    Note:
-        CSS 셀렉터는 웹사이트 구조 변경에 따라 조정이 필요할 수 있습니다.
     """
+    with metrics.SCRAPE_STAGE_SECONDS.time(stage="parse", domain=domain):
+        if PARSE_PROCESSES <= 0:
+            timings: Dict[str, float] = {}
+            article = await asyncio.to_thread(run_parser, PARSER_MAP[domain], html, url, timings)
+        else:
+            article, timings = await _parse_in_pool(domain, html, url)
+    if "cleanup" in timings:
+        metrics.SCRAPE_STAGE_SECONDS.observe(timings["cleanup"], stage="cleanup", domain=domain)
+    return article
+
+
+async def _parse_in_pool(domain: str, html: str, url: str) -> Tuple[Article, Dict[str, float]]:
+    """프로세스 풀에서 파싱합니다. 풀이 손상되면 다음 요청에서 새로 만들도록 버립니다."""
+    global _parse_pool
+    pool = get_parse_pool()
     try:
-        response = requests.get(
-            url,
-            timeout=TIMEOUT,
-            headers={'User-Agent': USER_AGENT}
-        )
-        response.raise_for_status()
-    except requests.HTTPError as e:
-        if e.response.status_code == 404:
-            raise ValueError(f"기사를 찾을 수 없습니다: {url}")
+        return await asyncio.get_running_loop().run_in_executor(pool, _parse_in_worker, domain, html, url)
+    except BrokenProcessPool:
+        # 워커가 비정상 종료(메모리 부족 등)하면 풀을 버리고 다음 요청에서 새로 생성
+        logger.error("HTML 파싱 프로세스 풀이 손상되어 다시 생성합니다")
+        if _parse_pool is pool:
+            _parse_pool = None
+            pool.shutdown(wait=False)
         raise
-    except requests.Timeout:
-        raise ValueError(f"요청 시간 초과: {url}")
 
-    soup = BeautifulSoup(response.text, 'html.parser')
 
-    # 제목 추출 - 여러 패턴 시도
-    title_elem = (
-        soup.select_one('h1.headline') or
-        soup.select_one('.article-title') or
-        soup.select_one('h1[itemprop="headline"]') or
-        soup.select_one('.head-title') or
-        soup.select_one('h1')
-    )
-    if not title_elem:
-        raise ValueError("제목을 찾을 수 없습니다")
-    title = clean_text(title_elem.get_text())
+def article_cache_key(final_url: str) -> str:
+    """
+    스크래핑 결과 캐시 키를 만듭니다.
 
-    # 언론사 - 중앙일보로 고정
-    press = "중앙일보"
+    기사 URL 패턴과 일치하면 정식 URL을 사용하여 모바일·AMP 등 같은 기사의 변형이
+    하나의 캐시 항목을 공유하도록 하고, 그 밖의 URL은 fragment(#...)만 제거합니다.
+    """
+    routed = router.canonicalize(final_url)
+    if routed is not None:
+        return routed.canonical_url
+    return urldefrag(final_url).url
 
-    # 기자명 추출
-    author_elem = (
-        soup.select_one('.reporter') or
-        soup.select_one('.byline') or
-        soup.select_one('[itemprop="author"]') or
-        soup.select_one('.name')
-    )
-    author = clean_text(author_elem.get_text()) if author_elem else "기자 정보 없음"
 
-    # 발행일시 추출
-    date_elem = (
-        soup.select_one('.date-time') or
-        soup.select_one('time') or
-        soup.select_one('[itemprop="datePublished"]') or
-        soup.select_one('.article-date')
-    )
-    if not date_elem:
-        raise ValueError("발행일시를 찾을 수 없습니다")
-
-    # datetime 속성이 있으면 사용
-    published_at = (
-        date_elem.get('datetime') or
-        date_elem.get('content') or
-        clean_text(date_elem.get_text())
-    )
+def fetch_target(final_url: str) -> str:
+    """
+    실제로 내려받을 URL을 반환합니다.
 
-    # 본문 추출
-    body_elem = (
-        soup.select_one('.article-body') or
-        soup.select_one('#article_body') or
-        soup.find('div', {'itemprop': 'articleBody'}) or
-        soup.select_one('.article_body')
-    )
-    if not body_elem:
-        raise ValueError("본문을 찾을 수 없습니다")
+    기사 URL 패턴과 일치하면 언론사 프로필이 지정한 페이지 변형(fetch_template)을,
+    그 밖의 URL은 그대로 사용합니다.
+    """
+    routed = router.canonicalize(final_url)
+    return routed.fetch_url if routed is not None else final_url
 
-    # 본문 내 불필요한 요소 제거
-    for tag in body_elem.select('script, style, .ad, .advertisement, .related'):
-        tag.decompose()
 
-    # 광고 및 관련 기사 제거
-    for tag in body_elem.find_all(['div', 'aside'], class_=re.compile(r'ad|banner|related|recommend|ab-', re.I)):
-        tag.decompose()
+def source_key(url: str) -> str:
+    """
+    URL의 언론사 구분 키를 반환합니다.
 
-    body = clean_text(body_elem.get_text())
+    지원 언론사 URL이면 SOURCE_MAP 도메인 키를, 단축 URL 등은 호스트명을 사용합니다.
+    언론사별 파서 선택과 일괄 스크래핑의 언론사별 동시 실행 한도에 사용됩니다.
+    """
+    profile = router.route(url)
+    return profile.domain if profile is not None else hostname(url)
 
-    return Article(
-        title=title,
-        author=author,
-        press=press,
-        published_at=published_at,
-        body=body,
-        original_url=url
-    )
 
+def metrics_domain(url: str) -> str:
+    """
+    지표의 도메인 레이블을 반환합니다.
 
-def scrape_hani(url: str) -> Article:
+    지원 언론사이면 SOURCE_MAP 도메인 키를, 단축 URL 등 그 밖의 호스트는 "other"를 사용하여
+    클라이언트가 보낸 임의의 호스트명으로 레이블 값이 끝없이 늘어나지 않도록 합니다.
     """
-    한겨레 기사를 스크래핑합니다.
+    site = source_key(url)
+    return site if site in SOURCE_MAP else "other"
 
-    URL 패턴: www.hani.co.kr/arti/...
+
+def match_domain(final_url: str) -> str:
+    """
+    URL에 해당하는 SOURCE_MAP 도메인 키를 찾습니다.
+
+    URL 문자열이 아닌 호스트명의 접미사로 찾으므로
+    쿼리 파라미터 등에 도메인 문자열이 포함된 URL은 매칭되지 않습니다.
 
     Args:
-        url: 한겨레 기사 URL
+        final_url: 리다이렉트가 해소된 기사 URL
 
     Returns:
-        Article 객체
+        SOURCE_MAP의 도메인 키
 
     Raises:
-        ValueError: 필수 요소를 찾을 수 없는 경우
-        requests.RequestException: 네트워크 에러
+        ValueError: 지원하지 않는 언론사
+    """
+    profile = router.route(final_url)
+    if profile is not None:
+        logger.info(f"매칭된 도메인: {profile.domain}")
+        return profile.domain
+
+    supported_domains = ", ".join(SOURCE_MAP.keys())
+    raise ValueError(
+        f"지원하지 않는 언론사입니다: {final_url}\n"
+        f"지원 도메인: {supported_domains}"
+    )
+
 
-    Note:
-        CSS 셀렉터는 웹사이트 구조 변경에 따라 조정이 필요할 수 있습니다.
+def scrape_article(url: str, use_cache: bool = True) -> Article:
     """
-    try:
-        response = requests.get(
-            url,
-            timeout=TIMEOUT,
-            headers={'User-Agent': USER_AGENT}
-        )
-        response.raise_for_status()
-    except requests.HTTPError as e:
-        if e.response.status_code == 404:
-            raise ValueError(f"기사를 찾을 수 없습니다: {url}")
-        raise
-    except requests.Timeout:
-        raise ValueError(f"요청 시간 초과: {url}")
+    입력 URL을 분석하여 적절한 스크래퍼를 호출하고 Article 객체를 반환합니다.
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    Dispatcher 패턴을 사용하여 URL의 도메인을 확인한 후,
+    SOURCE_MAP에서 해당 스크래퍼 함수를 선택하여 실행합니다.
+    같은 기사의 결과는 article_cache에 도메인별 TTL 동안 보관됩니다.
 
-    # 제목 추출 - 여러 패턴 시도
-    title_elem = (
-        soup.select_one('.article-head-title') or
-        soup.select_one('.title') or
-        soup.select_one('h1.article-title') or
-        soup.select_one('h1')
-    )
-    if not title_elem:
-        raise ValueError("제목을 찾을 수 없습니다")
-    title = clean_text(title_elem.get_text())
+    Args:
+        url: 기사 URL (단축 URL 가능)
+        use_cache: False이면 캐시를 조회하지 않고 새로 스크래핑 (결과는 캐시에 갱신)
 
-    # 언론사 - 한겨레로 고정
-    press = "한겨레"
+    Returns:
+        Article 객체 (제목, 기자, 언론사, 발행일시, 본문, URL)
 
-    # 기자명 추출
-    author_elem = (
-        soup.select_one('.article-writer') or
-        soup.select_one('.byline') or
-        soup.select_one('.name') or
-        soup.select_one('.reporter')
-    )
-    author = clean_text(author_elem.get_text()) if author_elem else "기자 정보 없음"
+    Raises:
+        ValueError: 지원하지 않는 언론사 또는 스크래핑 실패
+        requests.RequestException: 네트워크 에러
 
-    # 발행일시 추출
-    date_elem = (
-        soup.select_one('.article-date') or
-        soup.select_one('.date-time') or
-        soup.select_one('time') or
-        soup.select_one('.date')
-    )
-    if not date_elem:
-        raise ValueError("발행일시를 찾을 수 없습니다")
+    Examples:
+        >>> article = scrape_article("https://n.news.naver.com/mnews/article/...")
+        >>> print(article.title)
+        "기사 제목"
+        >>> print(article.press)
+        "언론사명"
+    """
+    logger.info(f"스크래핑 시작: {url}")
 
-    # datetime 속성이 있으면 사용
-    published_at = (
-        date_elem.get('datetime') or
-        clean_text(date_elem.get_text())
-    )
+    # 1. 단축 URL 처리
+    try:
+        final_url = resolve_url(url)
+        logger.info(f"최종 URL: {final_url}")
+    except requests.RequestException as e:
+        raise ValueError(f"URL 접근 실패: {url}") from e
 
-    # 본문 추출
-    body_elem = (
-        soup.select_one('.article-text') or
-        soup.select_one('#article-text') or
-        soup.select_one('.article-body') or
-        soup.select_one('.text')
-    )
-    if not body_elem:
-        raise ValueError("본문을 찾을 수 없습니다")
+    # 2. 도메인 추출 및 스크래퍼 선택
+    domain = match_domain(final_url)
+    scraper_func = SOURCE_MAP[domain]
+
+    # 3. 캐시 확인
+    cache_key = article_cache_key(final_url)
+    if use_cache:
+        cached = article_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"스크래핑 캐시 적중: {cache_key}")
+            return cached
+
+    # 4. 스크래핑 실행
+    try:
+        article = scraper_func(fetch_target(final_url))
+        logger.info(f"스크래핑 성공: {article.title[:30]}...")
+        article_cache.set(cache_key, article, ttl=ARTICLE_CACHE_TTLS.get(domain))
+        return article
+    except NotImplementedError as e:
+        raise ValueError(str(e)) from e
+    except Exception as e:
+        logger.error(f"스크래핑 실패: {final_url}, 에러: {e}")
+        raise ValueError(f"스크래핑 중 오류 발생: {e}") from e
 
-    # 본문 내 불필요한 요소 제거
-    for tag in body_elem.select('script, style, .ad, .adrs, .related-article'):
-        tag.decompose()
 
-    # 광고 및 관련 기사 제거
-    for tag in body_elem.find_all(['div', 'aside'], class_=re.compile(r'ad|banner|related|recommend', re.I)):
-        tag.decompose()
+async def resolve_url_async(url: str) -> str:
+    """
+    resolve_url의 비동기 버전입니다. 정식 URL 판별과 캐시 규칙은 동일합니다.
+    같은 URL의 리다이렉트 확인이 진행 중이면 새 요청 없이 그 결과를 기다립니다.
 
-    body = clean_text(body_elem.get_text())
+    Args:
+        url: 원본 URL (단축 URL 가능)
 
-    return Article(
-        title=title,
-        author=author,
-        press=press,
-        published_at=published_at,
-        body=body,
-        original_url=url
-    )
+    Returns:
+        최종 리다이렉트된 URL
+
+    Raises:
+        politeness.DomainUnavailableError: 서킷이 열려 있거나 요청 한도 초과
+        requests.RequestException: 네트워크 에러
+    """
+    resolved = _resolve_without_request(url)
+    if resolved is not None:
+        return resolved
 
+    async def run() -> str:
+        try:
+            site = source_key(url)
+            async with politeness.guard_for(site).request():
+                with metrics.SCRAPE_STAGE_SECONDS.time(stage="resolve", domain=metrics_domain(url)):
+                    response = await fetcher.head_async(
+                        url,
+                        allow_redirects=True,
+                        timeout=fetcher.timeouts_for(site)
+                    )
+        except requests.RequestException as e:
+            logger.error(f"URL 리다이렉트 실패: {url}, 에러: {e}")
+            raise
+        redirect_cache.set(url, response.url)
+        return response.url
+
+    return await redirect_flight.do(url, run)
 
-def scrape_hankyung(url: str) -> Article:
+
+async def fetch_page_async(url: str, stop_early: bool = True) -> fetcher.FetchResponse:
     """
-    한국경제 기사를 스크래핑합니다.
+    fetch_page의 비동기 버전입니다. 모든 언론사가 이 함수로 페이지를 내려받습니다.
 
-    URL 패턴: www.hankyung.com/...
+    언론사별 연결/읽기 타임아웃을 사용하고, SCRAPING_HEDGE_DELAY가 설정되어 있으면
+    그 시간 안에 끝나지 않은 요청을 하나 더 보내 먼저 끝난 응답을 사용합니다.
+    헤지 요청도 언론사 요청 한도의 토큰을 쓰며, 토큰이 남아 있지 않으면 보내지 않습니다.
 
     Args:
-        url: 한국경제 기사 URL
+        url: 기사 URL
+        stop_early: False이면 본문 컨테이너 이후도 끝까지 내려받음
 
     Returns:
-        Article 객체
+        FetchResponse 객체 (text: HTML, truncated: 중간에 멈춘 이유)
 
     Raises:
-        ValueError: 필수 요소를 찾을 수 없는 경우
+        politeness.DomainUnavailableError: 서킷이 열려 있거나 요청 한도 초과
+        deadline.DeadlineExceeded: 요청 마감 시각 초과
+        ValueError: 기사를 찾을 수 없거나(404) 요청 시간이 초과된 경우
         requests.RequestException: 네트워크 에러
-
-    Note:
-        CSS 셀렉터는 웹사이트 구조 변경에 따라 조정이 필요할 수 있습니다.
     """
+    site = source_key(url)
+    guard = politeness.guard_for(site)
+
+    async def attempt() -> fetcher.FetchResponse:
+        async with guard.request():
+            response = await fetcher.get_streamed_async(
+                url,
+                max_bytes=fetcher.max_bytes_for(site),
+                stop_after=STREAM_STOP_AFTER.get(site) if stop_early else None,
+                timeout=fetcher.timeouts_for(site)
+            )
+            response.raise_for_status()
+        return response
+
     try:
-        response = requests.get(
-            url,
-            timeout=TIMEOUT,
-            headers={'User-Agent': USER_AGENT}
-        )
-        response.raise_for_status()
+        with metrics.SCRAPE_STAGE_SECONDS.time(stage="fetch", domain=site):
+            response = await fetcher.hedged(attempt, can_hedge=guard.can_send_now)
     except requests.HTTPError as e:
         if e.response.status_code == 404:
             raise ValueError(f"기사를 찾을 수 없습니다: {url}")
@@ -762,147 +808,156 @@ def scrape_hankyung(url: str) -> Article:
     except requests.Timeout:
         raise ValueError(f"요청 시간 초과: {url}")
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    return response
 
-    # 제목 추출 - 여러 패턴 시도
-    title_elem = (
-        soup.select_one('.headline') or
-        soup.select_one('.article-tit') or
-        soup.select_one('h1.title') or
-        soup.select_one('h1')
-    )
-    if not title_elem:
-        raise ValueError("제목을 찾을 수 없습니다")
-    title = clean_text(title_elem.get_text())
 
-    # 언론사 - 한국경제로 고정
-    press = "한국경제"
-
-    # 기자명 추출
-    author_elem = (
-        soup.select_one('.byline') or
-        soup.select_one('.reporter') or
-        soup.select_one('.author') or
-        soup.select_one('.journalist')
-    )
-    author = clean_text(author_elem.get_text()) if author_elem else "기자 정보 없음"
-
-    # 발행일시 추출
-    date_elem = (
-        soup.select_one('.date-time') or
-        soup.select_one('.article-date') or
-        soup.select_one('time') or
-        soup.select_one('.txt-date')
-    )
-    if not date_elem:
-        raise ValueError("발행일시를 찾을 수 없습니다")
-
-    # datetime 속성이 있으면 사용
-    published_at = (
-        date_elem.get('datetime') or
-        clean_text(date_elem.get_text())
-    )
-
-    # 본문 추출
-    body_elem = (
-        soup.select_one('.article-body') or
-        soup.select_one('#articletxt') or
-        soup.select_one('.txt-article') or
-        soup.select_one('.news-text')
-    )
-    if not body_elem:
-        raise ValueError("본문을 찾을 수 없습니다")
+async def scrape_article_async(url: str, use_cache: bool = True) -> Article:
+    """
+    scrape_article의 비동기 버전입니다.
 
-    # 본문 내 불필요한 요소 제거
-    for tag in body_elem.select('script, style, .ad, .advertisement, .related'):
-        tag.decompose()
+    리다이렉트 해소와 페이지 다운로드는 이벤트 루프에서 비동기로 수행하고,
+    CPU를 사용하는 HTML 파싱은 스레드(또는 프로세스 풀, parse_async 참고)로 넘겨
+    이벤트 루프를 막지 않습니다.
+    하나의 워커가 여러 스크래핑 요청을 동시에 처리할 수 있습니다.
+    결과 캐시는 scrape_article과 공유합니다.
 
-    # 광고 및 관련 기사 제거
-    for tag in body_elem.find_all(['div', 'aside'], class_=re.compile(r'ad|banner|related|recommend', re.I)):
-        tag.decompose()
+    같은 기사(정식 URL)의 스크래핑이 진행 중이면 새로 내려받지 않고 그 결과를 기다리므로,
+    많은 사용자가 같은 기사를 동시에 요청해도 언론사에는 한 번만 요청합니다.
+    (use_cache=False여도 진행 중인 스크래핑은 새 결과이므로 합류합니다.)
 
-    body = clean_text(body_elem.get_text())
+    Args:
+        url: 기사 URL (단축 URL 가능)
+        use_cache: False이면 캐시를 조회하지 않고 새로 스크래핑 (결과는 캐시에 갱신)
 
-    return Article(
-        title=title,
-        author=author,
-        press=press,
-        published_at=published_at,
-        body=body,
-        original_url=url
-    )
+    Returns:
+        Article 객체
 
+    Raises:
+        politeness.DomainUnavailableError: 언론사 장애로 서킷이 열려 있거나 요청 한도 초과
+        deadline.DeadlineExceeded: 요청 마감 시각 초과 (마감 시각은 호출자가 run_with_deadline으로 설정)
+        ValueError: 지원하지 않는 언론사 또는 스크래핑 실패
+    """
+    logger.info(f"스크래핑 시작 (async): {url}")
 
-# 도메인 → 스크래퍼 함수 매핑
-SOURCE_MAP: Dict[str, Callable[[str], Article]] = {
-    "naver.com": scrape_naver,
-    "daum.net": scrape_daum,
-    "yna.co.kr": scrape_yonhap,
-    "chosun.com": scrape_chosun,
-    "joongang.co.kr": scrape_joongang,
-    "hani.co.kr": scrape_hani,
-    "hankyung.com": scrape_hankyung,
-}
+    # 결과 지표 - 리다이렉트 실패, 지원하지 않는 언론사, 진행 중인 스크래핑을 기다리다
+    # 마감 시각이 지난 경우까지 요청마다 한 번 기록 (도메인 레이블은 SOURCE_MAP 키 또는 other)
+    label = metrics_domain(url)
+    outcome: Optional[str] = "error"
+    try:
+        # 1. 단축 URL 처리
+        try:
+            final_url = await resolve_url_async(url)
+            logger.info(f"최종 URL: {final_url}")
+        except requests.RequestException as e:
+            raise ValueError(f"URL 접근 실패: {url}") from e
+
+        # 2. 도메인 추출
+        domain = label = match_domain(final_url)
+
+        # 3. 캐시 확인
+        cache_key = article_cache_key(final_url)
+        if use_cache:
+            cached = article_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"스크래핑 캐시 적중: {cache_key}")
+                outcome = "cached"
+                return cached
+
+        # 4. 다운로드 후 파싱은 스레드/프로세스 풀에서 실행 (같은 기사의 진행 중인 스크래핑에 합류)
+        async def run() -> Article:
+            try:
+                fetch_url = fetch_target(final_url)
+                page = await fetch_page_async(fetch_url)
+                try:
+                    article = await parse_async(domain, page.text, fetch_url)
+                except Exception as e:
+                    if page.truncated != "container":
+                        raise
+                    logger.warning(f"조기 종료한 페이지 파싱 실패, 전체 페이지로 재시도: {fetch_url}, 에러: {e}")
+                    article = None
+                else:
+                    if is_early_stop_suspect(page, article):
+                        logger.warning(f"조기 종료한 페이지의 본문이 짧음, 전체 페이지로 재시도: {fetch_url}")
+                        article = None
+                if article is None:
+                    page = await fetch_page_async(fetch_url, stop_early=False)
+                    article = await parse_async(domain, page.text, fetch_url)
+                logger.info(f"스크래핑 성공: {article.title[:30]}...")
+                article_cache.set(cache_key, article, ttl=ARTICLE_CACHE_TTLS.get(domain))
+                return article
+            except (politeness.DomainUnavailableError, deadline.DeadlineExceeded):
+                raise
+            except NotImplementedError as e:
+                raise ValueError(str(e)) from e
+            except Exception as e:
+                logger.error(f"스크래핑 실패: {final_url}, 에러: {e}")
+                raise ValueError(f"스크래핑 중 오류 발생: {e}") from e
+
+        article = await article_flight.do(cache_key, run)
+        outcome = "ok"
+        return article
+    except politeness.DomainUnavailableError:
+        outcome = "unavailable"
+        raise
+    except deadline.DeadlineExceeded:
+        outcome = "timeout"
+        raise
+    except asyncio.CancelledError:
+        # 마감 시각에 run_with_deadline이 취소했으면 시간 초과, 클라이언트 연결 종료 등은 기록하지 않음
+        outcome = "timeout" if deadline.expired() else None
+        raise
+    finally:
+        if outcome is not None:
+            metrics.SCRAPE_RESULTS.inc(domain=label, outcome=outcome)
 
 
-def scrape_article(url: str) -> Article:
+async def scrape_articles_async(
+    urls: List[str],
+    use_cache: bool = True,
+    max_concurrency: int = BATCH_MAX_CONCURRENCY,
+    per_domain_concurrency: int = BATCH_PER_DOMAIN_CONCURRENCY
+) -> AsyncIterator[Tuple[int, str, Union[Article, Exception]]]:
     """
-    입력 URL을 분석하여 적절한 스크래퍼를 호출하고 Article 객체를 반환합니다.
+    여러 기사를 동시에 스크래핑하고 완료되는 순서대로 결과를 내보냅니다.
 
-    Dispatcher 패턴을 사용하여 URL의 도메인을 확인한 후,
-    SOURCE_MAP에서 해당 스크래퍼 함수를 선택하여 실행합니다.
+    전체 동시 실행 수와 언론사별 동시 실행 수를 제한하여,
+    느린 언론사가 다른 언론사의 처리를 막거나 한 사이트에 요청이 몰리지 않도록 합니다.
+    URL마다 슬롯을 얻은 시점부터 SCRAPING_DEADLINE의 시간 예산이 적용됩니다.
+    개별 URL의 실패는 예외 객체로 내보내며 나머지 작업은 계속 진행됩니다.
 
     Args:
-        url: 기사 URL (단축 URL 가능)
-
-    Returns:
-        Article 객체 (제목, 기자, 언론사, 발행일시, 본문, URL)
+        urls: 기사 URL 목록
+        use_cache: False이면 캐시를 조회하지 않고 새로 스크래핑
+        max_concurrency: 전체 동시 실행 한도
+        per_domain_concurrency: 언론사별 동시 실행 한도
 
-    Raises:
-        ValueError: 지원하지 않는 언론사 또는 스크래핑 실패
-        requests.RequestException: 네트워크 에러
-
-    Examples:
-        >>> article = scrape_article("https://n.news.naver.com/mnews/article/...")
-        >>> print(article.title)
-        "기사 제목"
-        >>> print(article.press)
-        "언론사명"
+    Yields:
+        (입력 순서 인덱스, URL, Article 또는 예외) 튜플
     """
-    logger.info(f"스크래핑 시작: {url}")
-
-    # 1. 단축 URL 처리
-    try:
-        final_url = resolve_url(url)
-        logger.info(f"최종 URL: {final_url}")
-    except requests.RequestException as e:
-        raise ValueError(f"URL 접근 실패: {url}") from e
+    global_semaphore = asyncio.Semaphore(max_concurrency)
+    domain_semaphores: Dict[str, asyncio.Semaphore] = {}
 
-    # 2. 도메인 추출 및 스크래퍼 선택
-    scraper_func = None
-    for domain, func in SOURCE_MAP.items():
-        if domain in final_url:
-            scraper_func = func
-            logger.info(f"매칭된 도메인: {domain}")
-            break
-
-    if not scraper_func:
-        supported_domains = ", ".join(SOURCE_MAP.keys())
-        raise ValueError(
-            f"지원하지 않는 언론사입니다: {final_url}\n"
-            f"지원 도메인: {supported_domains}"
+    async def run(index: int, url: str) -> Tuple[int, str, Union[Article, Exception]]:
+        domain_semaphore = domain_semaphores.setdefault(
+            source_key(url), asyncio.Semaphore(per_domain_concurrency)
         )
-
-    # 3. 스크래핑 실행
+        # 언론사 슬롯을 먼저 얻어야 대기 중인 작업이 전체 슬롯을 점유하지 않습니다.
+        async with domain_semaphore, global_semaphore:
+            try:
+                return index, url, await deadline.run_with_deadline(
+                    scrape_article_async(url, use_cache=use_cache)
+                )
+            except Exception as e:
+                return index, url, e
+
+    tasks = [asyncio.ensure_future(run(index, url)) for index, url in enumerate(urls)]
     try:
-        article = scraper_func(final_url)
-        logger.info(f"스크래핑 성공: {article.title[:30]}...")
-        return article
-    except NotImplementedError as e:
-        raise ValueError(str(e)) from e
-    except Exception as e:
-        logger.error(f"스크래핑 실패: {final_url}, 에러: {e}")
-        raise ValueError(f"스크래핑 중 오류 발생: {e}") from e
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # 클라이언트 연결이 끊긴 경우 남은 작업 취소
+        for task in tasks:
+            task.cancel()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,337 @@
+"""
+언론사 프로필 모듈
+
+언론사별 추출 규칙(셀렉터, 본문 정리 규칙, 발행일시 규칙, URL 패턴 등)을
+선언적으로 정의합니다. 스크래퍼는 프로필을 해석하는 하나의 추출 엔진
+(scraper.parse_with_profile)만 가지며, 새 언론사는 프로필을 추가하는 것만으로 지원할 수 있습니다.
+
+모든 셀렉터와 정규식은 모듈을 불러올 때 한 번만 컴파일하므로
+요청마다 셀렉터 문자열을 해석하거나 정규식을 다시 컴파일하지 않습니다.
+
+환경 변수:
+- SITE_PROFILES_FILE: 추가 프로필 JSON 파일 경로 (선택사항)
+  SiteProfile 필드를 키로 하는 객체의 배열이며, 기본 프로필과 domain이 같으면 교체합니다.
+  예: [{"domain": "example.com", "name": "예시일보", "press": "예시일보",
+        "title": ["h1"], "date": ["time"], "body": [".article"], "date_attrs": ["datetime"]}]
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+import json
+import logging
+import os
+import re
+
+from parsers import CompiledSelector, NoiseFilter
+
+logger = logging.getLogger(__name__)
+
+SITE_PROFILES_FILE = os.getenv("SITE_PROFILES_FILE", "")
+
+# 발행일시 변환 규칙 (scraper 모듈의 변환 함수 이름과 대응)
+# - iso: ISO 8601 또는 "YYYY.MM.DD HH:MM" 값 → KST 기준 "YYYY-MM-DD HH:MM"
+# - korean: "입력 2025.11.14. 오후 2:30" 형식 → "YYYY-MM-DD HH:MM"
+DATE_FORMATS = ("iso", "korean")
+
+# <head> 메타데이터에서 읽을 수 있는 항목
+METADATA_FIELDS = ("title", "author", "published_at")
+
+
+@dataclass
+class SiteProfile:
+    """
+    언론사별 추출 규칙
+
+    셀렉터 목록은 앞에서부터 차례로 시도하여 처음 찾은 요소를 사용합니다.
+
+    Attributes:
+        domain: 언론사 도메인 키 (예: "naver.com")
+        name: 언론사 표시 이름 (로그용)
+        title: 제목 셀렉터 목록
+        date: 발행일시 셀렉터 목록
+        body: 본문 셀렉터 목록
+        author: 기자명 셀렉터 목록 (찾지 못하면 "기자 정보 없음")
+        press: 고정 언론사명 (press_selectors가 없을 때 사용)
+        press_selectors: 언론사명이 있는 요소의 셀렉터 목록 (포털용)
+        press_attr: 언론사명이 있는 속성 이름 (press_selectors와 함께 사용)
+        date_attrs: 발행일시를 먼저 읽을 속성 이름 목록 (없으면 요소 텍스트 사용)
+        date_format: 발행일시 변환 규칙 (DATE_FORMATS 중 하나, 생략 시 변환 없음)
+        metadata_fields: <head>의 JSON-LD/메타 태그에서 먼저 읽을 항목
+            ("title", "author", "published_at" 중, 찾지 못한 항목만 셀렉터 사용)
+        noise_selector: 본문에서 제거할 요소의 셀렉터
+        noise_tags: 클래스 패턴으로 제거할 요소의 태그 이름 목록
+        noise_class_pattern: 제거할 요소의 클래스 정규식 (대소문자 무시)
+        url_patterns: 기사 URL 정규식 목록 ("호스트명/경로" 전체와 비교, 모바일·AMP 등 변형 포함)
+            일치하는 URL은 리다이렉트 확인(HEAD) 없이 정식 URL로 정규화합니다.
+        canonical_template: 정식 URL 템플릿 (패턴의 이름 있는 그룹과 쿼리 파라미터 사용)
+        fetch_template: 실제로 내려받을 URL 템플릿 (생략 시 정식 URL,
+            같은 기사의 더 가벼운 페이지 변형을 지정할 때 사용)
+        stream_stop_after: 본문 컨테이너 시작 태그의 속성 패턴
+            (제목·기자·발행일시가 모두 본문보다 앞에 있을 때만 지정, 다운로드 조기 종료용)
+        cache_ttl: 결과 캐시 유지 시간 (초, 생략 시 ARTICLE_CACHE_TTL)
+    """
+    domain: str
+    name: str
+    title: Tuple[str, ...]
+    date: Tuple[str, ...]
+    body: Tuple[str, ...]
+    author: Tuple[str, ...] = ()
+    press: Optional[str] = None
+    press_selectors: Tuple[str, ...] = ()
+    press_attr: str = ""
+    date_attrs: Tuple[str, ...] = ()
+    date_format: Optional[str] = None
+    metadata_fields: Tuple[str, ...] = METADATA_FIELDS
+    noise_selector: str = "script, style"
+    noise_tags: Tuple[str, ...] = ("div", "aside")
+    noise_class_pattern: Optional[str] = None
+    url_patterns: Tuple[str, ...] = ()
+    canonical_template: str = ""
+    fetch_template: Optional[str] = None
+    stream_stop_after: Optional[str] = None
+    cache_ttl: Optional[float] = None
+
+    # 시작 시 컴파일되는 값
+    title_selectors: Tuple[CompiledSelector, ...] = field(init=False, repr=False)
+    author_selectors: Tuple[CompiledSelector, ...] = field(init=False, repr=False)
+    date_selectors: Tuple[CompiledSelector, ...] = field(init=False, repr=False)
+    body_selectors: Tuple[CompiledSelector, ...] = field(init=False, repr=False)
+    press_element_selectors: Tuple[CompiledSelector, ...] = field(init=False, repr=False)
+    noise_filter: NoiseFilter = field(init=False, repr=False)
+    url_regexes: Tuple[Pattern, ...] = field(init=False, repr=False)
+    targets: Tuple[str, ...] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if not self.title or not self.date or not self.body:
+            raise ValueError(f"{self.domain}: title, date, body 셀렉터는 필수입니다")
+        if self.press is None and not (self.press_selectors and self.press_attr):
+            raise ValueError(f"{self.domain}: press 또는 press_selectors/press_attr가 필요합니다")
+        if self.date_format is not None and self.date_format not in DATE_FORMATS:
+            raise ValueError(f"{self.domain}: 지원하지 않는 date_format: {self.date_format}")
+        if self.url_patterns and not self.canonical_template:
+            raise ValueError(f"{self.domain}: url_patterns에는 canonical_template이 필요합니다")
+        unknown_fields = set(self.metadata_fields) - set(METADATA_FIELDS)
+        if unknown_fields:
+            raise ValueError(f"{self.domain}: 지원하지 않는 metadata_fields: {', '.join(sorted(unknown_fields))}")
+
+        self.title_selectors = _compile_all(self.title)
+        self.author_selectors = _compile_all(self.author)
+        self.date_selectors = _compile_all(self.date)
+        self.body_selectors = _compile_all(self.body)
+        self.press_element_selectors = _compile_all(self.press_selectors)
+        self.noise_filter = NoiseFilter(
+            self.noise_selector,
+            self.noise_tags,
+            re.compile(self.noise_class_pattern, re.I) if self.noise_class_pattern else None
+        )
+        # 끝의 "/" 유무와 관계없이 일치하도록 컴파일
+        self.url_regexes = tuple(re.compile(rf'(?:{pattern})/?') for pattern in self.url_patterns)
+        # 부분 파싱 대상: 프로필이 사용하는 셀렉터 전체
+        self.targets = self.title + self.press_selectors + self.author + self.date + self.body
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SiteProfile":
+        """
+        JSON 객체에서 프로필을 만듭니다.
+
+        Args:
+            data: SiteProfile 필드를 키로 하는 딕셔너리 (셀렉터 목록은 배열)
+
+        Returns:
+            SiteProfile 객체
+
+        Raises:
+            ValueError: 알 수 없는 필드가 있거나 필수 필드가 없는 경우
+        """
+        init_fields = {f.name for f in fields(cls) if f.init}
+        unknown = set(data) - init_fields
+        if unknown:
+            raise ValueError(f"알 수 없는 프로필 필드: {', '.join(sorted(unknown))}")
+        values = {
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in data.items()
+        }
+        try:
+            return cls(**values)
+        except TypeError as e:
+            raise ValueError(f"프로필 필수 필드 누락: {e}") from e
+
+
+def _compile_all(selectors: Tuple[str, ...]) -> Tuple[CompiledSelector, ...]:
+    """셀렉터 목록을 순서대로 컴파일합니다."""
+    return tuple(CompiledSelector(css) for css in selectors)
+
+
+# 기본 언론사 프로필 (7개 언론사)
+# CSS 셀렉터는 웹사이트 구조 변경에 따라 조정이 필요할 수 있습니다.
+DEFAULT_PROFILES: List[SiteProfile] = [
+    # 네이버 뉴스: n.news.naver.com/mnews/article/{언론사코드}/{기사번호}
+    SiteProfile(
+        domain="naver.com",
+        name="네이버 뉴스",
+        title=('#title_area > span',),
+        press_selectors=('img.media_end_head_top_logo_img.light_type',),
+        press_attr="title",
+        author=('.media_end_head_journalist_name',),
+        date=('.media_end_head_info_datestamp_time',),
+        date_attrs=("data-date-time",),
+        date_format="iso",
+        # 포털 메타 태그의 작성자는 언론사명이므로 기자명은 셀렉터로 찾음
+        metadata_fields=("title", "published_at"),
+        body=('#dic_area',),
+        noise_selector='script, style, a.media_end_head_autosummary_button',
+        noise_tags=("div", "span"),
+        noise_class_pattern=r'ad|banner|related',
+        url_patterns=(
+            r'(?:n\.news|m\.news|news)\.naver\.com/(?:mnews/)?(?:amp/)?article/(?:print/)?(?P<oid>\d+)/(?P<aid>\d+)',
+            # 구형 주소: news.naver.com/main/read.naver?oid=001&aid=0014612345
+            r'(?:m\.news|news)\.naver\.com/(?:main/)?read\.(?:naver|nhn)',
+        ),
+        canonical_template="https://n.news.naver.com/mnews/article/{oid}/{aid}",
+        stream_stop_after=r'\bid="dic_area"',
+        cache_ttl=300,
+    ),
+    # 다음 뉴스: v.daum.net/v/{기사ID}
+    SiteProfile(
+        domain="daum.net",
+        name="다음 뉴스",
+        title=('.tit_view',),
+        press_selectors=('img#kakaoServiceLogo',),
+        press_attr="alt",
+        author=('.info_view .txt_info',),
+        date=('.info_view .num_date',),
+        date_format="korean",
+        metadata_fields=("title", "published_at"),
+        body=('.article_view',),
+        noise_tags=("div", "section"),
+        noise_class_pattern=r'related|popular|recommend',
+        url_patterns=(r'(?:(?:m\.)?v|news\.v|(?:m\.)?media)\.daum\.net/v/(?P<id>\w+)',),
+        canonical_template="https://v.daum.net/v/{id}",
+        stream_stop_after=r'\bclass="[^"]*\barticle_view\b',
+        cache_ttl=300,
+    ),
+    # 연합뉴스: www.yna.co.kr/view/...
+    SiteProfile(
+        domain="yna.co.kr",
+        name="연합뉴스",
+        press="연합뉴스",
+        title=('h1.tit', '.article-head h1', 'h1'),
+        author=('.writer', '.byline', '.journalist'),
+        date=('div.info-box01 span.txt-time', '.update-time', 'time', '.date'),
+        date_format="iso",
+        body=('.article-body', '.story-news', '.content'),
+        noise_selector='script, style, .ad, .adrs, .related-news',
+        noise_class_pattern=r'ad|banner|related|recommend',
+        url_patterns=(r'(?:www\.|m\.)?yna\.co\.kr/(?:amp/|print/)?view/(?P<id>[A-Z]{3}\d+)',),
+        canonical_template="https://www.yna.co.kr/view/{id}",
+        cache_ttl=600,
+    ),
+    # 조선일보: www.chosun.com/...
+    SiteProfile(
+        domain="chosun.com",
+        name="조선일보",
+        press="조선일보",
+        title=('h1.article-header__headline', '.article-title', 'h1[itemprop="headline"]', 'h1'),
+        author=('.article-header__reporter', '.byline', '[itemprop="author"]', '.reporter'),
+        date=('.article-header__date', 'time', '[itemprop="datePublished"]', '.date'),
+        date_attrs=("datetime", "content"),
+        date_format="iso",
+        body=('section.article-body', 'section[itemprop="articleBody"]', '.article-content', '.story-body'),
+        noise_selector='script, style, .ad, .advertisement, .related-article',
+        noise_tags=("div", "aside", "section"),
+        noise_class_pattern=r'ad|banner|related|recommend|promotion',
+        url_patterns=(r'(?:www\.|m\.)?chosun\.com/(?P<path>(?:[\w-]+/)+\d{4}/\d{2}/\d{2}/\w+)',),
+        canonical_template="https://www.chosun.com/{path}/",
+    ),
+    # 중앙일보: www.joongang.co.kr/article/...
+    SiteProfile(
+        domain="joongang.co.kr",
+        name="중앙일보",
+        press="중앙일보",
+        title=('h1.headline', '.article-title', 'h1[itemprop="headline"]', '.head-title', 'h1'),
+        author=('.reporter', '.byline', '[itemprop="author"]', '.name'),
+        date=('.date-time', 'time', '[itemprop="datePublished"]', '.article-date'),
+        date_attrs=("datetime", "content"),
+        date_format="iso",
+        body=('.article-body', '#article_body', 'div[itemprop="articleBody"]', '.article_body'),
+        noise_selector='script, style, .ad, .advertisement, .related',
+        noise_class_pattern=r'ad|banner|related|recommend|ab-',
+        url_patterns=(r'(?:www\.|mnews\.)?joongang\.co\.kr/(?:amp)?article/(?P<id>\d+)',),
+        canonical_template="https://www.joongang.co.kr/article/{id}",
+    ),
+    # 한겨레: www.hani.co.kr/arti/...
+    SiteProfile(
+        domain="hani.co.kr",
+        name="한겨레",
+        press="한겨레",
+        title=('.article-head-title', '.title', 'h1.article-title', 'h1'),
+        author=('.article-writer', '.byline', '.name', '.reporter'),
+        date=('.article-date', '.date-time', 'time', '.date'),
+        date_attrs=("datetime",),
+        date_format="iso",
+        body=('.article-text', '#article-text', '.article-body', '.text'),
+        noise_selector='script, style, .ad, .adrs, .related-article',
+        noise_class_pattern=r'ad|banner|related|recommend',
+        url_patterns=(r'(?:www\.|m\.)?hani\.co\.kr/(?:amp/)?arti/(?P<path>(?:[\w-]+/)*\d+\.html)',),
+        canonical_template="https://www.hani.co.kr/arti/{path}",
+    ),
+    # 한국경제: www.hankyung.com/...
+    SiteProfile(
+        domain="hankyung.com",
+        name="한국경제",
+        press="한국경제",
+        title=('.headline', '.article-tit', 'h1.title', 'h1'),
+        author=('.byline', '.reporter', '.author', '.journalist'),
+        date=('.date-time', '.article-date', 'time', '.txt-date'),
+        date_attrs=("datetime",),
+        date_format="iso",
+        body=('.article-body', '#articletxt', '.txt-article', '.news-text'),
+        noise_selector='script, style, .ad, .advertisement, .related',
+        noise_class_pattern=r'ad|banner|related|recommend',
+        url_patterns=(r'(?:www\.|mobile\.)?hankyung\.com/(?:[\w-]+/)?article/(?P<id>\d+\w*)',),
+        canonical_template="https://www.hankyung.com/article/{id}",
+    ),
+]
+
+
+def load_profiles(path: str) -> List[SiteProfile]:
+    """
+    JSON 파일에서 프로필 목록을 읽습니다.
+
+    Args:
+        path: JSON 파일 경로 (프로필 객체의 배열)
+
+    Returns:
+        SiteProfile 목록
+
+    Raises:
+        ValueError: 파일 형식이 잘못되었거나 프로필이 유효하지 않은 경우
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        raise ValueError(f"프로필 파일은 배열이어야 합니다: {path}")
+    return [SiteProfile.from_dict(item) for item in data]
+
+
+def build_registry(extra_profiles_file: str = "") -> Dict[str, SiteProfile]:
+    """
+    기본 프로필과 추가 프로필 파일을 합쳐 도메인 → 프로필 레지스트리를 만듭니다.
+
+    Args:
+        extra_profiles_file: 추가 프로필 JSON 파일 경로 (빈 문자열이면 기본 프로필만 사용)
+
+    Returns:
+        도메인 키 → SiteProfile 딕셔너리 (등록 순서 유지)
+    """
+    registry = {profile.domain: profile for profile in DEFAULT_PROFILES}
+    if extra_profiles_file:
+        for profile in load_profiles(extra_profiles_file):
+            action = "교체" if profile.domain in registry else "추가"
+            logger.info(f"언론사 프로필 {action}: {profile.domain} ({profile.name})")
+            registry[profile.domain] = profile
+    return registry
+
+
+# 도메인 키 → 언론사 프로필
+SITE_PROFILES: Dict[str, SiteProfile] = build_registry(SITE_PROFILES_FILE)
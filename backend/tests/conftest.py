@@ -0,0 +1,6 @@
+"""백엔드 모듈(fetcher, scraper 등)을 backend/ 디렉터리 기준으로 import할 수 있게 합니다."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
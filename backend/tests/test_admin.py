@@ -0,0 +1,49 @@
+"""/admin/domains 관리 엔드포인트 인증 테스트"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import politeness
+
+TOKEN = "test-admin-token"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", TOKEN)
+    monkeypatch.setattr(politeness, "_guards", {})
+    return TestClient(main.app)
+
+
+def test_admin_routes_disabled_without_configured_token(client, monkeypatch):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", None)
+
+    assert client.get("/admin/domains", headers={"X-Admin-Token": TOKEN}).status_code == 403
+    assert client.post("/admin/domains/naver.com/reset").status_code == 403
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Admin-Token": "wrong"}])
+def test_admin_routes_reject_missing_or_wrong_token(client, headers):
+    assert client.get("/admin/domains", headers=headers).status_code == 401
+    assert client.post("/admin/domains/naver.com/reset", headers=headers).status_code == 401
+
+
+def test_reset_closes_open_breaker(client):
+    guard = politeness.guard_for("naver.com")
+    for _ in range(guard.breaker.failure_threshold):
+        guard.breaker.record_failure("timeout")
+    assert guard.breaker.state == politeness.OPEN
+
+    response = client.post("/admin/domains/naver.com/reset", headers={"X-Admin-Token": TOKEN})
+
+    assert response.status_code == 200
+    assert response.json()["state"] == politeness.CLOSED
+
+
+def test_reset_unknown_domain_is_404_without_creating_guard(client):
+    response = client.post("/admin/domains/unknown.example/reset", headers={"X-Admin-Token": TOKEN})
+
+    assert response.status_code == 404
+    assert response.json()["detail"]["error"] == "언론사 없음"
+    assert client.get("/admin/domains", headers={"X-Admin-Token": TOKEN}).json() == {}
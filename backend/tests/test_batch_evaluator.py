@@ -0,0 +1,176 @@
+"""batch_evaluator 일괄 평가 작업 테스트 (Message Batches API 대역 사용)"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import batch_evaluator
+from cache import TTLCache
+from evaluator import EVALUATION_TOOL, SCORE_KEYS
+
+EVALUATION = {
+    "evaluation_summary": "요약",
+    "scores": {key: 7 for key in SCORE_KEYS},
+    "detailed_feedback": "피드백",
+}
+
+
+class FakeBatches:
+    """
+    client.messages.batches 대역 - create/retrieve/results만 구현합니다.
+
+    Attributes:
+        statuses: retrieve가 차례로 반환할 processing_status 목록 (마지막 값을 계속 반환)
+        outcomes: 본문 → 결과 종류 (succeeded, errored, expired)
+    """
+
+    def __init__(self, statuses, outcomes):
+        self.statuses = list(statuses)
+        self.outcomes = outcomes
+        self.submitted = []
+        self.retrieved = 0
+
+    async def create(self, requests):
+        self.submitted = list(requests)
+        return SimpleNamespace(id="msgbatch_test", processing_status="in_progress")
+
+    async def retrieve(self, batch_id):
+        status = self.statuses[min(self.retrieved, len(self.statuses) - 1)]
+        self.retrieved += 1
+        return SimpleNamespace(id=batch_id, processing_status=status)
+
+    async def results(self, batch_id):
+        entries = [
+            SimpleNamespace(custom_id=request["custom_id"], result=self._result(request))
+            for request in self.submitted
+        ]
+
+        async def iterate():
+            for entry in entries:
+                yield entry
+
+        return iterate()
+
+    def _result(self, request):
+        content = request["params"]["messages"][0]["content"]
+        text = content if isinstance(content, str) else "".join(block.get("text", "") for block in content)
+        outcome = next(kind for body, kind in self.outcomes.items() if body in text)
+        if outcome == "succeeded":
+            block = SimpleNamespace(type="tool_use", name=EVALUATION_TOOL["name"], input=EVALUATION)
+            return SimpleNamespace(type="succeeded", message=SimpleNamespace(content=[block]))
+        if outcome == "errored":
+            error = SimpleNamespace(error=SimpleNamespace(message="overloaded"))
+            return SimpleNamespace(type="errored", error=error)
+        return SimpleNamespace(type=outcome)
+
+
+def fake_client(batches):
+    return SimpleNamespace(messages=SimpleNamespace(batches=batches))
+
+
+@pytest.fixture
+def store():
+    store = batch_evaluator.BatchJobStore(":memory:")
+    yield store
+    store.close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    cache = TTLCache("evaluation_test", maxsize=100, ttl=60)
+    monkeypatch.setattr(batch_evaluator, "evaluation_cache", cache)
+    return cache
+
+
+def test_submit_poll_and_ingest(store, fresh_cache):
+    batches = FakeBatches(
+        statuses=["in_progress", "ended"],
+        outcomes={"성공 기사": "succeeded", "오류 기사": "errored", "만료 기사": "expired"}
+    )
+    client = fake_client(batches)
+    articles = [
+        ("성공 기사 본문", "제목1"),
+        ("오류 기사 본문", "제목2"),
+        ("만료 기사 본문", "제목3"),
+        ("성공 기사 본문", "제목1"),
+    ]
+
+    async def scenario():
+        job = await batch_evaluator.submit_job(client, articles, store=store)
+        first = await batch_evaluator.poll_job(client, job["job_id"], store)
+        second = await batch_evaluator.poll_job(client, job["job_id"], store)
+        return job, first, second
+
+    job, first, second = asyncio.run(scenario())
+
+    # 같은 기사는 한 번만 제출
+    assert len(batches.submitted) == 3
+    assert job["status"] == "in_progress" and job["pending"] == 4
+    assert first["status"] == "in_progress" and first["pending"] == 4
+    assert store.active_jobs() == []
+
+    assert second["status"] == batch_evaluator.JOB_ENDED
+    assert (second["succeeded"], second["errored"], second["pending"]) == (2, 2, 0)
+
+    results = store.get_job(job["job_id"], include_results=True)["results"]
+    assert [item["status"] for item in results] == ["ok", "error", "error", "ok"]
+    assert results[0]["evaluation"]["scores"] == EVALUATION["scores"]
+    assert "overloaded" in results[1]["error"]
+    assert "expired" in results[2]["error"]
+    assert fresh_cache.get(batches.submitted[0]["custom_id"]) is not None
+
+
+def test_cached_articles_are_not_submitted(store, fresh_cache):
+    batches = FakeBatches(statuses=["ended"], outcomes={})
+    key = batch_evaluator.planned_cache_key("캐시된 본문", None, batch_evaluator.BATCH_LONG_ARTICLE_MODE)
+    fresh_cache.set(key, {**EVALUATION, "input_budget": None})
+
+    job = asyncio.run(batch_evaluator.submit_job(fake_client(batches), [("캐시된 본문", None)], store=store))
+
+    assert batches.submitted == []
+    assert job["status"] == batch_evaluator.JOB_ENDED
+    assert job["succeeded"] == 1
+
+
+def test_poller_ingests_active_jobs(store):
+    batches = FakeBatches(statuses=["ended"], outcomes={"성공 기사": "succeeded"})
+    client = fake_client(batches)
+
+    async def scenario():
+        job = await batch_evaluator.submit_job(client, [("성공 기사 본문", None)], store=store)
+        poller = asyncio.create_task(batch_evaluator.run_poller(client, store, interval=0.01))
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if not store.active_jobs():
+                break
+        poller.cancel()
+        return job
+
+    job = asyncio.run(scenario())
+
+    assert store.get_job(job["job_id"])["succeeded"] == 1
+
+
+def test_submit_plans_articles_concurrently(store, monkeypatch):
+    real_plan_input = batch_evaluator.plan_input
+    running = 0
+    peak = 0
+
+    async def slow_plan_input(*args):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return await real_plan_input(*args)
+
+    monkeypatch.setattr(batch_evaluator, "plan_input", slow_plan_input)
+    monkeypatch.setattr(batch_evaluator, "EVALUATION_BATCH_CONCURRENCY", 4)
+    batches = FakeBatches(statuses=["in_progress"], outcomes={})
+    articles = [(f"기사 본문 {i}", None) for i in range(10)]
+
+    asyncio.run(batch_evaluator.submit_job(fake_client(batches), articles, store=store))
+
+    assert peak == 4
+    assert len(batches.submitted) == 10
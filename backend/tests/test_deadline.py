@@ -0,0 +1,197 @@
+"""요청 마감 시각, 헤지 요청, 마감 시각에 걸린 요청의 서킷 브레이커 기록 테스트"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+import deadline
+import fetcher
+import politeness
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_run_with_deadline_cancels_and_raises():
+    cancelled = False
+
+    async def slow():
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    start = time.monotonic()
+    with pytest.raises(deadline.DeadlineExceeded) as info:
+        run(deadline.run_with_deadline(slow(), seconds=0.05))
+
+    assert time.monotonic() - start < 1
+    assert cancelled
+    assert not info.value.site_timeout
+
+
+def test_run_with_deadline_keeps_earlier_outer_deadline():
+    async def inner():
+        return deadline.remaining()
+
+    async def outer():
+        return await deadline.run_with_deadline(inner(), seconds=60)
+
+    left = run(deadline.run_with_deadline(outer(), seconds=1))
+
+    assert 0 < left <= 1
+    assert deadline.remaining() is None
+
+
+def test_clamp_raises_after_deadline():
+    token = deadline._deadline.set(time.monotonic() - 0.1)
+    try:
+        with pytest.raises(deadline.DeadlineExceeded):
+            deadline.clamp(5)
+    finally:
+        deadline._deadline.reset(token)
+
+
+def test_async_timeout_clamps_to_remaining_time():
+    timeouts = fetcher.Timeouts(connect=3, read=10)
+
+    async def build():
+        return fetcher._async_timeout(timeouts)
+
+    unbounded, clamped = run(build())
+    assert (unbounded.connect, unbounded.read, clamped) == (3, 10, False)
+
+    bounded, clamped = run(deadline.run_with_deadline(build(), seconds=0.5))
+    assert clamped
+    assert 0 < bounded.read <= 0.5 and 0 < bounded.connect <= 0.5
+
+
+def test_clamped_timeout_becomes_site_timeout():
+    error = fetcher._translate_async_error(httpx.ReadTimeout("read timed out"), clamped=True)
+
+    assert isinstance(error, deadline.DeadlineExceeded)
+    assert error.site_timeout
+
+
+class Calls:
+    """hedged에 넘기는 요청 함수 - 호출 시각을 기록하고 duration초 뒤에 끝납니다."""
+
+    def __init__(self, *durations):
+        self.durations = list(durations)
+        self.started = []
+
+    async def __call__(self):
+        index = len(self.started)
+        self.started.append(time.monotonic())
+        await asyncio.sleep(self.durations[min(index, len(self.durations) - 1)])
+        return index
+
+
+def test_hedge_fires_after_delay_and_faster_copy_wins():
+    calls = Calls(1.0, 0.01)
+
+    start = time.monotonic()
+    result = run(fetcher.hedged(calls, delay=0.05))
+
+    assert result == 1
+    assert len(calls.started) == 2
+    assert calls.started[1] - start >= 0.05
+
+
+def test_no_hedge_when_primary_finishes_within_delay():
+    calls = Calls(0.01)
+
+    assert run(fetcher.hedged(calls, delay=0.1)) == 0
+    assert len(calls.started) == 1
+
+
+def test_no_hedge_when_can_hedge_is_false():
+    calls = Calls(0.1)
+    asked = []
+
+    def can_hedge():
+        asked.append(time.monotonic())
+        return False
+
+    assert run(fetcher.hedged(calls, delay=0.02, can_hedge=can_hedge)) == 0
+    assert len(calls.started) == 1
+    assert len(asked) == 1
+
+
+@pytest.mark.parametrize("delay, budget", [(0, None), (0.5, 0.2)])
+def test_no_hedge_when_disabled_or_deadline_is_sooner(delay, budget):
+    calls = Calls(0.05)
+    coro = fetcher.hedged(calls, delay=delay)
+
+    run(deadline.run_with_deadline(coro, seconds=budget) if budget else coro)
+
+    assert len(calls.started) == 1
+
+
+def make_guard():
+    return politeness.DomainGuard("naver.com")
+
+
+def test_site_timeout_under_deadline_is_breaker_failure():
+    guard = make_guard()
+
+    async def attempt():
+        async with guard.request():
+            raise deadline.DeadlineExceeded("시간 초과", site_timeout=True)
+
+    with pytest.raises(deadline.DeadlineExceeded):
+        run(attempt())
+
+    assert guard.breaker.failures == 1
+
+
+def test_no_time_left_before_sending_is_neutral():
+    guard = make_guard()
+
+    async def attempt():
+        async with guard.request():
+            raise deadline.DeadlineExceeded("시간 없음")
+
+    with pytest.raises(deadline.DeadlineExceeded):
+        run(attempt())
+
+    assert guard.breaker.failures == 0
+
+
+def test_hanging_site_cancelled_at_deadline_opens_breaker():
+    guard = make_guard()
+
+    async def hang():
+        async with guard.request():
+            await asyncio.sleep(10)
+
+    for _ in range(guard.breaker.failure_threshold):
+        with pytest.raises(deadline.DeadlineExceeded):
+            run(deadline.run_with_deadline(hang(), seconds=0.05))
+
+    assert guard.breaker.state == politeness.OPEN
+
+
+def test_outside_cancellation_is_neutral():
+    guard = make_guard()
+
+    async def scenario():
+        async def hang():
+            async with guard.request():
+                await asyncio.sleep(10)
+
+        task = asyncio.ensure_future(deadline.run_with_deadline(hang(), seconds=5))
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    run(scenario())
+
+    assert guard.breaker.failures == 0
+    assert guard.breaker.state == politeness.CLOSED
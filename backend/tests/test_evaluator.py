@@ -0,0 +1,50 @@
+"""evaluator 스트리밍 부분 파싱 테스트"""
+
+import json
+
+import pytest
+
+from evaluator import SCORE_KEYS, PartialEvaluationParser, _diff_partial, normalize_evaluation
+
+EVALUATION = {
+    "evaluation_summary": "요약 \"인용\" \\ 줄바꿈\n이모지 😀 끝",
+    "scores": {"진실성": "8점", "accuracy": 9, "공정성": 12.5, "투명성": 10},
+    "detailed_feedback": "피드백 " * 20 + "\\u1234 😀",
+}
+
+
+def feed_in_chunks(text: str, size: int):
+    parser = PartialEvaluationParser()
+    for i in range(0, len(text), size):
+        yield parser.feed(text[i:i + size])
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_partial_results_are_prefixes_of_final(size, ensure_ascii):
+    text = "```json\n" + json.dumps(EVALUATION, ensure_ascii=ensure_ascii) + "\n```"
+
+    current = {}
+    for current in feed_in_chunks(text, size):
+        for field in ("evaluation_summary", "detailed_feedback"):
+            if field in current:
+                assert EVALUATION[field].startswith(current[field])
+        for key, value in current.get("scores", {}).items():
+            assert EVALUATION["scores"][key] == value
+
+    assert current == EVALUATION
+
+
+@pytest.mark.parametrize("size", [1, 5])
+def test_score_events_match_normalized_result(size):
+    text = json.dumps(EVALUATION, ensure_ascii=False)
+
+    events = []
+    previous = {}
+    for current in feed_in_chunks(text, size):
+        events.extend(data for event, data in _diff_partial(previous, current) if event == "score")
+        previous = current
+
+    expected, _ = normalize_evaluation(EVALUATION)
+    assert events == [{"key": key, "value": value} for key, value in expected["scores"].items()]
+    assert all(event["key"] in SCORE_KEYS for event in events)
@@ -0,0 +1,45 @@
+"""fetcher.ContainerCloseDetector 테스트"""
+
+import pytest
+
+from fetcher import ContainerCloseDetector
+
+ATTR = r'\bclass="article_view"'
+
+
+def feed_in_chunks(html: str, size: int) -> int:
+    """청크 크기 size로 나눠 넣고, 요소가 닫힌 것으로 감지된 시점까지 넣은 글자 수를 반환합니다."""
+    detector = ContainerCloseDetector(ATTR)
+    for i in range(0, len(html), size):
+        if detector.feed(html[i:i + size]):
+            return min(i + size, len(html))
+    return -1
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 16, 4096])
+@pytest.mark.parametrize("inner", [
+    '<script>var html = "</div>";</script>',
+    '<script type="text/javascript">document.write("<div>");</script>',
+    '<style>.a:after { content: "</div>"; }</style>',
+    '<!-- </div> -->',
+    '<!-- <div> -->',
+])
+def test_ignores_tags_in_raw_text_and_comments(inner, size):
+    head = f'<html><body><div class="article_view"><p>첫 문단</p>{inner}<div>둘째 문단</div><p>셋째 문단</p></div>'
+    html = head + '<div class="footer">관련 기사</div></body></html>'
+
+    stopped = feed_in_chunks(html, size)
+
+    assert stopped >= len(head)
+    assert stopped < len(head) + size or stopped == len(head)
+
+
+def test_nested_container_closes_at_matching_tag():
+    html = '<div class="article_view"><div><div>본문</div></div></div><div>뒤</div>'
+    assert feed_in_chunks(html, 4096) == len(html)
+    assert feed_in_chunks(html, 1) == html.index('<div>뒤')
+
+
+def test_unclosed_container_is_not_closed():
+    html = '<div class="article_view"><p>본문</p><script>"</div>"'
+    assert feed_in_chunks(html, 3) == -1
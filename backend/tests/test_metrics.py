@@ -0,0 +1,28 @@
+"""/metrics 도메인 레이블 테스트"""
+
+import asyncio
+import re
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+import fetcher
+import scraper
+from main import app
+
+
+def test_resolve_label_does_not_grow_with_unknown_hosts(monkeypatch):
+    async def fake_head(url, **kwargs):
+        return SimpleNamespace(url="https://n.news.naver.com/mnews/article/001/0014612345")
+
+    monkeypatch.setattr(fetcher, "head_async", fake_head)
+
+    async def resolve_all():
+        for url in ("https://short-a.example/abc", "https://short-b.example/xyz"):
+            await scraper.resolve_url_async(url)
+
+    asyncio.run(resolve_all())
+
+    body = TestClient(app).get("/metrics").text
+    domains = set(re.findall(r'scrape_stage_seconds_count\{stage="resolve",domain="([^"]*)"\}', body))
+    assert domains == {"other"}
@@ -0,0 +1,47 @@
+"""parsers 부분 파싱과 metadata 추출 테스트"""
+
+import json
+
+import pytest
+
+from metadata import extract_metadata
+from parsers import parse_html
+from site_profiles import SITE_PROFILES
+
+PROFILE = SITE_PROFILES["chosun.com"]
+
+JSON_LD = json.dumps({
+    "@context": "https://schema.org",
+    "@type": "NewsArticle",
+    "headline": "본문에 있는 JSON-LD 제목",
+    "author": [{"@type": "Person", "name": "홍길동"}],
+    "datePublished": "2025-11-14T00:30:00Z",
+}, ensure_ascii=False)
+
+HTML = f"""<html><head><title>페이지 제목 | 조선일보</title></head>
+<body>
+<nav><a href="/">홈</a></nav>
+<div class="wrapper"><script type="application/ld+json">{JSON_LD}</script></div>
+<section class="article-body"><p>본문 문단입니다.</p></section>
+<script>var tracking = 1;</script>
+</body></html>"""
+
+
+@pytest.mark.parametrize("backend", ["html.parser", "lxml", "selectolax"])
+def test_targeted_parse_keeps_body_json_ld(backend):
+    soup = parse_html(HTML, backend, targets=PROFILE.targets)
+
+    meta = extract_metadata(soup)
+
+    assert meta.title == "본문에 있는 JSON-LD 제목"
+    assert meta.author == "홍길동"
+    assert meta.published_at == "2025-11-14 09:30"
+
+
+@pytest.mark.parametrize("backend", ["html.parser", "lxml"])
+def test_targeted_parse_still_drops_other_body_elements(backend):
+    soup = parse_html(HTML, backend, targets=PROFILE.targets)
+
+    assert soup.find("nav") is None
+    assert "tracking" not in str(soup)
+    assert len(soup.select('script[type="application/ld+json"]')) == 1
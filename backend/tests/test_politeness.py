@@ -0,0 +1,162 @@
+"""politeness 언론사별 요청 제한 테스트"""
+
+import asyncio
+
+import pytest
+import requests
+
+import politeness
+
+
+@pytest.fixture(autouse=True)
+def clean_guards(monkeypatch):
+    monkeypatch.setattr(politeness, "_guards", {})
+
+
+def test_unknown_hosts_share_one_guard():
+    shared = politeness.guard_for("short-a.example")
+
+    assert politeness.guard_for("short-b.example") is shared
+    assert shared.domain == politeness.OTHER
+    assert politeness.guard_for("naver.com").domain == "naver.com"
+    assert politeness.guard_for("naver.me").domain == "naver.me"
+    assert sorted(politeness.stats()) == ["naver.com", "naver.me", politeness.OTHER]
+
+
+def test_reset_does_not_create_guard():
+    assert politeness.reset("never-requested.example") is None
+    assert politeness.stats() == {}
+
+
+class FakeClock:
+    """politeness 모듈의 time.monotonic 대역"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(politeness, "time", clock)
+    return clock
+
+
+def test_token_bucket_spends_burst_then_waits_and_refills(clock):
+    bucket = politeness.TokenBucket(rate=2, burst=3)
+
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    clock.advance(10)
+    assert bucket.tokens == 3
+
+
+def test_breaker_opens_after_threshold_and_success_resets_count(clock):
+    breaker = politeness.CircuitBreaker(failure_threshold=3, reset_timeout=30)
+
+    breaker.record_failure("timeout")
+    breaker.record_failure("timeout")
+    breaker.record_success()
+    breaker.record_failure("timeout")
+    breaker.record_failure("timeout")
+    assert breaker.state == politeness.CLOSED and breaker.allow()
+
+    breaker.record_failure("timeout")
+    assert breaker.state == politeness.OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after() == 30
+
+
+def test_half_open_allows_one_probe(clock):
+    breaker = politeness.CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure("timeout")
+
+    clock.advance(30)
+    assert breaker.allow()
+    assert breaker.state == politeness.HALF_OPEN
+    assert not breaker.allow()
+
+    # 시험 요청 실패 - 다시 열림
+    breaker.record_failure("timeout")
+    assert breaker.state == politeness.OPEN and not breaker.allow()
+
+    # 다음 시험 요청 성공 - 닫힘
+    clock.advance(30)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == politeness.CLOSED and breaker.allow() and breaker.allow()
+
+
+def test_cancelled_probe_frees_the_probe_slot(clock):
+    breaker = politeness.CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure("timeout")
+    clock.advance(30)
+
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+
+def fail_with(guard, error):
+    async def attempt():
+        async with guard.request():
+            raise error
+
+    with pytest.raises(type(error)):
+        asyncio.run(attempt())
+
+
+def http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(response=response)
+
+
+def test_open_circuit_rejects_with_retry_after(clock, monkeypatch):
+    monkeypatch.setattr(politeness, "CIRCUIT_FAILURE_THRESHOLD", 2)
+    monkeypatch.setattr(politeness, "CIRCUIT_RESET_TIMEOUT", 30)
+    guard = politeness.DomainGuard("naver.com")
+    fail_with(guard, requests.ConnectionError("refused"))
+    fail_with(guard, http_error(503))
+    clock.advance(12)
+
+    with pytest.raises(politeness.DomainUnavailableError) as info:
+        fail_with(guard, requests.ConnectionError("not sent"))
+
+    assert info.value.domain == "naver.com"
+    assert info.value.retry_after == pytest.approx(18)
+    assert "18초 후 재시도" in str(info.value)
+    assert guard.rejected == 1
+
+
+@pytest.mark.parametrize("status_code", [400, 403, 404, 410])
+def test_http_4xx_counts_as_success(clock, status_code):
+    guard = politeness.DomainGuard("naver.com")
+    fail_with(guard, requests.ConnectionError("refused"))
+
+    fail_with(guard, http_error(status_code))
+
+    assert guard.breaker.failures == 0
+    assert guard.breaker.state == politeness.CLOSED
+
+
+def test_rate_limit_wait_over_max_is_rejected(clock, monkeypatch):
+    monkeypatch.setattr(politeness, "RATE_BURST", 1)
+    monkeypatch.setattr(politeness, "RATE_MAX_WAIT", 0.5)
+    guard = politeness.DomainGuard("naver.com")
+    guard.bucket.rate = 1
+    guard.bucket.reserve()
+
+    with pytest.raises(politeness.DomainUnavailableError) as info:
+        fail_with(guard, requests.ConnectionError("not sent"))
+
+    assert info.value.retry_after == pytest.approx(1)
+    assert guard.bucket.tokens == 0
@@ -0,0 +1,99 @@
+"""router 호스트명 라우팅과 기사 URL 정규화 테스트"""
+
+import pytest
+
+from router import SiteRouter, hostname
+from site_profiles import SITE_PROFILES
+
+router = SiteRouter(SITE_PROFILES.values())
+
+
+@pytest.mark.parametrize("host, expected", [
+    ("chosun.com", "chosun.com"),
+    ("www.chosun.com", "chosun.com"),
+    ("news.chosun.com", "chosun.com"),
+    ("n.news.naver.com", "naver.com"),
+    ("m.news.naver.com", "naver.com"),
+    ("v.daum.net", "daum.net"),
+    # 접미사가 같아도 레이블 경계가 다른 호스트
+    ("evilchosun.com", None),
+    ("chosun.com.evil.example", None),
+    ("notnaver.com", None),
+    ("naver.com.example", None),
+    ("com", None),
+    ("", None),
+])
+def test_route_host_matches_whole_labels_only(host, expected):
+    profile = router.route_host(host)
+    assert (profile.domain if profile else None) == expected
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.chosun.com/politics/2025/01/02/ABC123/", "chosun.com"),
+    ("https://WWW.Chosun.COM.:443/politics/2025/01/02/ABC123/", "chosun.com"),
+    ("https://user@news.naver.com/main/read.naver?oid=001&aid=1", "naver.com"),
+    # 쿼리나 경로에 들어 있는 도메인 문자열은 무시
+    ("https://example.com/?ref=naver.com", None),
+    ("https://example.com/n.news.naver.com/mnews/article/001/0014612345", None),
+    ("https://evilchosun.com/politics/2025/01/02/ABC123/", None),
+    ("not a url", None),
+])
+def test_route_uses_hostname_only(url, expected):
+    profile = router.route(url)
+    assert (profile.domain if profile else None) == expected
+
+
+def test_hostname_normalizes_case_port_and_trailing_dot():
+    assert hostname("https://User:pw@N.News.Naver.Com.:8443/x") == "n.news.naver.com"
+    assert hostname("http://[::1") == ""
+
+
+NAVER = "https://n.news.naver.com/mnews/article/001/0014612345"
+DAUM = "https://v.daum.net/v/20251114103000123"
+YNA = "https://www.yna.co.kr/view/AKR20251114000100001"
+CHOSUN = "https://www.chosun.com/politics/assembly/2025/11/14/ABCDEF123/"
+JOONGANG = "https://www.joongang.co.kr/article/25123456"
+HANI = "https://www.hani.co.kr/arti/politics/assembly/1167890.html"
+HANKYUNG = "https://www.hankyung.com/article/2025111412345"
+
+
+@pytest.mark.parametrize("url, canonical", [
+    (NAVER, NAVER),
+    ("https://m.news.naver.com/article/001/0014612345", NAVER),
+    ("https://n.news.naver.com/mnews/amp/article/001/0014612345", NAVER),
+    ("https://n.news.naver.com/article/print/001/0014612345", NAVER),
+    ("https://news.naver.com/main/read.naver?oid=001&aid=0014612345", NAVER),
+    ("https://m.news.naver.com/read.nhn?mode=LSD&oid=001&aid=0014612345&sid1=100", NAVER),
+    ("http://n.news.naver.com/mnews/article/001/0014612345/#comment", NAVER),
+    (DAUM, DAUM),
+    ("https://m.v.daum.net/v/20251114103000123", DAUM),
+    ("https://m.media.daum.net/v/20251114103000123", DAUM),
+    ("https://m.yna.co.kr/amp/view/AKR20251114000100001", YNA),
+    ("https://m.chosun.com/politics/assembly/2025/11/14/ABCDEF123/", CHOSUN),
+    ("https://mnews.joongang.co.kr/amparticle/25123456", JOONGANG),
+    ("https://m.hani.co.kr/amp/arti/politics/assembly/1167890.html", HANI),
+    ("https://mobile.hankyung.com/article/2025111412345", HANKYUNG),
+])
+def test_variants_canonicalize_to_same_url(url, canonical):
+    routed = router.canonicalize(url)
+    assert routed is not None
+    assert routed.canonical_url == canonical
+
+
+@pytest.mark.parametrize("url", [
+    # 지원 언론사의 기사가 아닌 페이지
+    "https://www.naver.com/",
+    "https://news.naver.com/section/100",
+    "https://news.naver.com/main/read.naver?oid=001",
+    "https://news.naver.com/main/read.naver?oid=001&aid=1%27%3B",
+    "https://v.daum.net/",
+    "https://www.chosun.com/politics/",
+    "https://www.hani.co.kr/arti/politics",
+    # 지원하지 않는 호스트와 URL 형식
+    "https://example.com/?ref=n.news.naver.com/mnews/article/001/0014612345",
+    "https://evilchosun.com/politics/assembly/2025/11/14/ABCDEF123/",
+    "ftp://n.news.naver.com/mnews/article/001/0014612345",
+    "https://naver.me/abcdef",
+])
+def test_non_article_urls_are_not_canonicalized(url):
+    assert router.canonicalize(url) is None
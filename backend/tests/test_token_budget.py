@@ -0,0 +1,108 @@
+"""token_budget 긴 기사 trim/chunk와 입력 계획 테스트"""
+
+import asyncio
+
+import pytest
+
+import token_budget
+from token_budget import TRIM_MARKER, _Counter, chunk_body, plan_input, split_segments, trim_body
+
+count = _Counter(1.0)
+
+LEAD = "정부가 오늘 새 예산안을 발표했다."
+PARAGRAPHS = [LEAD + " 이번 예산안은 지난해보다 5% 늘었다."] + [
+    f"{i}번째 문단입니다. 관계자는 \"세부 내용은 추후 공개한다\"고 말했다. 야당은 반발했다."
+    for i in range(1, 40)
+] + ["결론적으로 국회 심사가 관건이다."]
+BODY = "\n\n".join(PARAGRAPHS)
+
+
+def normalize(text):
+    return " ".join(text.split())
+
+
+def test_split_segments_round_trips():
+    assert "".join(split_segments(BODY)) == BODY
+
+
+def test_body_under_budget_is_unchanged():
+    assert trim_body(BODY, count(BODY), count) == BODY
+    assert chunk_body(BODY, count(BODY), 4, count) == [BODY]
+
+
+@pytest.mark.parametrize("budget", [60, 200, 700])
+def test_trim_keeps_lead_and_cuts_at_segment_boundary(budget):
+    trimmed = trim_body(BODY, budget, count)
+
+    assert count(trimmed) <= budget
+    assert trimmed.startswith(LEAD)
+    head, tail = trimmed.split(TRIM_MARKER)
+    segments = split_segments(BODY)
+    heads = {"".join(segments[:i]).rstrip() for i in range(1, len(segments) + 1)}
+    tails = {"".join(segments[i:]).lstrip() for i in range(len(segments) + 1)}
+    assert head in heads
+    assert tail in tails
+    if budget >= 200:
+        assert tail.endswith(PARAGRAPHS[-1])
+
+
+@pytest.mark.parametrize("budget, max_chunks", [(150, 20), (400, 4), (400, 2)])
+def test_chunks_fit_budget(budget, max_chunks):
+    chunks = chunk_body(BODY, budget, max_chunks, count)
+
+    assert 1 < len(chunks) <= max_chunks
+    assert all(count(chunk) <= budget for chunk in chunks)
+    assert chunks[0].startswith(LEAD)
+    if count(BODY) <= budget * max_chunks:
+        assert normalize(" ".join(chunks)) == normalize(BODY)
+
+
+def test_oversized_segment_is_split_within_budget():
+    body = "가" * 500
+    chunks = chunk_body(body, 120, 10, count)
+
+    assert "".join(chunks) == body
+    assert all(count(chunk) <= 120 for chunk in chunks)
+
+
+class NoAPIClient:
+    """토큰 계산 API를 호출하면 실패하는 클라이언트 대역"""
+
+    @property
+    def messages(self):
+        raise AssertionError("토큰 계산 API를 호출했습니다")
+
+
+@pytest.mark.parametrize("counting, client", [("estimate", NoAPIClient()), ("api", None)])
+def test_plan_input_makes_no_api_call_without_counting_client(monkeypatch, counting, client):
+    monkeypatch.setattr(token_budget, "EVALUATION_TOKEN_COUNTING", counting)
+    monkeypatch.setattr(token_budget, "EVALUATION_MAX_ARTICLE_TOKENS", 500)
+
+    plan = asyncio.run(plan_input(client, "model", BODY, "제목", "trim"))
+
+    assert plan.mode == "trim"
+    assert plan.counted_by == "estimate"
+    assert count(plan.parts[0]) <= 500
+
+
+def test_plan_report(monkeypatch):
+    monkeypatch.setattr(token_budget, "EVALUATION_MAX_ARTICLE_TOKENS", 500)
+
+    full = asyncio.run(plan_input(None, "model", "짧은 본문", "제목"))
+    chunked = asyncio.run(plan_input(None, "model", BODY, "제목", "chunk"))
+
+    assert full.report() == {
+        "mode": "full",
+        "estimated_tokens": count("짧은 본문") + count("제목"),
+        "budget": 500,
+        "counted_by": "estimate",
+        "parts": 1,
+        "original_chars": len("짧은 본문"),
+        "evaluated_chars": len("짧은 본문"),
+    }
+    report = chunked.report()
+    assert report["mode"] == "chunk"
+    assert report["parts"] == len(chunked.parts) > 1
+    assert report["estimated_tokens"] == count(BODY) + count("제목")
+    assert report["original_chars"] == len(BODY)
+    assert report["evaluated_chars"] == sum(len(part) for part in chunked.parts)
@@ -0,0 +1,326 @@
+"""
+평가 입력 토큰 예산 모듈
+
+기사 본문 길이에는 상한이 없으므로, 아주 긴 기사는 프롬프트가 커져 평가가 느리고
+비용이 크며 실패하기도 합니다. 평가 전에 기사(제목+본문)의 토큰 수를 추정하고,
+예산(EVALUATION_MAX_ARTICLE_TOKENS)을 넘으면 다음 방식으로 줄입니다.
+
+- trim: 앞부분(리드와 핵심 내용)과 끝부분(결론)을 남기고 중간을 생략합니다.
+- chunk: 문단/문장 경계에서 예산 이하의 부분으로 나눠 동시에 평가한 뒤 합칩니다.
+  부분 수는 EVALUATION_MAX_CHUNKS로 제한되며, 그보다 길면 먼저 trim합니다.
+
+어느 방식이든 한 번의 Claude 호출에 들어가는 기사 토큰 수가 예산 이하이므로
+평가 지연 시간의 상한을 예측할 수 있습니다. 적용한 내용은 InputPlan.report()로 보고합니다.
+
+토큰 수는 문자 종류별 보수적 추정치(한글 1자 ≈ 1토큰, 영문 4자 ≈ 1토큰)를 사용합니다.
+EVALUATION_TOKEN_COUNTING=api이면 예산에 가까운 기사만 Anthropic 토큰 계산 API로 한 번 세어
+추정치를 보정합니다.
+
+환경 변수:
+- EVALUATION_MAX_ARTICLE_TOKENS: 평가 한 번에 넣을 기사 최대 토큰 수 (기본값 6000)
+- EVALUATION_LONG_ARTICLE_MODE: 예산을 넘는 기사 처리 방식 (trim / chunk, 기본값 trim)
+- EVALUATION_MAX_CHUNKS: chunk 방식의 최대 부분 수 (기본값 4)
+- EVALUATION_TOKEN_COUNTING: 토큰 수 계산 방식 (estimate / api, 기본값 estimate)
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+import logging
+import math
+import os
+import re
+
+import anthropic
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# 상수
+LONG_ARTICLE_MODES = ("trim", "chunk")
+TOKEN_COUNTING_MODES = ("estimate", "api")
+
+EVALUATION_MAX_ARTICLE_TOKENS = int(os.getenv("EVALUATION_MAX_ARTICLE_TOKENS", "6000"))
+EVALUATION_LONG_ARTICLE_MODE = os.getenv("EVALUATION_LONG_ARTICLE_MODE", "trim")
+EVALUATION_MAX_CHUNKS = int(os.getenv("EVALUATION_MAX_CHUNKS", "4"))
+EVALUATION_TOKEN_COUNTING = os.getenv("EVALUATION_TOKEN_COUNTING", "estimate")
+
+if EVALUATION_LONG_ARTICLE_MODE not in LONG_ARTICLE_MODES:
+    raise ValueError(f"EVALUATION_LONG_ARTICLE_MODE는 {LONG_ARTICLE_MODES} 중 하나여야 합니다")
+if EVALUATION_TOKEN_COUNTING not in TOKEN_COUNTING_MODES:
+    raise ValueError(f"EVALUATION_TOKEN_COUNTING은 {TOKEN_COUNTING_MODES} 중 하나여야 합니다")
+
+# trim 방식에서 앞부분에 배정하는 예산 비율 (나머지는 끝부분)
+TRIM_HEAD_RATIO = 0.8
+TRIM_MARKER = "\n\n(…중략…)\n\n"
+
+# API로 토큰 수를 세는 기준 - 추정치가 예산의 이 비율을 넘는 기사만 셉니다.
+API_COUNT_THRESHOLD = 0.5
+
+# 문단(줄바꿈) 또는 문장 끝(마침표 등 + 공백) 경계 - 경계 문자열을 보존하기 위해 캡처
+_SEGMENT_BOUNDARY = re.compile(r'(\s*\n\s*|(?<=[.!?。…"”’)])\s+)')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수를 보수적으로 추정합니다.
+
+    한글과 기타 비ASCII 문자는 1자당 1토큰, ASCII 문자는 4자당 1토큰으로 계산합니다.
+
+    Args:
+        text: 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return math.ceil((len(text) - ascii_chars) + ascii_chars / 4)
+
+
+def split_segments(text: str) -> List[str]:
+    """
+    텍스트를 문단/문장 경계에서 자릅니다. (조각을 이어 붙이면 원문과 같음)
+
+    Args:
+        text: 텍스트
+
+    Returns:
+        경계 뒤 공백을 포함한 조각 목록
+    """
+    parts = _SEGMENT_BOUNDARY.split(text)
+    return [
+        parts[i] + (parts[i + 1] if i + 1 < len(parts) else "")
+        for i in range(0, len(parts), 2)
+        if parts[i] or (i + 1 < len(parts) and parts[i + 1])
+    ]
+
+
+@dataclass
+class InputPlan:
+    """
+    평가 입력 계획
+
+    Attributes:
+        mode: 적용한 방식 (full: 그대로, trim: 중간 생략, chunk: 부분 평가 후 합침)
+        parts: 평가할 본문 목록 (full/trim은 1개)
+        estimated_tokens: 원문(제목+본문) 토큰 수
+        budget: 평가 한 번의 기사 토큰 예산
+        counted_by: 토큰 수 계산 방식 (estimate 또는 api)
+        original_chars: 원문 본문 글자 수
+    """
+    mode: str
+    parts: List[str]
+    estimated_tokens: int
+    budget: int
+    counted_by: str
+    original_chars: int
+
+    def report(self) -> Dict[str, Any]:
+        """응답에 포함할 입력 처리 보고서를 반환합니다."""
+        return {
+            "mode": self.mode,
+            "estimated_tokens": self.estimated_tokens,
+            "budget": self.budget,
+            "counted_by": self.counted_by,
+            "parts": len(self.parts),
+            "original_chars": self.original_chars,
+            "evaluated_chars": sum(len(part) for part in self.parts),
+        }
+
+
+class _Counter:
+    """보정 비율을 적용한 토큰 수 계산기"""
+
+    def __init__(self, scale: float):
+        self.scale = scale
+
+    def __call__(self, text: str) -> int:
+        return math.ceil(estimate_tokens(text) * self.scale)
+
+
+def _fit_segments(segments: List[str], budget: int, count: _Counter) -> List[str]:
+    """예산보다 큰 조각을 글자 단위로 더 잘라 모든 조각이 예산 이하가 되게 합니다."""
+    fitted: List[str] = []
+    for segment in segments:
+        tokens = count(segment)
+        if tokens <= budget:
+            fitted.append(segment)
+            continue
+        size = max(1, len(segment) * budget // tokens)
+        fitted.extend(segment[i:i + size] for i in range(0, len(segment), size))
+    return fitted
+
+
+def trim_body(body: str, budget: int, count: _Counter) -> str:
+    """
+    본문의 앞부분과 끝부분만 남겨 예산 이하로 줄입니다.
+
+    Args:
+        body: 본문
+        budget: 토큰 예산
+        count: 토큰 수 계산기
+
+    Returns:
+        중간을 TRIM_MARKER로 생략한 본문 (예산 이하이면 그대로)
+    """
+    if count(body) <= budget:
+        return body
+    available = budget - count(TRIM_MARKER)
+    segments = _fit_segments(split_segments(body), available, count)
+    head_budget = int(available * TRIM_HEAD_RATIO)
+
+    head: List[str] = []
+    used = 0
+    for segment in segments:
+        tokens = count(segment)
+        if used + tokens > head_budget:
+            break
+        head.append(segment)
+        used += tokens
+
+    tail: List[str] = []
+    for segment in reversed(segments[len(head):]):
+        tokens = count(segment)
+        if used + tokens > available:
+            break
+        tail.append(segment)
+        used += tokens
+
+    return "".join(head).rstrip() + TRIM_MARKER + "".join(reversed(tail)).lstrip()
+
+
+def _pack_chunks(body: str, budget: int, count: _Counter) -> List[str]:
+    """문단/문장 조각을 순서대로 예산 이하의 부분에 채웁니다."""
+    chunks: List[str] = []
+    current: List[str] = []
+    used = 0
+    for segment in _fit_segments(split_segments(body), budget, count):
+        tokens = count(segment)
+        if current and used + tokens > budget:
+            chunks.append("".join(current).strip())
+            current, used = [], 0
+        current.append(segment)
+        used += tokens
+    if current:
+        chunks.append("".join(current).strip())
+    return chunks
+
+
+def chunk_body(body: str, budget: int, max_chunks: int, count: _Counter) -> List[str]:
+    """
+    본문을 예산 이하의 부분으로 나눕니다.
+
+    Args:
+        body: 본문
+        budget: 부분당 토큰 예산
+        max_chunks: 최대 부분 수 (넘으면 먼저 budget * max_chunks로 trim)
+        count: 토큰 수 계산기
+
+    Returns:
+        부분 목록 (예산 이하이면 본문 하나)
+    """
+    if count(body) <= budget:
+        return [body]
+
+    total = budget * max_chunks
+    while True:
+        chunks = _pack_chunks(trim_body(body, total, count), budget, count)
+        if len(chunks) <= max_chunks or total <= 1:
+            return chunks
+        # 경계에서 나누면 부분마다 남는 예산이 생겨 부분 수가 넘칠 수 있으므로 더 줄여서 다시 나눔
+        total = max(1, total - max(1, budget // 4))
+
+
+def resolve_mode(mode: Optional[str] = None) -> str:
+    """
+    긴 기사 처리 방식을 확인합니다.
+
+    Args:
+        mode: 요청한 처리 방식 (None이면 EVALUATION_LONG_ARTICLE_MODE)
+
+    Returns:
+        처리 방식 (trim 또는 chunk)
+
+    Raises:
+        ValueError: 지원하지 않는 처리 방식인 경우
+    """
+    mode = mode or EVALUATION_LONG_ARTICLE_MODE
+    if mode not in LONG_ARTICLE_MODES:
+        raise ValueError(f"지원하지 않는 긴 기사 처리 방식입니다: {mode}")
+    return mode
+
+
+def is_over_budget(article_body: str, article_title: Optional[str] = None) -> bool:
+    """추정 토큰 수가 예산을 넘는지 확인합니다. (API 호출 없음)"""
+    return estimate_tokens(article_body) + estimate_tokens(article_title or "") > EVALUATION_MAX_ARTICLE_TOKENS
+
+
+async def count_tokens(client: anthropic.AsyncAnthropic, model: str, text: str) -> Optional[int]:
+    """
+    Anthropic 토큰 계산 API로 텍스트의 토큰 수를 셉니다.
+
+    Returns:
+        토큰 수 (API 오류 시 None)
+    """
+    try:
+        with metrics.LLM_REQUEST_SECONDS.time(call="count_tokens"):
+            result = await client.messages.count_tokens(
+                model=model,
+                messages=[{"role": "user", "content": text}]
+            )
+    except anthropic.APIError as e:
+        logger.warning(f"토큰 수 계산 실패, 추정치 사용: {str(e)}")
+        return None
+    return result.input_tokens
+
+
+async def plan_input(
+    client: Optional[anthropic.AsyncAnthropic],
+    model: str,
+    article_body: str,
+    article_title: Optional[str] = None,
+    mode: Optional[str] = None
+) -> InputPlan:
+    """
+    기사 토큰 수를 계산하고 예산에 맞는 평가 입력 계획을 세웁니다.
+
+    Args:
+        client: Anthropic 클라이언트 (EVALUATION_TOKEN_COUNTING=api일 때 사용, None이면 항상 추정치 사용)
+        model: 토큰 수를 셀 모델
+        article_body: 기사 본문
+        article_title: 기사 제목 (선택사항)
+        mode: 예산을 넘을 때의 처리 방식 (None이면 EVALUATION_LONG_ARTICLE_MODE)
+
+    Returns:
+        InputPlan 객체
+
+    Raises:
+        ValueError: 지원하지 않는 처리 방식인 경우
+    """
+    mode = resolve_mode(mode)
+    budget = EVALUATION_MAX_ARTICLE_TOKENS
+    text = f"{article_title or ''}\n{article_body}"
+    estimated = estimate_tokens(article_body) + estimate_tokens(article_title or "")
+    counted_by = "estimate"
+    count = _Counter(1.0)
+
+    if client is not None and EVALUATION_TOKEN_COUNTING == "api" and estimated > budget * API_COUNT_THRESHOLD:
+        counted = await count_tokens(client, model, text)
+        if counted:
+            count = _Counter(counted / estimated)
+            estimated = counted
+            counted_by = "api"
+
+    if estimated <= budget:
+        return InputPlan("full", [article_body], estimated, budget, counted_by, len(article_body))
+
+    body_budget = max(1, budget - count(article_title or ""))
+    if mode == "chunk":
+        parts = chunk_body(article_body, body_budget, EVALUATION_MAX_CHUNKS, count)
+    else:
+        parts = [trim_body(article_body, body_budget, count)]
+    plan = InputPlan(mode, parts, estimated, budget, counted_by, len(article_body))
+    logger.info(f"긴 기사 입력 조정: {plan.report()}")
+    return plan
@@ -5,6 +5,7 @@ import ArticleForm from '@/components/ArticleForm'
 import ArticleResult from '@/components/ArticleResult'
 import LoadingSpinner from '@/components/LoadingSpinner'
 import EvaluationResult from '@/components/EvaluationResult'
+import { readSSE } from '@/lib/sse'
 
 export interface Article {
   title: string
@@ -21,6 +22,17 @@ export interface Evaluation {
     [key: string]: number
   }
   detailed_feedback?: string
+  input_budget?: InputBudget
+}
+
+export interface InputBudget {
+  mode: 'full' | 'trim' | 'chunk'
+  estimated_tokens: number
+  budget: number
+  counted_by: string
+  parts: number
+  original_chars: number
+  evaluated_chars: number
 }
 
 export default function Home() {
@@ -39,8 +51,9 @@ export default function Home() {
     try {
       const apiUrl = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000'
 
-      // Step 1: 스크래핑
-      const scrapeResponse = await fetch(`${apiUrl}/scrape`, {
+      // 서버에서 스크래핑과 평가를 한 번에 수행 (기사 본문을 다시 올려보내지 않음)
+      // 기사가 첫 이벤트로 먼저 오고, 생성되는 요약, 점수, 피드백이 SSE로 이어서 도착
+      const analyzeResponse = await fetch(`${apiUrl}/analyze/stream`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -48,36 +61,48 @@ export default function Home() {
         body: JSON.stringify({ url }),
       })
 
-      if (!scrapeResponse.ok) {
-        const errorData = await scrapeResponse.json()
+      if (!analyzeResponse.ok) {
+        // 스크래핑 실패 (평가 실패는 article 이후 error 이벤트로 전달)
+        const errorData = await analyzeResponse.json()
         throw new Error(errorData.detail?.error || '스크래핑에 실패했습니다')
       }
 
-      const articleData: Article = await scrapeResponse.json()
-      setArticle(articleData)
-      setLoading(false)
-
-      // Step 2: 평가 (스크래핑 성공 후 자동 호출)
-      setEvaluating(true)
-
-      const evaluateResponse = await fetch(`${apiUrl}/evaluate`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          article_body: articleData.body,
-          article_title: articleData.title,
-        }),
-      })
+      let partial: Evaluation = { evaluation_summary: '', scores: {} }
+      let completed = false
+      for await (const { event, data } of readSSE(analyzeResponse)) {
+        const payload = JSON.parse(data)
+        if (event === 'article') {
+          // Step 1 완료: 스크래핑 결과를 먼저 표시하고 평가 진행 표시
+          setArticle(payload)
+          setLoading(false)
+          setEvaluating(true)
+          continue
+        }
+        if (event === 'budget') {
+          // 긴 기사를 줄이거나 나눠 평가하는 경우 (평가의 첫 이벤트)
+          partial = { ...partial, input_budget: payload }
+        } else if (event === 'summary') {
+          partial = { ...partial, evaluation_summary: partial.evaluation_summary + payload.delta }
+        } else if (event === 'score') {
+          partial = { ...partial, scores: { ...partial.scores, [payload.key]: payload.value } }
+        } else if (event === 'feedback') {
+          partial = { ...partial, detailed_feedback: (partial.detailed_feedback || '') + payload.delta }
+        } else if (event === 'result') {
+          partial = payload
+          completed = true
+        } else if (event === 'error') {
+          console.error('평가 실패:', payload)
+          // 평가 실패해도 스크래핑 결과는 유지 (생성 중이던 평가는 제거)
+          setEvaluation(null)
+          return
+        }
+        setEvaluation(partial)
+      }
 
-      if (!evaluateResponse.ok) {
-        const errorData = await evaluateResponse.json()
-        console.error('평가 실패:', errorData)
-        // 평가 실패해도 스크래핑 결과는 유지
-      } else {
-        const evaluationData: Evaluation = await evaluateResponse.json()
-        setEvaluation(evaluationData)
+      if (!completed) {
+        // 최종 결과 없이 연결이 끊긴 경우
+        console.error('평가 실패: 평가 응답이 중간에 끊겼습니다')
+        setEvaluation(null)
       }
     } catch (err) {
       setError(err instanceof Error ? err.message : '알 수 없는 오류가 발생했습니다')
@@ -174,8 +199,8 @@ export default function Home() {
           </div>
         )}
 
-        {/* Loading Spinner - Evaluating */}
-        {evaluating && !loading && (
+        {/* Loading Spinner - Evaluating (첫 평가 내용이 도착하기 전까지) */}
+        {evaluating && !loading && !evaluation && (
           <div className="mt-8 flex flex-col items-center justify-center py-12">
             <div className="relative">
               <div className="w-16 h-16 border-4 border-purple-200 dark:border-purple-800 rounded-full animate-pulse"></div>
@@ -194,7 +219,7 @@ export default function Home() {
         {article && !loading && <ArticleResult article={article} />}
 
         {/* Evaluation Result */}
-        {evaluation && !evaluating && <EvaluationResult evaluation={evaluation} />}
+        {evaluation && <EvaluationResult evaluation={evaluation} streaming={evaluating} />}
       </div>
     </main>
   )
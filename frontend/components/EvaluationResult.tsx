@@ -1,3 +1,5 @@
+import type { InputBudget } from '@/app/page'
+
 interface EvaluationResultProps {
   evaluation: {
     evaluation_summary: string
@@ -5,10 +7,13 @@ interface EvaluationResultProps {
       [key: string]: number
     }
     detailed_feedback?: string
+    input_budget?: InputBudget
   }
+  // true이면 평가가 생성 중 (아직 도착하지 않은 점수는 자리 표시)
+  streaming?: boolean
 }
 
-export default function EvaluationResult({ evaluation }: EvaluationResultProps) {
+export default function EvaluationResult({ evaluation, streaming = false }: EvaluationResultProps) {
   // 8차원 평가 기준 (순서 고정)
   const dimensions = [
     { key: '진실성', label: '진실성 (Truth)', color: 'bg-blue-500' },
@@ -21,12 +26,20 @@ export default function EvaluationResult({ evaluation }: EvaluationResultProps)
     { key: '독립성', label: '독립성 (Independence)', color: 'bg-teal-500' },
   ]
 
-  // 평균 점수 계산
+  // 평균 점수 계산 (생성 중에는 지금까지 도착한 점수 기준)
   const scores = Object.values(evaluation.scores)
   const averageScore = scores.length > 0
     ? (scores.reduce((a, b) => a + b, 0) / scores.length).toFixed(1)
     : '0'
 
+  // 긴 기사 입력 조정 안내 (trim: 중간 생략, chunk: 나눠 평가 후 합침)
+  const budget = evaluation.input_budget
+  const budgetNote = budget && budget.mode !== 'full'
+    ? budget.mode === 'trim'
+      ? `기사가 길어 본문 ${budget.original_chars.toLocaleString()}자 중 앞부분과 끝부분 ${budget.evaluated_chars.toLocaleString()}자만 평가했습니다`
+      : `기사가 길어 본문을 ${budget.parts}개 부분으로 나눠 평가한 뒤 합쳤습니다`
+    : null
+
   return (
     <div className="mt-8 max-w-6xl mx-auto">
       <div className="bg-white dark:bg-slate-800 rounded-xl shadow-lg overflow-hidden">
@@ -37,11 +50,22 @@ export default function EvaluationResult({ evaluation }: EvaluationResultProps)
           </h2>
           <p className="text-indigo-100">
             저널리즘 윤리 기준 8차원 분석
+            {streaming && (
+              <span className="ml-2 inline-flex items-center gap-1 text-sm animate-pulse">
+                · 평가 생성 중...
+              </span>
+            )}
           </p>
         </div>
 
         {/* Content */}
         <div className="p-8 space-y-8">
+          {budgetNote && (
+            <p className="text-sm text-amber-800 dark:text-amber-200 bg-amber-50 dark:bg-amber-900/20 border border-amber-200 dark:border-amber-800 rounded-lg px-4 py-3">
+              {budgetNote}
+            </p>
+          )}
+
           {/* Average Score */}
           <div className="text-center pb-6 border-b border-gray-200 dark:border-gray-700">
             <div className="inline-flex items-baseline gap-2">
@@ -52,6 +76,7 @@ export default function EvaluationResult({ evaluation }: EvaluationResultProps)
             </div>
             <p className="mt-2 text-sm text-gray-600 dark:text-gray-400">
               종합 평균 점수
+              {streaming && ` (${scores.length}/${dimensions.length}개 차원)`}
             </p>
           </div>
 
@@ -62,6 +87,9 @@ export default function EvaluationResult({ evaluation }: EvaluationResultProps)
             </h3>
             <p className="text-gray-700 dark:text-gray-300 leading-relaxed bg-gray-50 dark:bg-slate-700/50 p-4 rounded-lg">
               {evaluation.evaluation_summary}
+              {streaming && !evaluation.evaluation_summary && (
+                <span className="text-gray-400 dark:text-gray-500">요약을 작성하고 있습니다...</span>
+              )}
             </p>
           </div>
 
@@ -72,6 +100,7 @@ export default function EvaluationResult({ evaluation }: EvaluationResultProps)
             </h3>
             <div className="grid grid-cols-1 md:grid-cols-2 gap-4">
               {dimensions.map((dim) => {
+                const received = dim.key in evaluation.scores
                 const score = evaluation.scores[dim.key] || 0
                 const percentage = (score / 10) * 100
 
@@ -85,7 +114,9 @@ export default function EvaluationResult({ evaluation }: EvaluationResultProps)
                         {dim.label}
                       </span>
                       <span className="text-lg font-bold text-gray-900 dark:text-white">
-                        {score}
+                        {received || !streaming ? score : (
+                          <span className="text-gray-400 dark:text-gray-500 animate-pulse">-</span>
+                        )}
                       </span>
                     </div>
                     <div className="w-full bg-gray-200 dark:bg-gray-600 rounded-full h-2.5">
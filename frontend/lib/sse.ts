@@ -0,0 +1,52 @@
+export interface SSEEvent {
+  event: string
+  data: string
+}
+
+/**
+ * fetch 응답 본문을 Server-Sent Events 프레임 단위로 읽습니다.
+ * (EventSource는 GET만 지원하므로 POST 스트리밍 응답은 직접 파싱)
+ */
+export async function* readSSE(response: Response): AsyncGenerator<SSEEvent> {
+  if (!response.body) {
+    return
+  }
+
+  const reader = response.body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+
+  try {
+    while (true) {
+      const { done, value } = await reader.read()
+      buffer += decoder.decode(value, { stream: !done })
+
+      // 프레임은 빈 줄로 구분
+      let boundary = buffer.indexOf('\n\n')
+      while (boundary >= 0) {
+        const frame = buffer.slice(0, boundary)
+        buffer = buffer.slice(boundary + 2)
+        boundary = buffer.indexOf('\n\n')
+
+        let event = 'message'
+        const data: string[] = []
+        for (const line of frame.split('\n')) {
+          if (line.startsWith('event:')) {
+            event = line.slice(6).trim()
+          } else if (line.startsWith('data:')) {
+            data.push(line.slice(5).replace(/^ /, ''))
+          }
+        }
+        if (data.length > 0) {
+          yield { event, data: data.join('\n') }
+        }
+      }
+
+      if (done) {
+        return
+      }
+    }
+  } finally {
+    reader.releaseLock()
+  }
+}